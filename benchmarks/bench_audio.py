@@ -0,0 +1,124 @@
+# benchmarks/bench_audio.py
+# Decoding, proxy building, waveform/spectrogram drawing, spectrogram
+# computation and review time-stretching on synthetic recordings.
+
+import numpy as np
+import pyqtgraph as pg
+import pytest
+
+from code.audio import proxy
+from code.audio.activity import ActivityBuilder
+from code.audio.decode import load_mono
+from code.audio.envelope import EnvelopeBuilder
+from code.audio.spectrogram import SCALES, SpecParams, compute_spectrogram
+from code.audio.stretch import wsola
+from code.ui.widgets.viewport import SpectrogramView, WaveformView
+
+from conftest import AUDIO_CASES, make_wav
+
+ROUNDS = 3  # one pass over a long file is already seconds
+
+
+@pytest.fixture(params=AUDIO_CASES)
+def wav(request, bench_data):
+    return make_wav(bench_data, *request.param)
+
+
+@pytest.fixture
+def decoded(wav):
+    return load_mono(wav)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["float32", "int16"])
+def bench_decode(benchmark, wav, compact):
+    data, sr = benchmark.pedantic(load_mono, args=(wav, compact), rounds=ROUNDS, iterations=1)
+    assert data.dtype == (np.int16 if compact else np.float32) and sr > 0
+    benchmark.extra_info["mbytes"] = round(data.nbytes / 2 ** 20, 1)
+
+
+@pytest.mark.parametrize("zoom", ["all", "10s"])
+def bench_waveform_draw(benchmark, qapp, decoded, zoom):
+    """Draw the range in view the way the editor does (one viewport render) and paint one frame."""
+    data, sr = decoded
+    env = EnvelopeBuilder(1)
+    env.push(data[:, None])
+    view = WaveformView(plot := pg.PlotWidget())
+    view.set_source(data, sr, env.finish(sr))
+    plot.resize(1400, 220)
+    plot.show()
+    t0, t1 = (0.0, len(data) / sr) if zoom == "all" else (len(data) / sr / 2, len(data) / sr / 2 + 10.0)
+    plot.setXRange(t0, t1, padding=0)
+
+    def draw():
+        view.render(t0, t1, 1400)
+        plot.grab()
+
+    benchmark.pedantic(draw, rounds=ROUNDS, iterations=1)
+    plot.close()
+
+
+def bench_spectrogram_view(benchmark, qapp, decoded):
+    """Redraw the whole-file spectrogram image from the pooled levels (one pan/zoom step)."""
+    data, sr = decoded
+    spec = compute_spectrogram(data, sr, SpecParams(n_fft=1024, hop=512))
+    plot = pg.PlotWidget()
+    image = pg.ImageItem()
+    plot.addItem(image)
+    view = SpectrogramView(image)
+    view.set_source(spec, sr / 2)
+    plot.resize(1400, 220)
+    plot.show()
+    duration = len(spec.db) * spec.dt
+    view.render(0.0, duration, 1400)  # pooled levels are built on first use
+
+    def draw():
+        view.render(0.0, duration, 1400)
+        plot.grab()
+
+    benchmark.pedantic(draw, rounds=ROUNDS, iterations=1)
+    plot.close()
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def bench_spectrogram(benchmark, decoded, scale):
+    data, sr = decoded
+    params = SpecParams(n_fft=1024, hop=512, scale=scale)
+    spec = benchmark.pedantic(compute_spectrogram, args=(data, sr, params), rounds=ROUNDS, iterations=1)
+    assert spec.db.dtype == np.float32 and spec.db.shape[1] == len(spec.freqs) and spec.dt > 0
+
+
+def bench_proxy_build(benchmark, wav, tmp_path, monkeypatch):
+    """Stream a recording into its mono 22.05 kHz analysis proxy."""
+    monkeypatch.setattr(proxy, "PROXY_DIR", tmp_path)
+
+    def fresh():
+        for f in tmp_path.glob("*.wav"):
+            f.unlink()
+
+    out = benchmark.pedantic(proxy.build_proxy, args=(wav,), setup=fresh, rounds=ROUNDS, iterations=1)
+    assert out.exists()
+
+
+def bench_review_stretch(benchmark, decoded):
+    """Render the whole recording at 2x through WSOLA (review playback)."""
+    data, sr = decoded
+
+    def render():
+        return sum(len(chunk) for chunk, _, _ in wsola(data, sr, 2.0, 0, len(data)))
+
+    frames = benchmark.pedantic(render, rounds=ROUNDS, iterations=1)
+    assert abs(frames - len(data) / 2) < sr
+
+
+def bench_activity_index(benchmark, decoded):
+    """Level + spectral-flux index of the whole recording (jump-to-event navigation)."""
+    data, sr = decoded
+
+    def build():
+        act = ActivityBuilder(sr)
+        for i in range(0, len(data), 65536):
+            act.push(data[i:i + 65536])
+        return act.finish()
+
+    act = benchmark.pedantic(build, rounds=ROUNDS, iterations=1)
+    assert abs(len(act.frames) * act.hop_s - len(data) / sr) < 0.02
@@ -0,0 +1,70 @@
+# benchmarks/bench_csv.py
+# Metadata / label CSV loading through the schema registry, and the
+# append / update paths used by the New Sample form.
+
+import shutil
+
+import pytest
+
+from code.core.csv_writer import get_writer
+from code.core.schema import LABELS, META, META_LIST_COLUMNS
+from code.ui.pages.new_sample import append_meta_row, update_meta_row
+
+from conftest import LABEL_ROWS_PER_FILE, ROW_COUNTS, make_label_frame, make_meta_csv, make_meta_frame
+
+ROW = {
+    "sample_id": "20991231-235959-bench0", "date": "2099-12-31", "time": "23:59:59",
+    "temperature_c": "21.5", "pressure_kpa": "101.3", "latitude": "35.7", "longitude": "51.4",
+    "count": "3", "sample_name": "bench", "labels_csv": "", "created_at": "2099-12-31T23:59:59",
+}
+
+
+@pytest.fixture(scope="module", params=ROW_COUNTS)
+def meta_csv(request, bench_data):
+    return make_meta_csv(bench_data, request.param)
+
+
+@pytest.fixture(scope="module", params=ROW_COUNTS)
+def meta_frame(request):
+    return make_meta_frame(request.param)
+
+
+# ----- loading -----
+def bench_meta_read_typed(benchmark, meta_csv):
+    df = benchmark(META.read, meta_csv)
+    assert len(df.columns) == len(META.columns)
+
+
+def bench_meta_read_list_columns(benchmark, meta_csv):
+    """The sample list views (Edit hub, Reports) read only six text columns."""
+    df = benchmark(META.read_text, meta_csv, META_LIST_COLUMNS)
+    assert list(df.columns) == META_LIST_COLUMNS
+
+
+def bench_meta_format(benchmark, meta_csv):
+    typed = META.read(meta_csv)
+    benchmark(META.format, typed)
+
+
+def bench_labels_read(benchmark, tmp_path):
+    path = tmp_path / "labels.csv"
+    make_label_frame(LABEL_ROWS_PER_FILE, ["s"]).to_csv(path, index=False, encoding="utf-8")
+    benchmark(LABELS.read_text, path)
+
+
+# ----- append / update -----
+def bench_meta_append_row(benchmark, meta_frame):
+    benchmark.pedantic(append_meta_row, setup=lambda: ((meta_frame.copy(), ROW), {}), rounds=20)
+
+
+def bench_meta_update_row(benchmark, meta_frame):
+    sid = meta_frame["sample_id"].iloc[len(meta_frame) // 2]
+    benchmark.pedantic(update_meta_row, setup=lambda: ((meta_frame.copy(), sid, ROW), {}), rounds=20)
+
+
+def bench_meta_append_saved(benchmark, qapp, meta_csv, tmp_path):
+    """Append through the CSV writer: read, append, atomic rewrite."""
+    path = tmp_path / "samples_meta.csv"
+    shutil.copyfile(meta_csv, path)
+    writer = get_writer()
+    benchmark.pedantic(lambda: writer.update(path, lambda df: append_meta_row(df, ROW)).result(), rounds=5)
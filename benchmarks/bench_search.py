@@ -0,0 +1,72 @@
+# benchmarks/bench_search.py
+# Search filters: segment search over the SQLite label index, the Edit hub's
+# id/name filter and the map's radius query.
+
+import pytest
+
+from code.core.geo_index import GeoIndex
+from code.core.label_index import LabelIndex, SegmentFilter
+from code.core.schema import META, META_LIST_COLUMNS
+
+from conftest import LABEL_ROWS_PER_FILE, ROW_COUNTS, make_labels_dir, make_meta_csv
+
+FILTERS = {
+    "all": SegmentFilter(),
+    "class": SegmentFilter(label_class="Frog"),
+    "class+duration": SegmentFilter(label_class="Frog", min_duration=2.0, max_duration=4.0),
+    "date-range": SegmentFilter(date_from="2024-03-01", date_to="2024-03-31"),
+    "notes": SegmentFilter(notes="faint"),
+    "temperature+geo": SegmentFilter(min_temperature=20.0, max_temperature=25.0,
+                                     min_latitude=35.0, max_latitude=35.5),
+}
+
+
+@pytest.fixture(scope="module", params=ROW_COUNTS)
+def label_index(request, bench_data):
+    rows = request.param
+    index = LabelIndex(bench_data / f"labels_index_{rows}.sqlite", make_labels_dir(bench_data, rows))
+    index.reconcile()
+    index.sync_meta(make_meta_csv(bench_data, max(rows // LABEL_ROWS_PER_FILE, 1)))
+    return index
+
+
+@pytest.fixture(scope="module", params=ROW_COUNTS)
+def meta_csv(request, bench_data):
+    return make_meta_csv(bench_data, request.param)
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def bench_segment_first_page(benchmark, label_index, name):
+    benchmark(label_index.search, FILTERS[name])
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def bench_segment_deep_page(benchmark, label_index, name):
+    """A page far down the results costs the same as the first (keyset paging)."""
+    f = FILTERS[name]
+    after = None
+    for _ in range(10):
+        page = label_index.search(f, after)
+        if not page:
+            break
+        after = page[-1]
+    benchmark(label_index.search, f, after)
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def bench_segment_count(benchmark, label_index, name):
+    benchmark(label_index.count_matches, FILTERS[name], 1_000_000)
+
+
+def bench_edit_hub_filter(benchmark, qapp, meta_csv):
+    from code.ui.pages.edit_hub import EditHubPage
+    page = EditHubPage()
+    page._df = META.read_text(meta_csv, META_LIST_COLUMNS)
+    page.search.blockSignals(True)
+    page.search.setText("site-a")
+    benchmark(page._apply_filter)
+
+
+def bench_geo_radius(benchmark, meta_csv):
+    geo = GeoIndex.from_meta_csv(meta_csv)
+    benchmark(geo.radius, 35.0, 51.5, 5.0)
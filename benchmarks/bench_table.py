@@ -0,0 +1,42 @@
+# benchmarks/bench_table.py
+# PandasModel hot paths: painting a screenful of cells and removing rows.
+
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt
+
+from code.ui.widgets.pandas_model import PandasModel
+
+from conftest import ROW_COUNTS, make_meta_frame
+
+VISIBLE_ROWS = 40  # roughly one screen of a QTableView
+
+
+@pytest.fixture(scope="module", params=ROW_COUNTS)
+def meta_frame(request):
+    return make_meta_frame(request.param)
+
+
+def bench_model_data(benchmark, qapp, meta_frame):
+    """DisplayRole + alignment for every visible cell near the end of the table."""
+    model = PandasModel(meta_frame)
+    first = max(len(meta_frame) - VISIBLE_ROWS, 0)
+    cells = [model.index(r, c) for r in range(first, len(meta_frame)) for c in range(model.columnCount())]
+
+    def paint():
+        for ix in cells:
+            model.data(ix, Qt.DisplayRole)
+            model.data(ix, Qt.TextAlignmentRole)
+
+    benchmark(paint)
+
+
+@pytest.mark.parametrize("n_remove", [1, 100])
+def bench_model_remove_rows(benchmark, qapp, meta_frame, n_remove):
+    """Delete a scattered selection (as Delete Selected does)."""
+    rows = np.random.default_rng(0).choice(len(meta_frame), n_remove, replace=False).tolist()
+
+    def setup():
+        return (PandasModel(meta_frame.copy()), rows), {}
+
+    benchmark.pedantic(lambda model, rows: model.remove_rows(rows), setup=setup, rounds=10)
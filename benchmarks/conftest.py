@@ -0,0 +1,148 @@
+# benchmarks/conftest.py
+# Shared fixtures for the benchmark suite: a headless QApplication and
+# synthetic recordings / CSVs generated once per session.
+#
+# Sizes above a few minutes / 100k rows only run with BENCH_LARGE=1; set
+# BENCH_DATA_DIR to keep the generated files between runs.
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import soundfile as sf
+
+from code.core.csv_writer import write_csv_atomic
+from code.core.schema import LABEL_COLUMNS, META_COLUMNS
+
+LARGE = os.environ.get("BENCH_LARGE") == "1"
+
+# (seconds, sample rate, channels)
+AUDIO_CASES = [
+    pytest.param((60, 44_100, 1), id="1min-44k-mono"),
+    pytest.param((60, 48_000, 2), id="1min-48k-stereo"),
+    pytest.param((600, 22_050, 1), id="10min-22k-mono"),
+    pytest.param((600, 96_000, 2), id="10min-96k-stereo"),
+    pytest.param((3600, 48_000, 2), id="1h-48k-stereo", marks=pytest.mark.large),
+    pytest.param((4 * 3600, 44_100, 1), id="4h-44k-mono", marks=pytest.mark.large),
+]
+
+ROW_COUNTS = [
+    pytest.param(1_000, id="1k"),
+    pytest.param(100_000, id="100k"),
+    pytest.param(1_000_000, id="1M", marks=pytest.mark.large),
+]
+
+LABEL_ROWS_PER_FILE = 500
+CLASSES = ["Bird", "Frog", "Insect", "Rain", "Wind", "Voice", "Engine", "Dog"]
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "large: long recordings / 1M-row tables (needs BENCH_LARGE=1)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if LARGE:
+        return
+    skip = pytest.mark.skip(reason="set BENCH_LARGE=1 to run large cases")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope="session")
+def bench_data(tmp_path_factory) -> Path:
+    root = os.environ.get("BENCH_DATA_DIR")
+    if root:
+        path = Path(root)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    return tmp_path_factory.mktemp("bench_data")
+
+
+# ----- generators -----
+def make_wav(root: Path, seconds: int, sr: int, channels: int) -> Path:
+    """16-bit PCM WAV of a slow chirp plus noise, written in blocks."""
+    path = root / f"synth_{seconds}s_{sr}hz_{channels}ch.wav"
+    if path.exists():
+        return path
+    rng = np.random.default_rng(seconds + sr + channels)
+    block = sr * 10
+    tmp = path.with_suffix(".part")
+    with sf.SoundFile(str(tmp), "w", samplerate=sr, channels=channels, subtype="PCM_16", format="WAV") as f:
+        for start in range(0, seconds * sr, block):
+            n = min(block, seconds * sr - start)
+            t = (start + np.arange(n)) / sr
+            tone = 0.4 * np.sin(2 * np.pi * (200 + 50 * np.sin(t / 30)) * t)
+            noise = 0.05 * rng.standard_normal((n, channels))
+            f.write((tone[:, None] + noise).astype(np.float32))
+    tmp.replace(path)
+    return path
+
+
+def make_meta_frame(rows: int) -> pd.DataFrame:
+    """samples_meta.csv content as text, the way the writer keeps it."""
+    rng = np.random.default_rng(rows)
+    day = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 700, rows), unit="D")
+    secs = rng.integers(0, 86_400, rows)
+    df = pd.DataFrame({
+        "sample_id": [f"{d:%Y%m%d}-{i:07d}" for d, i in zip(day, range(rows))],
+        "date": day.strftime("%Y-%m-%d"),
+        "time": [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in secs],
+        "temperature_c": np.round(rng.normal(18, 6, rows), 2).astype(str),
+        "pressure_kpa": np.round(rng.normal(101.3, 1.2, rows), 2).astype(str),
+        "latitude": np.round(rng.uniform(34.0, 36.0, rows), 6).astype(str),
+        "longitude": np.round(rng.uniform(50.0, 53.0, rows), 6).astype(str),
+        "count": rng.integers(1, 20, rows).astype(str),
+        "sample_name": rng.choice(["temp", "site-A", "site-B", "river", "forest"], rows),
+        "labels_csv": "",
+        "created_at": day.strftime("%Y-%m-%dT10:00:00"),
+    })
+    return df[META_COLUMNS]
+
+
+def make_meta_csv(root: Path, rows: int) -> Path:
+    path = root / f"samples_meta_{rows}.csv"
+    if not path.exists():
+        write_csv_atomic(make_meta_frame(rows), path)
+    return path
+
+
+def make_label_frame(rows: int, sample_ids, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start = np.round(rng.uniform(0, 3600, rows), 3)
+    return pd.DataFrame({
+        "sample_id": rng.choice(np.asarray(sample_ids), rows),
+        "audio_path": "",
+        "start_s": start.astype(str),
+        "end_s": np.round(start + rng.exponential(1.5, rows), 3).astype(str),
+        "label_class": rng.choice(CLASSES, rows),
+        "notes": rng.choice(["", "", "", "overlap", "faint call", "check later"], rows),
+        "created_at": "2024-05-01T12:00:00",
+        "label_id": [f"{seed:08x}{i:024x}" for i in range(rows)],
+    })[LABEL_COLUMNS]
+
+
+def make_labels_dir(root: Path, rows: int) -> Path:
+    """A labels/ folder holding `rows` label rows over files of LABEL_ROWS_PER_FILE."""
+    path = root / f"labels_{rows}"
+    if path.exists():
+        return path
+    tmp = root / f"labels_{rows}.part"
+    tmp.mkdir(parents=True, exist_ok=True)
+    sample_ids = make_meta_frame(max(rows // LABEL_ROWS_PER_FILE, 1))["sample_id"]
+    for i, sid in enumerate(sample_ids):
+        n = min(LABEL_ROWS_PER_FILE, rows - i * LABEL_ROWS_PER_FILE)
+        make_label_frame(n, [sid], seed=i).to_csv(tmp / f"{sid}__synth.csv", index=False, encoding="utf-8")
+    tmp.rename(path)
+    return path
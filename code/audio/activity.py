@@ -0,0 +1,118 @@
+# code/audio/activity.py
+# Per-file activity index for navigation: frame level (RMS) and spectral flux
+# every ~10 ms, each quantized to uint8 on a dB scale. Built from the mono mix
+# in a streaming pass (the proxy build feeds it the same blocks) and cached
+# next to the proxy.
+
+from pathlib import Path
+
+import numpy as np
+
+from code.audio.stretch import MIN_GAP_S, PAD_S, SILENCE_DB
+
+HOP_S = 0.010
+DB_FLOOR = -80.0                       # uint8 0 .. 255 spans DB_FLOOR .. 0 dBFS
+_Q = 255.0 / -DB_FLOOR
+
+
+def _to_u8(power: np.ndarray) -> np.ndarray:
+    db = 10.0 * np.log10(np.maximum(power, 1e-12))
+    return np.clip(np.round((db - DB_FLOOR) * _Q), 0, 255).astype(np.uint8)
+
+
+class ActivityBuilder:
+    """Accumulates (level, flux) frames from mono float blocks of any length."""
+
+    def __init__(self, samplerate: int):
+        self.samplerate = samplerate
+        self.hop = max(int(round(samplerate * HOP_S)), 1)
+        self._win = np.hanning(self.hop).astype(np.float32)
+        self._rest = np.empty(0, dtype=np.float32)
+        self._prev_mag: np.ndarray | None = None
+        self._out: list[np.ndarray] = []
+
+    def push(self, mono: np.ndarray):
+        x = np.concatenate([self._rest, mono]) if len(self._rest) else mono
+        n = len(x) // self.hop
+        self._rest = x[n * self.hop:].astype(np.float32, copy=True)
+        if not n:
+            return
+        frames = x[:n * self.hop].reshape(n, self.hop)
+        level = _to_u8(np.einsum("ij,ij->i", frames, frames) / self.hop)
+        mag = np.abs(np.fft.rfft(frames * self._win, axis=1)).astype(np.float32)
+        prev = self._prev_mag if self._prev_mag is not None else mag[:1]
+        rise = np.maximum(np.diff(mag, axis=0, prepend=prev), 0.0)
+        flux = _to_u8(np.einsum("ij,ij->i", rise, rise) / (self.hop * self.hop))
+        self._prev_mag = mag[-1:]
+        self._out.append(np.stack([level, flux], axis=1))
+
+    def finish(self) -> "Activity":
+        if len(self._rest):
+            self.push(np.pad(self._rest, (0, self.hop - len(self._rest))))
+        frames = np.concatenate(self._out) if self._out else np.zeros((0, 2), dtype=np.uint8)
+        return Activity(frames, self.samplerate, self.hop)
+
+
+class Activity:
+    def __init__(self, frames: np.ndarray, samplerate: int, hop: int):
+        self.frames = frames          # uint8 (n, 2): level, flux
+        self.samplerate = samplerate
+        self.hop = hop
+
+    @property
+    def hop_s(self) -> float:
+        return self.hop / self.samplerate
+
+    @property
+    def nbytes(self) -> int:
+        return self.frames.nbytes
+
+    def score(self) -> np.ndarray:
+        """uint8 per frame: the louder of level and flux."""
+        return self.frames.max(axis=1)
+
+    def regions(self, threshold_db: float = SILENCE_DB) -> list[tuple[float, float]]:
+        """(start_s, end_s) of activity: frames at or above the threshold, padded and
+        joined like review playback's silence skipping."""
+        loud = np.flatnonzero(self.score() >= (threshold_db - DB_FLOOR) * _Q)
+        if not len(loud):
+            return []
+        breaks = np.flatnonzero(np.diff(loud) > 1)
+        starts = np.r_[loud[0], loud[breaks + 1]] * self.hop_s
+        ends = (np.r_[loud[breaks], loud[-1]] + 1) * self.hop_s
+        total = len(self.frames) * self.hop_s
+        out: list[tuple[float, float]] = []
+        for a, b in zip(np.maximum(starts - PAD_S, 0.0), np.minimum(ends + PAD_S, total)):
+            if out and a - out[-1][1] < MIN_GAP_S:
+                out[-1] = (out[-1][0], float(b))
+            else:
+                out.append((float(a), float(b)))
+        return out
+
+    def save(self, path: Path):
+        tmp = path.with_name(path.name + ".part.npz")
+        np.savez(tmp, frames=self.frames, samplerate=self.samplerate, hop=self.hop)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "Activity":
+        with np.load(path) as z:
+            return cls(z["frames"], int(z["samplerate"]), int(z["hop"]))
+
+
+def subtract_spans(regions: list[tuple[float, float]], spans: list[tuple[float, float]],
+                   min_len: float = 0.1) -> list[tuple[float, float]]:
+    """Parts of `regions` not covered by any of `spans` (e.g. labeled rows)."""
+    spans = sorted((min(a, b), max(a, b)) for a, b in spans)
+    out = []
+    for a, b in regions:
+        cur = a
+        for s, e in spans:
+            if e <= cur or s >= b:
+                continue
+            if s - cur >= min_len:
+                out.append((cur, s))
+            cur = max(cur, e)
+        if b - cur >= min_len:
+            out.append((cur, b))
+    return out
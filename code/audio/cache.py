@@ -0,0 +1,148 @@
+# code/audio/cache.py
+# In-memory LRU of recently drawn recordings: the decoded proxy samples,
+# per-channel envelopes and proxies, and every spectrogram computed for them.
+# Evicts by bytes held, so a couple of long multichannel files don't crowd out
+# more than the budget, and switching back to a recent file reads no audio.
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from code.audio.activity import Activity
+from code.audio.decode import AudioInfo, load_mono, probe
+from code.audio.envelope import EnvelopeBuilder, EnvelopePyramid
+from code.audio.proxy import ready_activity, ready_envelopes
+from code.audio.spectrogram import SpecParams, Spectrogram, compute_spectrogram
+from code.audio.stretch import short_term_energy_db
+
+ENV_VAR = "AUDIO_LABELER_CACHE_MB"
+BUDGET_MB = 1024
+
+
+def recording_key(src: Path) -> tuple[str, int, int]:
+    """Identity of this version of a file (changes when it is rewritten)."""
+    src = Path(src).resolve()
+    st = src.stat()
+    return str(src), st.st_size, st.st_mtime_ns
+
+
+@dataclass
+class DecodedRecording:
+    key: tuple[str, int, int]
+    info: AudioInfo                       # of the source file
+    samples: np.ndarray                   # mono drawing samples (the proxy; int16 when 16-bit PCM)
+    samplerate: int
+    envelopes: EnvelopePyramid | None = None
+    channels: dict[int, np.ndarray] = field(default_factory=dict)   # single-channel proxies (int16)
+    spectrograms: dict[tuple[int | None, SpecParams], Spectrogram] = field(default_factory=dict)
+    energy_db: np.ndarray | None = None   # short-term energy of the mix (review playback)
+    activity: Activity | None = None      # navigation index (None until built)
+    mix_env: EnvelopePyramid | None = None   # min/max pyramid of `samples` (waveform view, minimap)
+
+    @property
+    def nbytes(self) -> int:
+        n = self.samples.nbytes + sum(a.nbytes for a in self.channels.values())
+        n += self.energy_db.nbytes if self.energy_db is not None else 0
+        n += self.activity.nbytes if self.activity is not None else 0
+        n += sum(s.nbytes for s in self.spectrograms.values())
+        for env in (self.envelopes, self.mix_env):
+            if env is not None:
+                n += sum(lv.nbytes for lv in env.levels)
+        return n
+
+    def energy(self) -> np.ndarray:
+        if self.energy_db is None:
+            self.energy_db = short_term_energy_db(self.samples, self.samplerate)
+        return self.energy_db
+
+    def mix_envelope(self) -> EnvelopePyramid:
+        """Envelope pyramid of the drawn samples, built once."""
+        if self.mix_env is None:
+            builder = EnvelopeBuilder(1)
+            builder.push(self.samples[:, None])
+            self.mix_env = builder.finish(self.samplerate)
+        return self.mix_env
+
+    def overview(self) -> tuple[np.ndarray, float]:
+        """((bins, 2) min/max, seconds per bin) of the whole recording at the coarsest level."""
+        return self.mix_envelope().overview()
+
+    def spectrogram(self, channel: int | None, params: SpecParams) -> Spectrogram:
+        """Spectrogram of the mix (None) or of a loaded channel, computed once per params."""
+        spec = self.spectrograms.get((channel, params))
+        if spec is None:
+            data = self.samples if channel is None else self.channels[channel]
+            spec = compute_spectrogram(data, self.samplerate, params)
+            self.spectrograms[(channel, params)] = spec
+        return spec
+
+
+def load_recording(src: Path, proxy: Path, params: SpecParams | None = None) -> DecodedRecording:
+    """Decode what the editor draws for `src` from its ready proxy; with `params`
+    also compute the mix spectrogram, energy and overview up front. Safe to call off the GUI thread."""
+    info = probe(src)
+    samples, sr = load_mono(proxy, compact=True)
+    env = ready_envelopes(src) if info.channels > 1 else None
+    rec = DecodedRecording(recording_key(src), info, samples, sr, env, activity=ready_activity(src))
+    if params is not None:
+        rec.spectrogram(None, params)
+        rec.energy()
+        rec.overview()
+    return rec
+
+
+class RecordingCache:
+    """LRU of DecodedRecording bounded by total bytes. The most recently used
+    entry is never evicted, even if it alone exceeds the budget."""
+
+    def __init__(self, budget_bytes: int | None = None):
+        if budget_bytes is None:
+            try:
+                budget_bytes = int(os.environ.get(ENV_VAR, BUDGET_MB)) * 1024 * 1024
+            except ValueError:
+                budget_bytes = BUDGET_MB * 1024 * 1024
+        self.budget = budget_bytes
+        self._items: OrderedDict[tuple, DecodedRecording] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(rec.nbytes for rec in self._items.values())
+
+    def get(self, key: tuple) -> DecodedRecording | None:
+        rec = self._items.get(key)
+        if rec is not None:
+            self._items.move_to_end(key)
+        return rec
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._items
+
+    def keys(self) -> set[tuple]:
+        return set(self._items)
+
+    def put(self, rec: DecodedRecording, pinned: tuple | None = None):
+        """Insert as most recently used; with `pinned` (e.g. the recording on screen)
+        that entry stays the most recent one and `rec` goes right behind it."""
+        for key in [k for k in self._items if k[0] == rec.key[0] and k != rec.key]:
+            del self._items[key]  # an earlier version of the same file
+        self._items[rec.key] = rec
+        self._items.move_to_end(rec.key)
+        if pinned is not None and pinned in self._items and pinned != rec.key:
+            self._items.move_to_end(pinned)
+        self.trim()
+
+    def trim(self):
+        """Evict least recently used entries until within budget (call after an entry grew)."""
+        total = self.nbytes
+        while total > self.budget and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            total -= old.nbytes
+
+    def clear(self):
+        self._items.clear()
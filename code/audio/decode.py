@@ -0,0 +1,152 @@
+# code/audio/decode.py
+# Streaming audio decoding. WAV/FLAC/OGG (and MP3 with libsndfile >= 1.1) are
+# read block by block through soundfile; anything soundfile can't open is
+# piped through ffmpeg as raw float32. Callers get fixed-size float32 blocks,
+# so a long recording never has to exist in memory (or on disk) as a WAV.
+# Buffers kept in memory can stay 16-bit PCM (load_mono(compact=True)); readers
+# scale just the slice they use with to_float.
+
+import json
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import soundfile as sf
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".oga", ".mp3")
+AUDIO_FILTER = "Audio files (" + " ".join(f"*{e}" for e in AUDIO_EXTENSIONS) + ");;All files (*)"
+
+BLOCK_FRAMES = 1 << 18  # ~6 s at 44.1 kHz per decoded block
+INT16_SUBTYPES = ("PCM_16", "PCM_S8", "PCM_U8")  # read losslessly as int16
+PCM_SCALE = np.float32(1.0 / 32768.0)            # int16 -> [-1, 1), as soundfile scales it
+
+
+@dataclass(frozen=True)
+class AudioInfo:
+    samplerate: int
+    channels: int
+    frames: int          # exact for PCM/FLAC; estimated from the duration for ffmpeg input
+    backend: str         # "soundfile" or "ffmpeg"
+    subtype: str = ""    # soundfile sample format, e.g. "PCM_16" ("" for ffmpeg input)
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate if self.samplerate else 0.0
+
+
+def _ffmpeg() -> str:
+    exe = shutil.which("ffmpeg") or shutil.which("avconv")
+    if exe is None:
+        raise RuntimeError("This format needs ffmpeg: install it and make sure it is on PATH.")
+    return exe
+
+
+def _probe_ffmpeg(path: Path) -> AudioInfo:
+    ffprobe = shutil.which("ffprobe") or shutil.which("avprobe")
+    if ffprobe is None:
+        raise RuntimeError("This format needs ffprobe (shipped with ffmpeg) on PATH.")
+    out = subprocess.run(
+        [ffprobe, "-v", "error", "-select_streams", "a:0", "-show_entries",
+         "stream=sample_rate,channels,duration:format=duration", "-of", "json", str(path)],
+        capture_output=True, check=True, text=True,
+    ).stdout
+    meta = json.loads(out)
+    stream = (meta.get("streams") or [{}])[0]
+    if "sample_rate" not in stream:
+        raise RuntimeError(f"No audio stream in {Path(path).name}")
+    sr = int(stream["sample_rate"])
+    duration = float(stream.get("duration") or meta.get("format", {}).get("duration") or 0.0)
+    return AudioInfo(sr, int(stream.get("channels", 1)), int(round(duration * sr)), "ffmpeg")
+
+
+def probe(path: Path) -> AudioInfo:
+    """Sample rate / channels / length without decoding."""
+    if not Path(path).is_file():
+        raise FileNotFoundError(path)
+    try:
+        info = sf.info(str(path))
+        return AudioInfo(int(info.samplerate), int(info.channels), int(info.frames), "soundfile", info.subtype)
+    except (sf.LibsndfileError, RuntimeError):
+        return _probe_ffmpeg(path)
+
+
+def iter_blocks(path: Path, block_frames: int = BLOCK_FRAMES, info: AudioInfo | None = None,
+                dtype: str = "float32") -> Iterator[np.ndarray]:
+    """Yield blocks shaped (frames, channels): float32 scaled to [-1, 1], or raw
+    int16 with dtype="int16" (soundfile input only)."""
+    info = info or probe(path)
+    if info.backend == "soundfile":
+        with sf.SoundFile(str(path)) as f:
+            while True:
+                block = f.read(block_frames, dtype=dtype, always_2d=True)
+                if not len(block):
+                    return
+                yield block
+    if dtype != "float32":
+        raise ValueError(f"ffmpeg input is decoded as float32, not {dtype}")
+    cmd = [_ffmpeg(), "-v", "error", "-nostdin", "-i", str(path), "-vn",
+           "-f", "f32le", "-acodec", "pcm_f32le", "-ac", str(info.channels), "-ar", str(info.samplerate), "-"]
+    block_bytes = block_frames * info.channels * 4
+    # stderr goes to a file: a pipe nobody reads until EOF could fill up and stall ffmpeg
+    with tempfile.TemporaryFile() as err_file, \
+            subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_file) as proc:
+        at_eof = False
+        try:
+            pending = b""
+            while True:
+                chunk = proc.stdout.read(block_bytes - len(pending))
+                if not chunk:
+                    break
+                pending += chunk
+                if len(pending) == block_bytes:
+                    yield np.frombuffer(pending, dtype=np.float32).reshape(-1, info.channels)
+                    pending = b""
+            at_eof = True
+        finally:
+            if not at_eof:
+                proc.kill()  # the caller stopped early
+        # a decode that died midway must not pass for a short file (e.g. a truncated proxy)
+        if proc.wait() != 0:
+            err_file.seek(0)
+            err = err_file.read().decode("utf-8", "replace").strip()
+            raise RuntimeError(f"ffmpeg could not decode {Path(path).name}: {err or proc.returncode}")
+        whole = len(pending) // (4 * info.channels) * (4 * info.channels)
+        if whole:
+            yield np.frombuffer(pending[:whole], dtype=np.float32).reshape(-1, info.channels)
+
+
+def load_mono(path: Path, compact: bool = False) -> tuple[np.ndarray, int]:
+    """Decode an audio file to (mono float32 samples in [-1, 1], sample rate).
+
+    Channels are mixed down block by block, so peak memory is the mono result
+    plus one block, whatever the format or channel count. With `compact`,
+    16-bit (or narrower) PCM stays int16, half the memory; see to_float.
+    """
+    info = probe(path)
+    dtype = "int16" if compact and info.backend == "soundfile" and info.subtype in INT16_SUBTYPES else "float32"
+    out = np.empty(max(info.frames, 0), dtype=dtype)
+    n = 0
+    for block in iter_blocks(path, info=info, dtype=dtype):
+        if block.shape[1] == 1:
+            mono = block[:, 0]
+        elif dtype == "int16":
+            mono = np.round(block.mean(axis=1, dtype=np.float32))
+        else:
+            mono = block.mean(axis=1, dtype=np.float32)
+        if n + len(mono) > len(out):  # estimated length was short (ffmpeg input)
+            out = np.resize(out, max(n + len(mono), int(len(out) * 1.25)))
+        out[n:n + len(mono)] = mono
+        n += len(mono)
+    return out[:n] if n < len(out) else out, info.samplerate
+
+
+def to_float(samples: np.ndarray) -> np.ndarray:
+    """float32 in [-1, 1] from int16 PCM (scaled) or float samples (as they are).
+    Meant for slices: converting a whole compact buffer defeats keeping it int16."""
+    if samples.dtype == np.int16:
+        return samples.astype(np.float32) * PCM_SCALE
+    return np.asarray(samples, dtype=np.float32)
@@ -0,0 +1,130 @@
+# code/audio/envelope.py
+# Min/max envelope pyramids for every channel of a recording, built in one
+# streaming pass over interleaved blocks. Level 0 holds one (min, max) pair
+# per BASE_BIN frames; each further level merges FACTOR bins of the one below,
+# so any zoom can be drawn from about one bin per pixel.
+
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+BASE_BIN = 256      # source frames per level-0 bin (~5 ms at 48 kHz)
+FACTOR = 4          # bins merged per level
+MIN_BINS = 1024     # no level coarser than this
+_SCALE = 32767.0    # envelopes are stored as int16, like PCM
+
+
+class EnvelopeBuilder:
+    """Accumulates level-0 bins from (frames, channels) blocks of any length:
+    float in [-1, 1], or int16 PCM (kept as is; one feed should not mix the two)."""
+
+    def __init__(self, channels: int):
+        self.channels = channels
+        self._rest = np.empty((0, channels), dtype=np.float32)
+        self._bins: list[np.ndarray] = []  # each (n, channels, 2) int16
+
+    def push(self, block: np.ndarray):
+        if len(self._rest):
+            block = np.concatenate([self._rest, block])
+        whole = len(block) // BASE_BIN * BASE_BIN
+        if whole:
+            self._bins.append(_minmax(block[:whole].reshape(-1, BASE_BIN, self.channels)))
+        self._rest = block[whole:].copy()
+
+    def finish(self, samplerate: int) -> "EnvelopePyramid":
+        if len(self._rest):
+            self._bins.append(_minmax(self._rest[None]))
+            self._rest = self._rest[:0]
+        base = np.concatenate(self._bins) if self._bins else np.zeros((0, self.channels, 2), dtype=np.int16)
+        self._bins = []
+        levels = [base]
+        while len(levels[-1]) > MIN_BINS * FACTOR:
+            levels.append(_merge(levels[-1]))
+        return EnvelopePyramid(levels, samplerate)
+
+
+def _minmax(frames: np.ndarray) -> np.ndarray:
+    """(n, bin, channels) samples -> (n, channels, 2) int16 min/max."""
+    env = np.stack([frames.min(axis=1), frames.max(axis=1)], axis=-1)
+    if env.dtype == np.int16:
+        return env  # PCM is already on the envelope scale (to within one step)
+    return np.round(np.clip(env, -1.0, 1.0) * _SCALE).astype(np.int16)
+
+
+def _merge(level: np.ndarray) -> np.ndarray:
+    n = -(-len(level) // FACTOR)
+    pad = n * FACTOR - len(level)
+    if pad:
+        level = np.concatenate([level, np.repeat(level[-1:], pad, axis=0)])
+    grouped = level.reshape(n, FACTOR, *level.shape[1:])
+    return np.stack([grouped[..., 0].min(axis=1), grouped[..., 1].max(axis=1)], axis=-1)
+
+
+class EnvelopePyramid:
+    def __init__(self, levels: list[np.ndarray], samplerate: int):
+        self.levels = levels
+        self.samplerate = samplerate
+
+    @property
+    def channels(self) -> int:
+        return self.levels[0].shape[1]
+
+    @property
+    def duration(self) -> float:
+        return len(self.levels[0]) * BASE_BIN / self.samplerate
+
+    def bin_frames(self, level: int) -> int:
+        return BASE_BIN * FACTOR ** level
+
+    def pick_level(self, frames_per_pixel: float) -> int:
+        """Coarsest level that still has at least one bin per pixel."""
+        level = 0
+        while level + 1 < len(self.levels) and self.bin_frames(level + 1) <= frames_per_pixel:
+            level += 1
+        return level
+
+    def overview(self) -> tuple[np.ndarray, float]:
+        """Coarsest level with all channels merged: ((bins, 2) float min/max, seconds per bin)."""
+        top = self.levels[-1]
+        env = np.stack([top[..., 0].min(axis=1), top[..., 1].max(axis=1)], axis=-1)
+        return env.astype(np.float32) / _SCALE, self.bin_frames(len(self.levels) - 1) / self.samplerate
+
+    def window(self, channel: int, t0: float, t1: float, pixels: int) -> tuple[np.ndarray, np.ndarray]:
+        """(x seconds, y) for a vertical min-max segment per bin in [t0, t1];
+        draw with connect="pairs"."""
+        level = self.pick_level((t1 - t0) * self.samplerate / max(pixels, 1))
+        size = self.bin_frames(level)
+        data = self.levels[level]
+        i0 = max(int(t0 * self.samplerate // size), 0)
+        i1 = min(int(t1 * self.samplerate // size) + 2, len(data))
+        if i1 <= i0:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        env = data[i0:i1, channel].astype(np.float32) / _SCALE
+        x = (np.arange(i0, i1, dtype=np.float64) + 0.5) * size / self.samplerate
+        return np.repeat(x, 2), env.ravel()  # x stays float64: float32 is ~2 ms coarse at 6 h
+
+    def save(self, path: Path):
+        tmp = path.with_name(path.name + ".part.npz")
+        np.savez(tmp, samplerate=self.samplerate, **{f"level{i}": lv for i, lv in enumerate(self.levels)})
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "EnvelopePyramid":
+        with np.load(path) as z:
+            n = sum(1 for k in z.files if k.startswith("level"))
+            return cls([z[f"level{i}"] for i in range(n)], int(z["samplerate"]))
+
+
+def read_frames(path: Path, t0: float, t1: float) -> tuple[np.ndarray, np.ndarray]:
+    """(x seconds, (frames, channels) samples) in [t0, t1], for zoom levels finer
+    than a bin. Only for formats soundfile can seek in."""
+    with sf.SoundFile(str(path)) as f:
+        sr = f.samplerate
+        start = max(int(t0 * sr), 0)
+        stop = min(int(t1 * sr) + 2, f.frames)
+        if stop <= start:
+            return np.empty(0), np.empty((0, f.channels), dtype=np.float32)
+        f.seek(start)
+        y = f.read(stop - start, dtype="float32", always_2d=True)
+    return np.arange(start, start + len(y)) / sr, y  # float64: sample-exact however long the file
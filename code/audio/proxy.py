@@ -0,0 +1,240 @@
+# code/audio/proxy.py
+# Analysis proxies: a compact mono 22.05 kHz int16 WAV per recording, made
+# once (in the background) by streaming the source through a polyphase
+# resampler. Waveform and spectrogram are drawn from the proxy; anything that
+# needs exact samples (playback, exports) keeps using the original file.
+# Multichannel sources also get per-channel envelope pyramids from the same
+# pass, and single-channel proxies on demand (per-channel spectrograms). The
+# activity index (code.audio.activity) is made in that pass too.
+
+import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import ceil, gcd
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+
+from code.audio.activity import Activity, ActivityBuilder
+from code.audio.decode import AudioInfo, iter_blocks, probe
+from code.audio.envelope import EnvelopeBuilder, EnvelopePyramid
+from code.core.instrument import span
+
+DATA_DIR = Path.cwd() / "data"
+PROXY_DIR = DATA_DIR / "proxies"
+
+PROXY_SR = 22_050
+STEP = 1 << 18  # input samples resampled per pass (rounded to the decimation factor)
+
+
+def needs_proxy(info: AudioInfo) -> bool:
+    """Sources that are already small mono PCM are drawn directly."""
+    return info.samplerate > PROXY_SR or info.channels > 1 or info.backend != "soundfile"
+
+
+def _source_key(src: Path) -> tuple[str, str]:
+    """(stable id of the path, id of this version of the file)."""
+    src = Path(src).resolve()
+    st = src.stat()
+    path_id = hashlib.sha1(str(src).encode("utf-8")).hexdigest()[:12]
+    version_id = hashlib.sha1(f"{st.st_size}:{st.st_mtime_ns}:{PROXY_SR}".encode()).hexdigest()[:8]
+    return path_id, version_id
+
+
+def _artifact(src: Path, suffix: str) -> Path:
+    path_id, version_id = _source_key(src)
+    return PROXY_DIR / f"{path_id}-{version_id}{suffix}"
+
+
+def proxy_path(src: Path, channel: int | None = None) -> Path:
+    """Mixdown proxy, or the proxy of one channel (0-based)."""
+    return _artifact(src, ".wav" if channel is None else f".ch{channel + 1}.wav")
+
+
+def envelope_path(src: Path) -> Path:
+    return _artifact(src, ".env.npz")
+
+
+def activity_path(src: Path) -> Path:
+    return _artifact(src, ".act.npz")
+
+
+def ready_proxy(src: Path, channel: int | None = None) -> Path | None:
+    """File to draw `src` from if no work is needed: the source itself or a built proxy
+    (for a multichannel mixdown, only once its envelopes exist too)."""
+    info = probe(src)
+    if not needs_proxy(info):
+        return Path(src)
+    path = proxy_path(src, channel)
+    if channel is None and info.channels > 1 and not envelope_path(src).exists():
+        return None
+    return path if path.exists() else None
+
+
+def ready_envelopes(src: Path) -> EnvelopePyramid | None:
+    """Per-channel envelopes of a multichannel source, if already built."""
+    path = envelope_path(src)
+    return EnvelopePyramid.load(path) if path.exists() else None
+
+
+def ready_activity(src: Path) -> Activity | None:
+    path = activity_path(src)
+    return Activity.load(path) if path.exists() else None
+
+
+def build_activity(src: Path) -> Activity:
+    """Activity index of `src` on its own pass (sources that need no proxy)."""
+    out = activity_path(src)
+    if out.exists():
+        return Activity.load(out)
+    info = probe(src)
+    act = ActivityBuilder(info.samplerate)
+    with span("audio.activity", file=Path(src).name):
+        for block in iter_blocks(src, info=info):
+            act.push(block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32))
+        result = act.finish()
+    PROXY_DIR.mkdir(parents=True, exist_ok=True)
+    result.save(out)
+    _prune_versions(out)
+    return result
+
+
+class _Resampler:
+    """Block-wise resample_poly that matches a single call over the whole signal.
+
+    Each pass resamples `step` samples plus enough context on both sides for
+    the FIR filter, then keeps only the outputs that belong to the step.
+    """
+
+    def __init__(self, sr_in: int, sr_out: int):
+        g = gcd(sr_in, sr_out)
+        self.up, self.down = sr_out // g, sr_in // g
+        half_len = 10 * max(self.up, self.down)               # resample_poly's default filter
+        self.pad = ceil((half_len / self.up + 1) / self.down) * self.down
+        self.step = max(STEP // self.down, 1) * self.down
+        self._buf = np.empty(0, dtype=np.float32)
+        self._pos = 0        # index in _buf of the next unprocessed sample
+        self._emitted = 0    # output samples produced so far
+
+    def push(self, x: np.ndarray) -> np.ndarray:
+        self._buf = np.concatenate([self._buf, x])
+        out = []
+        while len(self._buf) - self._pos >= self.step + self.pad:
+            out.append(self._run(self._pos + self.step))
+        self._trim()
+        return np.concatenate(out) if out else np.empty(0, dtype=np.float32)
+
+    def finish(self) -> np.ndarray:
+        if len(self._buf) == self._pos:
+            return np.empty(0, dtype=np.float32)
+        return self._run(len(self._buf), last=True)
+
+    def _run(self, stop: int, last: bool = False) -> np.ndarray:
+        lo = max(self._pos - self.pad, 0)
+        hi = len(self._buf) if last else stop + self.pad
+        y = resample_poly(self._buf[lo:hi], self.up, self.down)
+        first = (self._pos - lo) * self.up // self.down
+        count = ceil((stop - self._pos) * self.up / self.down) if last else (stop - self._pos) * self.up // self.down
+        self._pos = stop
+        return y[first:first + count].astype(np.float32, copy=False)
+
+    def _trim(self):
+        keep = max(self._pos - self.pad, 0)
+        if keep:
+            self._buf = self._buf[keep:]
+            self._pos -= keep
+
+
+def build_proxy(src: Path, channel: int | None = None,
+                progress: Callable[[float], None] | None = None) -> Path:
+    """Write the proxy for `src` (if not there yet) and return its path.
+
+    `channel` selects one channel instead of the mixdown. Building the mixdown
+    of a multichannel source also writes its envelope pyramids.
+    """
+    src = Path(src)
+    out = proxy_path(src, channel)
+    info = probe(src)
+    env_out = envelope_path(src) if channel is None and info.channels > 1 else None
+    act_out = activity_path(src) if channel is None else None
+    if out.exists() and (env_out is None or env_out.exists()):
+        return out
+    PROXY_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + f".{os.getpid()}.part")
+    rs = _Resampler(info.samplerate, PROXY_SR)
+    env = EnvelopeBuilder(info.channels) if env_out is not None else None
+    act = ActivityBuilder(info.samplerate) if act_out is not None and not act_out.exists() else None
+    done = 0
+    with span("audio.proxy", file=src.name, sr=info.samplerate, channels=info.channels, channel=channel):
+        try:
+            with sf.SoundFile(str(tmp), "w", samplerate=PROXY_SR, channels=1, subtype="PCM_16", format="WAV") as f:
+                for block in iter_blocks(src, info=info):
+                    if env is not None:
+                        env.push(block)
+                    if channel is not None:
+                        mono = block[:, channel]
+                    else:
+                        mono = block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32)
+                        if act is not None:
+                            act.push(mono)
+                    f.write(np.clip(rs.push(mono), -1.0, 1.0))
+                    done += len(block)
+                    if progress is not None and info.frames:
+                        progress(min(done / info.frames, 1.0))
+                f.write(np.clip(rs.finish(), -1.0, 1.0))
+            if env is not None:
+                env.finish(info.samplerate).save(env_out)
+            if act is not None:
+                act.finish().save(act_out)
+            os.replace(tmp, out)
+        finally:
+            tmp.unlink(missing_ok=True)
+    _prune_versions(out)
+    return out
+
+
+def _prune_versions(artifact: Path):
+    """Delete artifacts of earlier versions of the file `artifact` was made from."""
+    current = artifact.name.split(".")[0]       # "<path id>-<version id>"
+    path_id = current.split("-")[0]
+    for old in PROXY_DIR.glob(f"{path_id}-*"):
+        if not old.name.startswith(current + ".") and not old.name.endswith(".part"):
+            old.unlink(missing_ok=True)
+
+
+_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-proxy")
+_inflight: dict[Path, Future] = {}
+_lock = threading.Lock()
+
+
+def submit_proxy(src: Path, channel: int | None = None) -> Future:
+    """Build the proxy on the background worker; repeated calls share one job."""
+    key = proxy_path(src, channel)
+    with _lock:
+        fut = _inflight.get(key)
+        if fut is None:
+            fut = _pool.submit(build_proxy, Path(src), channel)
+            _inflight[key] = fut
+            fut.add_done_callback(lambda _f: _forget(key))
+        return fut
+
+
+def submit_activity(src: Path) -> Future:
+    """Build the activity index on the background worker; repeated calls share one job."""
+    key = activity_path(src)
+    with _lock:
+        fut = _inflight.get(key)
+        if fut is None:
+            fut = _pool.submit(build_activity, Path(src))
+            _inflight[key] = fut
+            fut.add_done_callback(lambda _f: _forget(key))
+        return fut
+
+
+def _forget(key: Path):
+    with _lock:
+        _inflight.pop(key, None)
@@ -0,0 +1,141 @@
+# code/audio/spectrogram.py
+# Spectrogram engine for the label editor: framed, windowed and batched
+# through scipy.fft.rfft on all cores, float32 end to end, with optional
+# log- or mel-spaced frequency bands. The result is laid out (frame, band),
+# which is what pyqtgraph's ImageItem wants, so it is never transposed.
+# Zoomed-out views are drawn from max-pooled copies (built on first use), so a
+# window never needs more than a few rows per pixel.
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft
+from scipy.signal import get_window
+
+from code.audio.decode import PCM_SCALE
+
+SCALES = ("linear", "log", "mel")
+FFT_SIZES = (256, 512, 1024, 2048, 4096, 8192)
+CHUNK_FRAMES = 2048   # frames transformed per batch (bounds the complex temporary)
+FLOOR = 1e-10         # magnitude floor before dB (-200 dB)
+LOG_FMIN = 20.0       # lowest band edge of the log axis, Hz
+POOL_FACTOR = 4       # frames merged per zoom-out level
+
+
+@dataclass(frozen=True)
+class SpecParams:
+    n_fft: int = 1024
+    hop: int = 512
+    scale: str = "linear"   # one of SCALES
+    n_bands: int = 128      # bands of the log/mel axes
+
+
+@dataclass
+class Spectrogram:
+    db: np.ndarray          # float32 (frames, bands)
+    dt: float               # seconds per frame
+    freqs: np.ndarray       # centre frequency of each band, Hz
+    scale: str
+    _pooled: list[np.ndarray] = field(default_factory=list, repr=False, compare=False)
+
+    @property
+    def nbytes(self) -> int:
+        return self.db.nbytes + sum(lv.nbytes for lv in self._pooled)
+
+    def _level(self, level: int) -> np.ndarray:
+        """db max-pooled over POOL_FACTOR ** level frames."""
+        while len(self._pooled) < level:
+            below = self._pooled[-1] if self._pooled else self.db
+            n = -(-len(below) // POOL_FACTOR)
+            pad = n * POOL_FACTOR - len(below)
+            if pad:
+                below = np.concatenate([below, np.repeat(below[-1:], pad, axis=0)])
+            self._pooled.append(below.reshape(n, POOL_FACTOR, -1).max(axis=1))
+        return self._pooled[level - 1] if level else self.db
+
+    def window(self, t0: float, t1: float, pixels: int) -> tuple[np.ndarray, float, float]:
+        """(rows, x0, x1): the frames covering [t0, t1] seconds at the coarsest
+        level that still has a row per pixel."""
+        per_px = (t1 - t0) / self.dt / max(pixels, 1)
+        level = 0
+        while POOL_FACTOR ** (level + 1) <= per_px and len(self.db) > POOL_FACTOR ** (level + 1):
+            level += 1
+        rows = self._level(level)
+        size = self.dt * POOL_FACTOR ** level
+        i0 = max(int(t0 // size), 0)
+        i1 = min(int(t1 // size) + 2, len(rows))
+        if i1 <= i0:
+            return rows[:0], 0.0, 0.0
+        return rows[i0:i1], i0 * size, min(i1 * size, len(self.db) * self.dt)
+
+
+@lru_cache(maxsize=16)
+def _window(n_fft: int) -> np.ndarray:
+    """Periodic Hann with the density scaling scipy.signal.spectrogram applies
+    in magnitude mode, so "linear" matches it."""
+    win = get_window("hann", n_fft).astype(np.float32)
+    return win / np.float32(np.sqrt(np.sum(win.astype(np.float64) ** 2)))
+
+
+def _hz_to_mel(f):
+    return 2595.0 * np.log10(1.0 + np.asarray(f, dtype=np.float64) / 700.0)
+
+
+def _mel_to_hz(m):
+    return 700.0 * (10.0 ** (np.asarray(m, dtype=np.float64) / 2595.0) - 1.0)
+
+
+@lru_cache(maxsize=16)
+def _filterbank(sr: int, n_fft: int, scale: str, n_bands: int) -> tuple[np.ndarray, np.ndarray]:
+    """(weights (bins, bands) float32, band centres Hz) of triangular bands
+    evenly spaced on the mel or log-frequency axis."""
+    nyq = sr / 2.0
+    if scale == "mel":
+        edges = _mel_to_hz(np.linspace(0.0, _hz_to_mel(nyq), n_bands + 2))
+    else:
+        edges = np.geomspace(min(LOG_FMIN, nyq / 2), nyq, n_bands + 2)
+    bins = np.fft.rfftfreq(n_fft, 1.0 / sr)
+    lo, mid, hi = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    up = (bins[None] - lo) / np.maximum(mid - lo, 1e-9)
+    down = (hi - bins[None]) / np.maximum(hi - mid, 1e-9)
+    weights = np.clip(np.minimum(up, down), 0.0, None)
+    # bands narrower than one FFT bin (low end) take the nearest bin instead of staying empty
+    empty = weights.sum(axis=1) == 0
+    weights[empty, np.abs(bins[None] - mid[empty]).argmin(axis=1)] = 1.0
+    weights /= weights.sum(axis=1, keepdims=True)
+    return np.ascontiguousarray(weights.T, dtype=np.float32), edges[1:-1]
+
+
+def compute_spectrogram(data: np.ndarray, sr: int, params: SpecParams = SpecParams()) -> Spectrogram:
+    """Magnitude spectrogram in dB of mono `data` (float, or int16 PCM scaled per batch)."""
+    if params.scale not in SCALES:
+        raise ValueError(f"Unknown frequency scale: {params.scale}")
+    n_fft, hop = params.n_fft, max(int(params.hop), 1)
+    x = np.asarray(data)
+    if x.dtype != np.int16:
+        x = x.astype(np.float32, copy=False)
+    if len(x) < n_fft:
+        x = np.pad(x, (0, n_fft - len(x)))
+    frames = sliding_window_view(x, n_fft)[::hop]
+    win = _window(n_fft) / np.float32(np.sqrt(sr))
+    if x.dtype == np.int16:
+        win = win * PCM_SCALE  # the window product is the batch's only float copy
+    if params.scale == "linear":
+        fb, freqs = None, np.fft.rfftfreq(n_fft, 1.0 / sr)
+    else:
+        fb, freqs = _filterbank(sr, n_fft, params.scale, params.n_bands)
+
+    out = np.empty((len(frames), len(freqs)), dtype=np.float32)
+    for i in range(0, len(frames), CHUNK_FRAMES):
+        spec = fft.rfft(frames[i:i + CHUNK_FRAMES] * win, axis=1, workers=-1)
+        mag = np.abs(spec)
+        if fb is None:
+            out[i:i + len(mag)] = mag
+        else:
+            np.matmul(mag, fb, out=out[i:i + len(mag)])
+    np.maximum(out, FLOOR, out=out)
+    np.log10(out, out=out)
+    out *= 20.0
+    return Spectrogram(out, hop / sr, freqs, params.scale)
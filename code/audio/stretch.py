@@ -0,0 +1,105 @@
+# code/audio/stretch.py
+# Pitch-preserving time compression for review playback (WSOLA: waveform
+# similarity overlap-add) and short-term energy for skipping silence.
+# Works on an already decoded mono buffer and renders in chunks, each tagged
+# with the span of original-file time it covers.
+
+from typing import Iterator
+
+import numpy as np
+
+from code.audio.decode import to_float
+
+FRAME_S = 0.040      # WSOLA frame (50 % overlap)
+TOLERANCE_S = 0.010  # how far a frame may shift to line up with the previous one
+CHUNK_STEPS = 16     # synthesis hops per yielded chunk
+
+ENERGY_WIN_S = 0.050  # short-term energy window
+ENERGY_CHUNK = 4096   # windows converted to float at a time
+SILENCE_DB = -45.0    # windows quieter than this (dBFS) are skipped
+PAD_S = 0.25          # audio kept around every active region
+MIN_GAP_S = 0.5       # shorter silences are played, not skipped
+
+
+def short_term_energy_db(x: np.ndarray, sr: int, win_s: float = ENERGY_WIN_S) -> np.ndarray:
+    """Mean power per window in dBFS (float32, one value per `win_s`)."""
+    win = max(int(sr * win_s), 1)
+    n = len(x) // win
+    power = np.empty(n + (len(x) % win > 0), dtype=np.float32)
+    for i in range(0, n, ENERGY_CHUNK):
+        k = min(ENERGY_CHUNK, n - i)
+        frames = to_float(x[i * win:(i + k) * win]).reshape(k, win)
+        np.einsum("ij,ij->i", frames, frames, out=power[i:i + k])
+    power[:n] /= win
+    if len(power) > n:
+        tail = to_float(x[n * win:])
+        power[n] = float(np.dot(tail, tail)) / len(tail)
+    np.maximum(power, 1e-12, out=power)
+    np.log10(power, out=power)
+    power *= 10.0
+    return power
+
+
+def active_regions(energy_db: np.ndarray, sr: int, n_samples: int, threshold_db: float = SILENCE_DB,
+                   win_s: float = ENERGY_WIN_S) -> list[tuple[int, int]]:
+    """(start, stop) sample ranges worth playing: windows above the threshold,
+    padded by PAD_S and joined across gaps shorter than MIN_GAP_S."""
+    win = max(int(sr * win_s), 1)
+    loud = np.flatnonzero(energy_db >= threshold_db)
+    if not len(loud):
+        return []
+    breaks = np.flatnonzero(np.diff(loud) > 1)
+    starts = np.r_[loud[0], loud[breaks + 1]] * win
+    stops = (np.r_[loud[breaks], loud[-1]] + 1) * win
+    pad, gap = int(PAD_S * sr), int(MIN_GAP_S * sr)
+    regions: list[tuple[int, int]] = []
+    for a, b in zip(np.maximum(starts - pad, 0), np.minimum(stops + pad, n_samples)):
+        if regions and a - regions[-1][1] < gap:
+            regions[-1] = (regions[-1][0], int(b))
+        else:
+            regions.append((int(a), int(b)))
+    return regions
+
+
+def wsola(x: np.ndarray, sr: int, rate: float, start: int, stop: int) -> Iterator[tuple[np.ndarray, int, int]]:
+    """Play x[start:stop] `rate` times faster at the original pitch.
+
+    Yields (float32 output chunk, first input sample, last input sample) so the
+    caller can map output time back to file time. `x` may be int16 PCM; only the
+    frames being matched are converted.
+    """
+    n = int(sr * FRAME_S) // 2 * 2
+    hs = n // 2                                   # synthesis hop
+    ha = hs * rate                                # analysis hop (fractional)
+    tol = int(sr * TOLERANCE_S)
+    win = np.hanning(n + 1)[:n].astype(np.float32)  # periodic Hann: hops of n/2 sum to 1
+    ola = np.zeros(n, dtype=np.float32)
+    prev = None                                   # where the previous frame was taken from
+    out, chunk_in0, step = [], start, 0
+    while True:
+        nominal = start + int(round(step * ha))
+        if nominal >= stop:
+            break
+        best = nominal
+        if prev is not None:
+            natural = to_float(x[prev + hs:prev + hs + n])  # what would follow the previous frame
+            lo, hi = max(nominal - tol, 0), min(nominal + tol + n, len(x))
+            region = to_float(x[lo:hi])
+            if len(natural) == n and len(region) > n:
+                score = np.correlate(region, natural, mode="valid")
+                best = lo + int(np.argmax(score))
+        frame = to_float(x[best:best + n])
+        if len(frame) < n:
+            frame = np.pad(frame, (0, n - len(frame)))
+        ola += win * frame
+        out.append(ola[:hs].copy())
+        ola[:hs] = ola[hs:]
+        ola[hs:] = 0.0
+        prev = best
+        step += 1
+        if step % CHUNK_STEPS == 0:
+            chunk_in1 = min(start + int(round(step * ha)), stop)
+            yield np.concatenate(out), chunk_in0, chunk_in1
+            out, chunk_in0 = [], chunk_in1
+    out.append(ola[:hs].copy())                   # tail of the last frame
+    yield np.concatenate(out), chunk_in0, stop
@@ -0,0 +1,240 @@
+# code/core/csv_writer.py
+# Shared background CSV writer. All app CSV writes go through one worker
+# thread: saves to the same file are coalesced, and every write lands in a
+# temp file that is os.replace()d into place, so readers never see a
+# half-written CSV and the GUI thread never blocks on disk I/O.
+# Writes are optimistic: the file version (mtime_ns, size) seen at read time
+# is re-checked under an advisory lock just before the replace, and other
+# annotators' changes are merged in instead of being overwritten.
+
+import os
+import threading
+import uuid
+from concurrent.futures import Future
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+from PySide6.QtCore import QObject, Signal
+
+from code.core.file_lock import FileLock
+from code.core.instrument import span
+from code.core.merge import three_way_merge
+from code.core.schema import TableSchema
+
+
+def csv_version(path: Path):
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def temp_path(path: Path) -> Path:
+    """Hidden temp name next to `path`, unique per process, thread and call
+    (a thread ident can be reused once its thread has exited)."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def write_csv_atomic(df: pd.DataFrame, path: Path) -> list | None:
+    """Write df to a temp file in the same folder and os.replace() it into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(path)
+    try:
+        with open(tmp, "x", encoding="utf-8", newline="") as fh:
+            df.to_csv(fh, index=False)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink(missing_ok=True)
+    return csv_version(path)
+
+
+def read_csv_str(path: Path) -> pd.DataFrame:
+    """Read a CSV the way the pages do (all columns as str); empty frame if missing."""
+    try:
+        return pd.read_csv(path, dtype=str, encoding="utf-8")
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return pd.DataFrame()
+
+
+def read_csv_versioned(path: Path) -> tuple[pd.DataFrame, list | None]:
+    """Read a CSV together with the version it had while being read."""
+    for _ in range(5):
+        before = csv_version(path)
+        df = read_csv_str(path)
+        after = csv_version(path)
+        if before == after:
+            break
+    return df, after
+
+
+@dataclass
+class WriteResult:
+    version: list | None   # (mtime_ns, size) after the write
+    merged: bool = False   # another writer changed the file and we merged
+    conflicts: int = 0     # fields/rows where both sides changed (ours won)
+
+
+@dataclass
+class _Job:
+    future: Future
+    df: pd.DataFrame | None = None                              # full replacement …
+    fn: Callable[[pd.DataFrame], pd.DataFrame | None] | None = None  # … or read-modify-write
+    base: pd.DataFrame | None = None   # what a save() was edited from (enables merging)
+    base_version: list | None = None
+    key: list[str] | None = None
+    schema: TableSchema | None = None  # upgrades an older layout on disk before merging
+
+
+class CsvWriter(QObject):
+    """Serializes CSV writes on a background thread.
+
+    save(path, df) replaces the file with a snapshot of df; update(path, fn) applies
+    fn to the newest content (including still-queued saves) and writes the result
+    (fn may return None for "no change", which skips the write).
+    Everything queued for one path is folded into a single write. Both return a
+    Future resolving to a WriteResult; sig_written/sig_failed are delivered on
+    the GUI thread.
+
+    Concurrency with other processes: content is read and transformed without
+    holding the lock; the lock is taken only to re-check the version and
+    replace the file. If the version moved, update() functions are simply
+    re-run on the new content, and save()s that carry their base are
+    three-way merged (row-level, matched on `key`). The last attempt holds
+    the lock throughout so a writer cannot starve.
+    """
+    sig_written = Signal(str, object)  # (path, WriteResult)
+    sig_failed = Signal(str, str)      # (path, error)
+
+    MAX_ATTEMPTS = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._queue: dict[str, list[_Job]] = {}  # insertion-ordered: oldest path first
+        self._active: str | None = None
+        self._thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+        self._thread.start()
+
+    # ----- public API -----
+    def save(self, path: Path, df: pd.DataFrame, base: pd.DataFrame | None = None,
+             base_version: list | None = None, key: list[str] | None = None,
+             schema: TableSchema | None = None) -> Future:
+        """Replace the file with df. With base/base_version/key, concurrent
+        changes made by others since `base` was read are merged in (after
+        `schema` upgraded their file, if it is in an older layout)."""
+        job = _Job(Future(), df=df.copy(), key=key, base_version=base_version,
+                   base=None if base is None else base.copy(), schema=schema)
+        return self._submit(path, job)
+
+    def update(self, path: Path, fn: Callable[[pd.DataFrame], pd.DataFrame | None]) -> Future:
+        return self._submit(path, _Job(Future(), fn=fn))
+
+    def pending(self, path: Path | None = None) -> bool:
+        with self._cond:
+            if path is None:
+                return bool(self._queue) or self._active is not None
+            key = str(Path(path))
+            return key in self._queue or self._active == key
+
+    def flush(self, path: Path | None = None, timeout: float | None = None) -> bool:
+        """Block until queued writes (for one path or all) are on disk."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self.pending(path), timeout)
+
+    # ----- worker -----
+    def _submit(self, path: Path, job: _Job) -> Future:
+        key = str(Path(path))
+        with self._cond:
+            self._queue.setdefault(key, []).append(job)
+            self._cond.notify_all()
+        return job.future
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._queue))
+                key = next(iter(self._queue))
+                jobs = self._queue.pop(key)
+                self._active = key
+            try:
+                with span("csv.write", file=Path(key).name, jobs=len(jobs)):
+                    self._write_jobs(Path(key), jobs)
+            finally:
+                with self._cond:
+                    self._active = None
+                    self._cond.notify_all()
+
+    def _fold(self, jobs: list[_Job], disk: pd.DataFrame, version):
+        """Apply queued jobs on top of the file content.
+
+        Returns (df, ok_jobs, changed, merged, conflicts).
+        """
+        df, ok, changed, merged, conflicts = disk, [], False, False, 0
+        for job in jobs:
+            try:
+                if job.df is not None:
+                    out = job.df
+                    if job.key and job.base is not None and (changed or job.base_version != version):
+                        theirs = df
+                        if job.schema is not None and job.schema.detect_version(df.columns) != job.schema.version:
+                            theirs = job.schema.migrate(df)
+                        out, n = three_way_merge(job.base, job.df, theirs, job.key)
+                        merged, conflicts = True, conflicts + n
+                else:
+                    out = job.fn(df.copy())
+            except Exception as e:
+                job.future.set_exception(e)
+                continue
+            ok.append(job)
+            if out is not None:
+                df, changed = out, True
+        return df, ok, changed, merged, conflicts
+
+    def _write_jobs(self, path: Path, jobs: list[_Job]):
+        raced = False
+        for attempt in range(self.MAX_ATTEMPTS):
+            last = attempt == self.MAX_ATTEMPTS - 1
+            try:
+                with FileLock(path) if last else nullcontext():
+                    disk, version = read_csv_versioned(path)
+                    df, jobs, changed, merged, conflicts = self._fold(jobs, disk, version)
+                    if not jobs:
+                        return
+                    if not changed:
+                        result = WriteResult(version, raced or merged, conflicts)
+                        break
+                    with nullcontext() if last else FileLock(path):
+                        if not last and csv_version(path) != version:
+                            raced = True  # someone wrote meanwhile: redo on their content
+                            continue
+                        result = WriteResult(write_csv_atomic(df, path), raced or merged, conflicts)
+                        break
+            except Exception as e:
+                for job in jobs:
+                    job.future.set_exception(e)
+                self.sig_failed.emit(str(path), str(e))
+                return
+        for job in jobs:
+            job.future.set_result(result)
+        if changed:
+            self.sig_written.emit(str(path), result)
+
+
+_writer: CsvWriter | None = None
+
+
+def get_writer() -> CsvWriter:
+    """The process-wide writer (created on first use, after QApplication)."""
+    global _writer
+    if _writer is None:
+        _writer = CsvWriter()
+    return _writer
@@ -0,0 +1,75 @@
+# code/core/file_lock.py
+# Advisory inter-process lock for CSVs on a shared data/ directory.
+# The lock lives on a sidecar "<name>.lock" file: the CSV itself is replaced
+# (new inode) on every atomic write, so a lock on it would not be shared.
+
+import os
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+class FileLock:
+    """Exclusive advisory lock: `with FileLock(path): ...`.
+
+    Uses fcntl.lockf (POSIX record locks, which also work over NFS) and falls
+    back to msvcrt.locking on Windows. Raises TimeoutError after `timeout` s.
+    """
+
+    def __init__(self, path: Path, timeout: float = 10.0, poll: float = 0.005):
+        path = Path(path)
+        self.lock_path = path.with_name(path.name + ".lock")
+        self.timeout = timeout
+        self.poll = poll
+        self._fd: int | None = None
+
+    def _try_lock(self, fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self):
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll
+        while not self._try_lock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise TimeoutError(f"Timed out waiting for lock on {self.lock_path.name}")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)  # back off a little under contention
+        self._fd = fd
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
@@ -0,0 +1,131 @@
+# code/core/geo_index.py
+# Grid-bucket spatial index over sample latitude/longitude.
+# Points are sorted by grid cell id, so the points of one grid row inside a
+# longitude range form one contiguous slice found with np.searchsorted; the
+# candidates are then filtered exactly (box test or haversine distance).
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from code.core.schema import META
+
+DATA_DIR = Path.cwd() / "data"
+META_CSV = DATA_DIR / "samples_meta.csv"
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = np.pi * EARTH_RADIUS_KM / 180.0
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in km (vectorized over numpy arrays)."""
+    p1, p2 = np.radians(lat1), np.radians(lat2)
+    dphi = p2 - p1
+    dlmb = np.radians(np.asarray(lon2) - np.asarray(lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(p1) * np.cos(p2) * np.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class GeoIndex:
+    """Static index of (sample_id, lat, lon); rebuild it when the metadata changes.
+
+    `cell_deg` trades bucket count against candidates per bucket; the default
+    0.05° (~5.5 km of latitude) suits "within a few km" queries.
+    """
+
+    def __init__(self, sample_ids, lat, lon, cell_deg: float = 0.05):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        ids = np.asarray(sample_ids, dtype=object)
+        ok = np.isfinite(lat) & np.isfinite(lon) & (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+        self.cell_deg = float(cell_deg)
+        self._ncols = int(np.ceil(360.0 / self.cell_deg)) + 1
+        cells = self._cell(lat[ok], lon[ok])
+        order = np.argsort(cells, kind="stable")
+        self.cells = cells[order]
+        self.lat = lat[ok][order]
+        self.lon = lon[ok][order]
+        self.sample_ids = ids[ok][order]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, cell_deg: float = 0.05) -> "GeoIndex":
+        """Build from a metadata frame with sample_id / latitude / longitude columns."""
+        return cls(df["sample_id"].astype(str), df["latitude"], df["longitude"], cell_deg)
+
+    @classmethod
+    def from_meta_csv(cls, path: Path = META_CSV, cell_deg: float = 0.05) -> "GeoIndex":
+        df = META.read(path, ["sample_id", "latitude", "longitude"])
+        df = df[df["sample_id"] != ""].drop_duplicates("sample_id", keep="last")
+        return cls.from_frame(df, cell_deg)
+
+    def __len__(self) -> int:
+        return len(self.sample_ids)
+
+    # ----- grid -----
+    def _row(self, lat):
+        return np.floor((np.asarray(lat) + 90.0) / self.cell_deg).astype(np.int64)
+
+    def _col(self, lon):
+        return np.floor((np.asarray(lon) + 180.0) / self.cell_deg).astype(np.int64)
+
+    def _cell(self, lat, lon):
+        return self._row(lat) * self._ncols + self._col(lon)
+
+    def _candidates(self, lat_min, lat_max, lon_min, lon_max) -> np.ndarray:
+        """Positions of points in grid cells overlapping the box (no antimeridian wrap)."""
+        r0, r1 = int(self._row(max(lat_min, -90.0))), int(self._row(min(lat_max, 90.0)))
+        c0, c1 = int(self._col(max(lon_min, -180.0))), int(self._col(min(lon_max, 180.0)))
+        rows = np.arange(r0, r1 + 1, dtype=np.int64) * self._ncols
+        lo = np.searchsorted(self.cells, rows + c0, side="left")
+        hi = np.searchsorted(self.cells, rows + c1, side="right")
+        spans = [np.arange(a, b) for a, b in zip(lo, hi) if b > a]
+        return np.concatenate(spans) if spans else np.empty(0, dtype=np.int64)
+
+    def _box_positions(self, lat_min, lat_max, lon_min, lon_max) -> np.ndarray:
+        if lon_min <= lon_max:
+            boxes = [(lon_min, lon_max)]
+        else:  # box crosses the antimeridian
+            boxes = [(lon_min, 180.0), (-180.0, lon_max)]
+        out = []
+        for a, b in boxes:
+            pos = self._candidates(lat_min, lat_max, a, b)
+            la, lo = self.lat[pos], self.lon[pos]
+            out.append(pos[(la >= lat_min) & (la <= lat_max) & (lo >= a) & (lo <= b)])
+        return np.concatenate(out) if out else np.empty(0, dtype=np.int64)
+
+    # ----- queries -----
+    def bbox(self, lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> pd.DataFrame:
+        """Samples inside the box (lon_min > lon_max means it wraps across ±180°)."""
+        pos = self._box_positions(lat_min, lat_max, lon_min, lon_max)
+        return pd.DataFrame({
+            "sample_id": self.sample_ids[pos], "latitude": self.lat[pos], "longitude": self.lon[pos],
+        })
+
+    def radius(self, lat: float, lon: float, km: float) -> pd.DataFrame:
+        """Samples within `km` of (lat, lon), nearest first, with a distance_km column."""
+        dlat = km / KM_PER_DEG_LAT
+        lat_min, lat_max = lat - dlat, lat + dlat
+        coslat = np.cos(np.radians(min(abs(lat) + dlat, 90.0)))
+        if lat_min <= -90.0 or lat_max >= 90.0 or coslat < 1e-9 or km / (KM_PER_DEG_LAT * coslat) >= 180.0:
+            pos = self._box_positions(max(lat_min, -90.0), min(lat_max, 90.0), -180.0, 180.0)  # polar cap
+        else:
+            dlon = km / (KM_PER_DEG_LAT * coslat)
+            lon_min = (lon - dlon + 180.0) % 360.0 - 180.0
+            lon_max = (lon + dlon + 180.0) % 360.0 - 180.0
+            pos = self._box_positions(lat_min, lat_max, lon_min, lon_max)
+        dist = haversine_km(lat, lon, self.lat[pos], self.lon[pos])
+        keep = dist <= km
+        pos, dist = pos[keep], dist[keep]
+        order = np.argsort(dist, kind="stable")
+        return pd.DataFrame({
+            "sample_id": self.sample_ids[pos][order], "latitude": self.lat[pos][order],
+            "longitude": self.lon[pos][order], "distance_km": dist[order],
+        })
+
+    def locate(self, sample_id: str) -> tuple[float, float] | None:
+        """(lat, lon) of a sample, if it has coordinates."""
+        hit = np.flatnonzero(self.sample_ids == sample_id)
+        if not len(hit):
+            return None
+        return float(self.lat[hit[-1]]), float(self.lon[hit[-1]])
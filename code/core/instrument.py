@@ -0,0 +1,210 @@
+# code/core/instrument.py
+# Opt-in timing instrumentation: named spans (wall time + memory delta),
+# GUI event-loop stalls (reported by code.core.watchdog) and one-shot
+# cProfile / tracemalloc capture, written as JSONL to data/traces/. Off
+# unless AUDIO_LABELER_TRACE is set or the app is started with --trace;
+# when off, span() costs one global lookup.
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from time import perf_counter, time
+
+from PySide6.QtCore import QObject, Signal
+
+DATA_DIR = Path.cwd() / "data"
+TRACE_DIR = DATA_DIR / "traces"
+ENV_VAR = "AUDIO_LABELER_TRACE"  # "1" -> data/traces/trace-<time>.jsonl, or a file path
+
+RECENT = 50         # records kept in memory for the overlay
+
+
+def _rss_bytes() -> int | None:
+    """Resident set size of this process (None where it can't be read cheaply)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # peak only: KiB on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "fields", "t0", "rss0", "profiler")
+
+    def __init__(self, tracer: "Tracer", name: str, fields: dict):
+        self.tracer, self.name, self.fields = tracer, name, fields
+        self.profiler = None
+
+    def __enter__(self):
+        local = self.tracer._local
+        local.depth = getattr(local, "depth", 0) + 1
+        if local.depth == 1 and threading.current_thread() is threading.main_thread():
+            self.profiler = self.tracer._start_profile()
+        self.rss0 = _rss_bytes()
+        self.t0 = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (perf_counter() - self.t0) * 1000.0
+        rss1 = _rss_bytes()
+        local = self.tracer._local
+        local.depth -= 1
+        rec = {
+            "type": "span", "name": self.name, "ms": round(ms, 3),
+            "rss_delta_kb": None if rss1 is None or self.rss0 is None else (rss1 - self.rss0) // 1024,
+            "depth": local.depth, "thread": threading.current_thread().name,
+        }
+        if exc_type is not None:
+            rec["error"] = exc_type.__name__
+        if self.fields:
+            rec.update(self.fields)
+        if self.profiler is not None:
+            rec["profile"] = self.tracer._stop_profile(self.profiler, self.name)
+        self.tracer.record(rec)
+        return False
+
+
+class Tracer(QObject):
+    """Collects span / stall records into a JSONL file; create on the GUI thread."""
+    sig_record = Signal(object)  # every record (dict), delivered on the GUI thread
+
+    def __init__(self, path: Path, parent=None):
+        super().__init__(parent)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.recent: deque[dict] = deque(maxlen=RECENT)
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profile_kind: str | None = None
+
+    # ----- records -----
+    def span(self, name: str, **fields) -> _Span:
+        return _Span(self, name, fields)
+
+    def record(self, rec: dict):
+        """Append a record (any thread); it needs "type", "name" and "ms"."""
+        rec = {"ts": round(time(), 3), **rec}
+        line = json.dumps(rec, default=str)
+        with self._lock:
+            self.recent.append(rec)
+            if not self._file.closed:
+                self._file.write(line + "\n")
+        self.sig_record.emit(rec)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    # ----- one-shot profiling -----
+    def profile_next(self, kind: str = "cprofile"):
+        """Profile the next top-level span on the GUI thread ("cprofile" or "tracemalloc")."""
+        if kind not in ("cprofile", "tracemalloc"):
+            raise ValueError(f"unknown profile kind: {kind}")
+        self._profile_kind = kind
+
+    @property
+    def profile_armed(self) -> str | None:
+        return self._profile_kind
+
+    def _start_profile(self):
+        kind, self._profile_kind = self._profile_kind, None
+        if kind == "cprofile":
+            prof = cProfile.Profile()
+            prof.enable()
+            return prof
+        if kind == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            return tracemalloc
+        return None
+
+    def _stop_profile(self, profiler, name: str) -> str:
+        stem = f"{self.path.stem}-{name}-{datetime.now():%H%M%S}"
+        if profiler is tracemalloc:
+            snap = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            out = self.path.parent / f"{stem}.tracemalloc.txt"
+            with open(out, "w", encoding="utf-8") as f:
+                f.write(f"peak traced: {peak / 2**20:.1f} MiB\n")
+                for stat in snap.statistics("traceback")[:30]:
+                    f.write(f"\n{stat.size / 2**20:.2f} MiB in {stat.count} blocks\n")
+                    f.write("\n".join(stat.traceback.format(limit=8)) + "\n")
+            return str(out)
+        profiler.disable()
+        out = self.path.parent / f"{stem}.prof"
+        profiler.dump_stats(str(out))  # open with: python -m pstats <file>
+        return str(out)
+
+
+_tracer: Tracer | None = None
+
+
+def enable(path: Path | None = None) -> Tracer:
+    """Start tracing to `path` (default: a new file in data/traces/)."""
+    global _tracer
+    if _tracer is None:
+        if path is None:
+            path = TRACE_DIR / f"trace-{datetime.now():%Y%m%d-%H%M%S}.jsonl"
+        _tracer = Tracer(path)
+    return _tracer
+
+
+def enable_from_env_or_args(argv: list[str]) -> Tracer | None:
+    """Honour --trace[=path] (removed from argv) and $AUDIO_LABELER_TRACE."""
+    target = os.environ.get(ENV_VAR, "")
+    for arg in list(argv[1:]):
+        if arg == "--trace" or arg.startswith("--trace="):
+            argv.remove(arg)
+            target = arg.partition("=")[2] or target or "1"
+    if not target or target == "0":
+        return None
+    return enable(None if target == "1" else Path(target))
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def span(name: str, **fields):
+    """Context manager timing a named span (no-op unless tracing is enabled)."""
+    tracer = _tracer
+    return _NULL_SPAN if tracer is None else _Span(tracer, name, fields)
+
+
+def traced(name: str):
+    """Decorator form of span() for methods/functions."""
+    def deco(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with _Span(tracer, name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
@@ -0,0 +1,75 @@
+# code/core/label_commands.py
+# QUndoCommand implementations for label edits. Each command mutates the
+# PandasModel and records the forward operation in the LabelJournal, so undo
+# and redo are journaled like any other edit.
+
+from PySide6.QtGui import QUndoCommand
+
+from code.core.label_journal import LabelJournal
+from code.ui.widgets.pandas_model import PandasModel
+
+
+class _LabelCommand(QUndoCommand):
+    def __init__(self, model: PandasModel, journal: LabelJournal | None, text: str):
+        super().__init__(text)
+        self._model = model
+        self._journal = journal
+
+    def _log(self, op: dict):
+        if self._journal is not None:
+            self._journal.append(op)
+
+
+class InsertRowsCommand(_LabelCommand):
+    """Insert a block of rows at a position (Add Row, batched inserts)."""
+    def __init__(self, model, journal, at: int, rows: list[dict], text: str = "Add row"):
+        super().__init__(model, journal, text)
+        self._at = at
+        self._rows = [dict(r) for r in rows]
+
+    def redo(self):
+        self._model.insert_rows(self._at, self._rows)
+        self._log({"op": "insert", "at": self._at, "rows": self._rows})
+
+    def undo(self):
+        rows = list(range(self._at, self._at + len(self._rows)))
+        self._model.remove_rows(rows)
+        self._log({"op": "remove", "rows": rows})
+
+
+class RemoveRowsCommand(_LabelCommand):
+    """Remove arbitrary (not necessarily contiguous) rows."""
+    def __init__(self, model, journal, rows: list[int], text: str = "Delete rows"):
+        super().__init__(model, journal, text)
+        self._rows = sorted(set(rows))
+        self._values = [model.row_dict(r) for r in self._rows]
+
+    def redo(self):
+        self._model.remove_rows(self._rows)
+        self._log({"op": "remove", "rows": self._rows})
+
+    def undo(self):
+        # ascending order puts every row back at its original position
+        for r, values in zip(self._rows, self._values):
+            self._model.insert_rows(r, [values])
+            self._log({"op": "insert", "at": r, "rows": [values]})
+
+
+class SetCellsCommand(_LabelCommand):
+    """Set one or many cells; a single table edit is the one-cell case."""
+    def __init__(self, model, journal, cells: list[tuple[int, int, object]], text: str = "Edit cell"):
+        super().__init__(model, journal, text)
+        self._cols = list(model.dataframe().columns)
+        self._new = list(cells)
+        self._old = [(r, c, model.dataframe().iat[r, c]) for r, c, _ in cells]
+
+    def _apply(self, cells):
+        for r, c, v in cells:
+            self._model.apply_cell(r, c, v)
+        self._log({"op": "set", "cells": [[r, self._cols[c], v] for r, c, v in cells]})
+
+    def redo(self):
+        self._apply(self._new)
+
+    def undo(self):
+        self._apply(self._old)
@@ -0,0 +1,363 @@
+# code/core/label_index.py
+# Consolidated SQLite index of every label row in data/labels/*.csv.
+# The per-WAV CSVs stay the source of truth; the index is rebuilt per file
+# when a CSV is saved and reconciled against file versions on startup, so
+# cross-sample queries don't have to open and parse every CSV.
+
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from code.core.csv_writer import csv_version
+from code.core.schema import LABEL_COLUMNS, LABELS, META
+
+DATA_DIR = Path.cwd() / "data"
+LABELS_DIR = DATA_DIR / "labels"
+META_CSV = DATA_DIR / "samples_meta.csv"
+INDEX_DB = DATA_DIR / "labels_index.sqlite"
+
+INDEX_VERSION = 3  # 3: legacy label layouts are migrated instead of skipped
+INDEXED_COLUMNS = [c for c in LABEL_COLUMNS if c != "label_id"]
+SAMPLE_COLUMNS = ["sample_id", "sample_name", "date", "temperature_c", "pressure_kpa", "latitude", "longitude"]
+RESULT_COLUMNS = ["sample_id", "sample_name", "date", "label_class", "start_s", "end_s", "duration_s",
+                  "notes", "temperature_c", "pressure_kpa", "latitude", "longitude", "csv_path"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id        INTEGER PRIMARY KEY,
+    path      TEXT UNIQUE NOT NULL,
+    sample_id TEXT,
+    mtime_ns  INTEGER,
+    size      INTEGER
+);
+CREATE TABLE IF NOT EXISTS labels (
+    file_id     INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    row         INTEGER NOT NULL,
+    sample_id   TEXT,
+    audio_path  TEXT,
+    start_s     REAL,
+    end_s       REAL,
+    duration_s  REAL,
+    label_class TEXT,
+    notes       TEXT,
+    created_at  TEXT
+);
+CREATE TABLE IF NOT EXISTS samples (
+    sample_id     TEXT PRIMARY KEY,
+    sample_name   TEXT,
+    date          TEXT,
+    temperature_c REAL,
+    pressure_kpa  REAL,
+    latitude      REAL,
+    longitude     REAL
+);
+CREATE INDEX IF NOT EXISTS ix_samples_date ON samples(date);
+"""
+
+# secondary indexes on labels; dropped and rebuilt around large bulk loads
+_LABEL_INDEXES = {
+    "ix_labels_class_duration": "labels(label_class, duration_s)",
+    "ix_labels_sample_start": "labels(sample_id, start_s)",
+    "ix_labels_start": "labels(start_s)",
+    "ix_labels_file": "labels(file_id)",
+}
+BULK_FILES = 256  # re-indexing at least this many files at once uses the bulk path
+
+
+@dataclass
+class SegmentFilter:
+    """Search criteria for label rows; None means "any". Ranges are inclusive,
+    dates are ISO "YYYY-MM-DD" strings and `notes` is a substring match."""
+    label_class: str | None = None
+    sample_id: str | None = None
+    min_duration: float | None = None
+    max_duration: float | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    notes: str | None = None
+    min_temperature: float | None = None
+    max_temperature: float | None = None
+    min_pressure: float | None = None
+    max_pressure: float | None = None
+    min_latitude: float | None = None
+    max_latitude: float | None = None
+    min_longitude: float | None = None
+    max_longitude: float | None = None
+
+    def is_empty(self) -> bool:
+        return all(getattr(self, f.name) is None for f in fields(self))
+
+
+# filter field -> SQL condition (one "?" each)
+_CONDITIONS = {
+    "label_class": "l.label_class = ?",
+    "sample_id": "l.sample_id = ?",
+    "min_duration": "l.duration_s >= ?",
+    "max_duration": "l.duration_s <= ?",
+    "date_from": "s.date >= ?",
+    "date_to": "s.date <= ?",
+    "notes": "l.notes LIKE ? ESCAPE '\\'",
+    "min_temperature": "s.temperature_c >= ?",
+    "max_temperature": "s.temperature_c <= ?",
+    "min_pressure": "s.pressure_kpa >= ?",
+    "max_pressure": "s.pressure_kpa <= ?",
+    "min_latitude": "s.latitude >= ?",
+    "max_latitude": "s.latitude <= ?",
+    "min_longitude": "s.longitude >= ?",
+    "max_longitude": "s.longitude <= ?",
+}
+
+
+def _filter_sql(f: SegmentFilter) -> tuple[list[str], list]:
+    where, args = [], []
+    for name, cond in _CONDITIONS.items():
+        value = getattr(f, name)
+        if value is None:
+            continue
+        if name == "notes":
+            value = "%" + value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where.append(cond)
+        args.append(value)
+    return where, args
+
+
+def _read_labels(path: Path) -> pd.DataFrame | None:
+    """Parse a labels CSV into index rows (legacy layouts are migrated); None if unreadable."""
+    try:
+        df = LABELS.read_text(path, INDEXED_COLUMNS)
+    except (OSError, ValueError, pd.errors.EmptyDataError):
+        return None
+    return _index_rows(df.replace("", None), path)
+
+
+def _index_rows(df: pd.DataFrame, path: Path) -> pd.DataFrame | None:
+    if not {"start_s", "end_s"}.issubset(df.columns):
+        return None
+    out = pd.DataFrame(index=df.index)
+    for c in INDEXED_COLUMNS:
+        out[c] = df[c] if c in df.columns else None
+    out["sample_id"] = out["sample_id"].fillna(path.stem.split("__")[0])
+    out["start_s"] = pd.to_numeric(out["start_s"], errors="coerce")
+    out["end_s"] = pd.to_numeric(out["end_s"], errors="coerce")
+    out["duration_s"] = (out["end_s"] - out["start_s"]).abs()
+    out["row"] = np.arange(len(out))
+    out = out[out["duration_s"].notna()]
+    return out.astype(object).where(out.notna(), None)
+
+
+class LabelIndex:
+    """SQLite-backed label index. Writes happen on one worker thread; reads may
+    come from any thread (each thread gets its own connection, WAL mode)."""
+
+    def __init__(self, db_path: Path = INDEX_DB, labels_dir: Path = LABELS_DIR):
+        self.db_path = Path(db_path)
+        self.labels_dir = Path(labels_dir)
+        self._local = threading.local()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="label-index")
+        self._init_db()
+
+    # ----- connections -----
+    def connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, "con", None)
+        if con is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            con = sqlite3.connect(str(self.db_path), timeout=30)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute("PRAGMA foreign_keys=ON")
+            con.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+            self._local.con = con
+        return con
+
+    def _init_db(self):
+        con = self.connection()
+        row = None
+        try:
+            row = con.execute("SELECT value FROM info WHERE key='version'").fetchone()
+        except sqlite3.OperationalError:
+            pass
+        if row is not None and int(row[0]) != INDEX_VERSION:
+            # derived data: just rebuild on format changes
+            con.executescript("DROP TABLE IF EXISTS labels; DROP TABLE IF EXISTS files;")
+        con.executescript(_SCHEMA)
+        self._create_label_indexes(con)
+        con.execute("INSERT OR REPLACE INTO info(key, value) VALUES('version', ?)", (str(INDEX_VERSION),))
+        con.commit()
+
+    # ----- maintenance (worker thread) -----
+    def submit_reconcile(self) -> Future:
+        return self._pool.submit(self.reconcile)
+
+    def submit_update(self, path: Path, df: pd.DataFrame | None = None) -> Future:
+        return self._pool.submit(self.update_file, path, df)
+
+    def submit_remove(self, path: Path) -> Future:
+        return self._pool.submit(self.remove_file, path)
+
+    def reconcile(self) -> tuple[int, int]:
+        """Bring the index in line with the CSVs on disk. Returns (reindexed, removed)."""
+        con = self.connection()
+        known = {p: (m, s) for p, m, s in con.execute("SELECT path, mtime_ns, size FROM files")}
+        on_disk = {str(p): csv_version(p) for p in self.labels_dir.glob("*.csv")}
+        removed = [p for p in known if p not in on_disk]
+        stale = [p for p, v in on_disk.items() if v is not None and list(known.get(p, (None, None))) != v]
+        with con:
+            for p in removed + stale:
+                con.execute("DELETE FROM files WHERE path=?", (p,))
+        bulk = len(stale) >= BULK_FILES
+        if bulk:
+            # filling B-trees row by row gets slow at millions of rows; build them once at the end
+            with con:
+                for name in _LABEL_INDEXES:
+                    con.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            # parse in parallel, insert serially (SQLite has a single writer)
+            with ThreadPoolExecutor() as parse_pool, con:
+                for p, rows in zip(stale, parse_pool.map(lambda p: _read_labels(Path(p)), stale)):
+                    self._insert_file(con, Path(p), rows, on_disk[p])
+        finally:
+            if bulk:
+                with con:
+                    self._create_label_indexes(con)
+        self.sync_meta()
+        return len(stale), len(removed)
+
+    def sync_meta(self, meta_csv: Path = META_CSV) -> bool:
+        """Mirror the searchable columns of samples_meta.csv when it changed."""
+        con = self.connection()
+        version = csv_version(meta_csv)
+        row = con.execute("SELECT value FROM info WHERE key='meta_version'").fetchone()
+        if row is not None and row[0] == str(version):
+            return False
+        # text, parsed to float64 here: SQLite compares the exact values typed in the filters
+        try:
+            meta = META.read_text(meta_csv, SAMPLE_COLUMNS)
+        except (OSError, ValueError, pd.errors.EmptyDataError):
+            meta = META.conform(pd.DataFrame(), SAMPLE_COLUMNS)
+        meta = meta[meta["sample_id"] != ""]
+        meta = meta.drop_duplicates("sample_id", keep="last")
+        meta["date"] = pd.to_datetime(meta["date"], errors="coerce").dt.strftime("%Y-%m-%d")
+        for c in ("temperature_c", "pressure_kpa", "latitude", "longitude"):
+            meta[c] = pd.to_numeric(meta[c], errors="coerce")
+        rows = meta.astype(object).where(meta.notna(), None).itertuples(index=False, name=None)
+        with con:
+            con.execute("DELETE FROM samples")
+            con.executemany(f"INSERT INTO samples VALUES({', '.join('?' * len(SAMPLE_COLUMNS))})", rows)
+            con.execute("INSERT OR REPLACE INTO info(key, value) VALUES('meta_version', ?)", (str(version),))
+        return True
+
+    def submit_sync_meta(self) -> Future:
+        return self._pool.submit(self.sync_meta)
+
+    def update_file(self, path: Path, df: pd.DataFrame | None = None):
+        """Re-index one CSV (pass df to skip re-reading the file just written)."""
+        path = Path(path)
+        version = csv_version(path)
+        if version is None:
+            self.remove_file(path)
+            return
+        rows = _read_labels(path) if df is None else _index_rows(df, path)
+        self._replace_rows(path, rows, version)
+
+    def remove_file(self, path: Path):
+        con = self.connection()
+        with con:
+            con.execute("DELETE FROM files WHERE path=?", (str(path),))
+
+    def _replace_rows(self, path: Path, rows: pd.DataFrame | None, version):
+        con = self.connection()
+        with con:
+            con.execute("DELETE FROM files WHERE path=?", (str(path),))
+            self._insert_file(con, path, rows, version)
+
+    @staticmethod
+    def _insert_file(con: sqlite3.Connection, path: Path, rows: pd.DataFrame | None, version):
+        cur = con.execute(
+            "INSERT INTO files(path, sample_id, mtime_ns, size) VALUES(?, ?, ?, ?)",
+            (str(path), path.stem.split("__")[0], version[0], version[1]),
+        )
+        if rows is None or rows.empty:
+            return
+        file_id = cur.lastrowid
+        cols = ["row"] + INDEXED_COLUMNS[:4] + ["duration_s"] + INDEXED_COLUMNS[4:]
+        con.executemany(
+            f"INSERT INTO labels(file_id, {', '.join(cols)}) VALUES(?, {', '.join('?' * len(cols))})",
+            ((file_id, *r) for r in rows[cols].itertuples(index=False, name=None)),
+        )
+
+    @staticmethod
+    def _create_label_indexes(con: sqlite3.Connection):
+        for name, target in _LABEL_INDEXES.items():
+            con.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    # ----- queries (any thread) -----
+    _SELECT = (
+        "SELECT l.rowid, l.sample_id, s.sample_name, s.date, l.label_class, l.start_s, l.end_s, "
+        "l.duration_s, l.notes, s.temperature_c, s.pressure_kpa, s.latitude, s.longitude, f.path "
+        "FROM labels l JOIN files f ON f.id = l.file_id LEFT JOIN samples s ON s.sample_id = l.sample_id"
+    )
+
+    @staticmethod
+    def _order(f: SegmentFilter) -> list[str]:
+        """Sort key for keyset paging; follows the index the planner picks so a
+        page never has to sort every match first."""
+        return ["l.duration_s", "l.rowid"] if f.label_class is not None else ["l.rowid"]
+
+    def search(self, f: SegmentFilter, after: tuple | None = None, limit: int = 500) -> list[tuple]:
+        """One page of matches as (rowid, *RESULT_COLUMNS) tuples.
+
+        Keyset paging: pass the last row of the previous page as `after`, so
+        each page costs the same no matter how deep the user has scrolled.
+        """
+        where, args = _filter_sql(f)
+        order = self._order(f)
+        if after is not None:
+            key = {"l.rowid": after[0], "l.duration_s": after[1 + RESULT_COLUMNS.index("duration_s")]}
+            where.append(f"({', '.join(order)}) > ({', '.join('?' * len(order))})")
+            args += [key[c] for c in order]
+        sql = self._SELECT
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {', '.join(order)} LIMIT ?"
+        return self.connection().execute(sql, args + [int(limit)]).fetchall()
+
+    def count_matches(self, f: SegmentFilter, cap: int | None = None) -> int:
+        """Number of matches, stopping at `cap` (counting millions of rows is not free)."""
+        where, args = _filter_sql(f)
+        inner = "SELECT 1 FROM labels l LEFT JOIN samples s ON s.sample_id = l.sample_id"
+        if where:
+            inner += " WHERE " + " AND ".join(where)
+        if cap is not None:
+            inner += " LIMIT ?"
+            args.append(int(cap))
+        return self.connection().execute(f"SELECT COUNT(*) FROM ({inner})", args).fetchone()[0]
+
+    def label_classes(self) -> list[str]:
+        """Distinct label classes, sorted."""
+        return [r[0] for r in self.connection().execute(
+            "SELECT DISTINCT label_class FROM labels WHERE label_class IS NOT NULL ORDER BY label_class")]
+
+    def query(self, f: SegmentFilter | None = None, limit: int | None = None) -> pd.DataFrame:
+        """All matches (or the first `limit`) as a dataframe."""
+        rows = self.search(f or SegmentFilter(), limit=-1 if limit is None else limit)
+        return pd.DataFrame([r[1:] for r in rows], columns=RESULT_COLUMNS)
+
+    def count(self) -> int:
+        return self.connection().execute("SELECT COUNT(*) FROM labels").fetchone()[0]
+
+
+_index: LabelIndex | None = None
+
+
+def get_label_index() -> LabelIndex:
+    """The process-wide label index (opened on first use)."""
+    global _index
+    if _index is None:
+        _index = LabelIndex()
+    return _index
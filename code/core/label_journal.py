@@ -0,0 +1,197 @@
+# code/core/label_journal.py
+# Append-only edit journal next to each labels CSV ("<name>.csv.journal").
+# Every label edit is written as one JSON line, fsync'ed in small batches,
+# so unsaved work survives a crash and can be replayed on the next open.
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+from PySide6.QtCore import QObject, QTimer
+
+from code.core.csv_writer import csv_version, temp_path
+from code.core.merge import three_way_merge
+
+JOURNAL_VERSION = 1
+PENDING = "pending"  # header base of a segment whose CSV snapshot is still being written
+
+
+def apply_op(df: pd.DataFrame, op: dict) -> pd.DataFrame:
+    """Apply one journal operation to a labels dataframe (used for crash recovery)."""
+    kind = op.get("op")
+    if kind == "insert":
+        at = max(0, min(int(op["at"]), len(df)))
+        block = pd.DataFrame(op["rows"], columns=df.columns)
+        return pd.concat([df.iloc[:at], block, df.iloc[at:]], ignore_index=True)
+    if kind == "remove":
+        rows = [r for r in op["rows"] if 0 <= r < len(df)]
+        return df.drop(df.index[rows]).reset_index(drop=True)
+    if kind == "set":
+        for row, col, value in op["cells"]:
+            if 0 <= row < len(df) and col in df.columns:
+                df.iat[row, df.columns.get_loc(col)] = value
+        return df
+    return df
+
+
+def replay(df: pd.DataFrame, ops: list[dict]) -> pd.DataFrame:
+    """Apply journaled operations to the CSV on disk (crash recovery).
+
+    Ops after a "base" record apply to that snapshot rather than to `df`: it is
+    what we saved when the save had to merge in another annotator's rows. The
+    edited snapshot is then three-way merged into `df`, like the next save would.
+    """
+    base = key = None
+    cur = df
+    for op in ops:
+        if op.get("op") == "base":
+            if base is not None:
+                df = three_way_merge(base, cur, df, key)[0]
+            base = pd.DataFrame(op["rows"], columns=df.columns)
+            key, cur = op["key"], base.copy()
+        else:
+            cur = apply_op(cur, op)
+    if base is not None:
+        cur = three_way_merge(base, cur, df, key)[0][list(df.columns)]
+    return cur
+
+
+class LabelJournal(QObject):
+    """Per-CSV journal with batched fsync and checkpoint/commit around compaction.
+
+    Layout: the first line of a segment is a header recording which CSV version
+    (mtime_ns, size) its operations apply to. checkpoint() rotates the live
+    segment to "<journal>.old" before the full CSV is rewritten in the background;
+    commit_checkpoint() then stamps the new CSV version and drops the old segment.
+    Ops are positional, so if that write merged in others' rows, the snapshot we
+    saved is journaled after the header as a "base" record (see replay()).
+    """
+
+    FSYNC_BATCH = 32         # fsync after this many unsynced ops …
+    FSYNC_INTERVAL_MS = 500  # … or this long after the first unsynced op
+
+    def __init__(self, csv_path: Path, parent=None):
+        super().__init__(parent)
+        self.csv_path = Path(csv_path)
+        self.path = self.csv_path.with_name(self.csv_path.name + ".journal")
+        self.old_path = self.csv_path.with_name(self.csv_path.name + ".journal.old")
+        self._fh = None
+        self._unsynced = 0
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(self.FSYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self.sync)
+
+    # ----- reading / recovery -----
+    @staticmethod
+    def _read_segment(path: Path):
+        """Return (header, ops). A torn last line from a crash is ignored."""
+        header, ops = None, []
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    if header is None and "journal" in rec:
+                        header = rec
+                    else:
+                        ops.append(rec)
+        except OSError:
+            pass
+        return header, ops
+
+    def pending_ops(self) -> list[dict]:
+        """Operations not yet folded into the CSV on disk."""
+        base = csv_version(self.csv_path)
+        ops: list[dict] = []
+        if self.old_path.exists():
+            hdr, body = self._read_segment(self.old_path)
+            if hdr and hdr.get("base") == base:
+                ops += body
+        if self.path.exists():
+            hdr, body = self._read_segment(self.path)
+            if hdr and hdr.get("base") in (base, PENDING):
+                ops += body
+        return ops
+
+    # ----- writing -----
+    def _open(self, base):
+        self._fh = open(self.path, "a", encoding="utf-8")
+        if self._fh.tell() == 0:
+            self._write({"journal": JOURNAL_VERSION, "csv": self.csv_path.name, "base": base})
+            self.sync()
+
+    def _write(self, rec: dict):
+        self._fh.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+        self._fh.flush()
+
+    def append(self, op: dict):
+        if self._fh is None:
+            self._open(csv_version(self.csv_path))
+        self._write(op)
+        self._unsynced += 1
+        if self._unsynced >= self.FSYNC_BATCH:
+            self.sync()
+        elif not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    def sync(self):
+        self._sync_timer.stop()
+        if self._fh is not None and self._unsynced:
+            os.fsync(self._fh.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        self.sync()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def discard(self):
+        """Forget all journaled edits (user chose not to keep them)."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.old_path.unlink(missing_ok=True)
+
+    # ----- compaction -----
+    def checkpoint(self):
+        """Rotate the live segment aside before the CSV is rewritten."""
+        self.close()
+        if self.path.exists():
+            if self.old_path.exists():
+                # a previous compaction failed: keep its ops in front of ours
+                _, body = self._read_segment(self.path)
+                with open(self.old_path, "a", encoding="utf-8") as fh:
+                    for rec in body:
+                        fh.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                self.path.unlink()
+            else:
+                os.replace(self.path, self.old_path)
+        self._open(PENDING)
+
+    def commit_checkpoint(self, version, snapshot: pd.DataFrame | None = None, key: list[str] | None = None):
+        """The CSV snapshot is on disk: stamp its version and drop the old segment.
+
+        Pass the saved `snapshot` and merge `key` when the write merged, so the
+        ops after the checkpoint (relative to the snapshot) still replay correctly.
+        """
+        self.close()
+        _, body = self._read_segment(self.path)
+        if body and snapshot is not None:
+            body.insert(0, {"op": "base", "key": key, "rows": snapshot.to_dict("records")})
+        tmp = temp_path(self.path)  # another editor process may be committing the same journal
+        with open(tmp, "x", encoding="utf-8") as fh:
+            fh.write(json.dumps({"journal": JOURNAL_VERSION, "csv": self.csv_path.name, "base": version}) + "\n")
+            for rec in body:
+                fh.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+        self.old_path.unlink(missing_ok=True)
+        if not body:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,130 @@
+# code/core/label_stats.py
+# Aggregate statistics over every label CSV under data/labels/.
+# Files are parsed in a thread pool and cached per (mtime_ns, size), so a
+# refresh after one file changed re-reads only that file; the group-bys
+# themselves are vectorized pandas operations over the concatenated rows.
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from code.core.csv_writer import csv_version
+from code.core.instrument import traced
+from code.core.schema import LABELS, META
+
+DATA_DIR = Path.cwd() / "data"
+LABELS_DIR = DATA_DIR / "labels"
+META_CSV = DATA_DIR / "samples_meta.csv"
+
+STAT_COLUMNS = ["sample_id", "start_s", "end_s", "label_class", "created_at"]
+ROW_COLUMNS = ["sample_id", "label_class", "created_day", "start_s", "duration_s"]
+
+# group-by presets offered in the UI: name -> key columns
+GROUPINGS = {
+    "class": ["label_class"],
+    "sample": ["sample_id", "label_class"],
+    "day": ["day", "label_class"],
+}
+
+
+def _read_label_file(path: Path) -> pd.DataFrame:
+    """Parse one labels CSV into compact columns (legacy layouts are migrated; foreign files yield no rows)."""
+    try:
+        df = LABELS.read_text(path, STAT_COLUMNS)
+    except (OSError, ValueError, pd.errors.EmptyDataError):
+        return pd.DataFrame(columns=ROW_COLUMNS)
+    start = pd.to_numeric(df["start_s"], errors="coerce").astype(np.float32)
+    end = pd.to_numeric(df["end_s"], errors="coerce").astype(np.float32)
+    out = pd.DataFrame({
+        "sample_id": df["sample_id"].replace("", path.stem.split("__")[0]),
+        "label_class": df["label_class"],
+        "created_day": df["created_at"].str.slice(0, 10),
+        "start_s": start,
+        "duration_s": (end - start).abs(),
+    })
+    return out[out["duration_s"].notna()]
+
+
+class LabelStatsEngine:
+    """Incrementally cached scan of all label CSVs plus group-by summaries."""
+
+    def __init__(self, labels_dir: Path = LABELS_DIR, meta_csv: Path = META_CSV, max_workers: int | None = None):
+        self.labels_dir = Path(labels_dir)
+        self.meta_csv = Path(meta_csv)
+        self.max_workers = max_workers
+        self._files: dict[str, tuple[list, pd.DataFrame]] = {}  # path -> (version, rows)
+        self._meta: tuple[list | None, pd.Series] = (None, pd.Series(dtype=str))
+        self._frame: pd.DataFrame | None = None
+
+    # ----- scanning -----
+    @traced("stats.refresh")
+    def refresh(self) -> int:
+        """Re-read new/changed files, forget deleted ones. Returns the number of files parsed."""
+        current = {str(p): csv_version(p) for p in sorted(self.labels_dir.glob("*.csv"))}
+        stale = [p for p, v in current.items() if self._files.get(p, (None,))[0] != v]
+        removed = [p for p in self._files if p not in current]
+        for p in removed:
+            del self._files[p]
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for p, rows in zip(stale, pool.map(lambda p: _read_label_file(Path(p)), stale)):
+                    self._files[p] = (current[p], rows)
+        meta_changed = self._refresh_meta()
+        if stale or removed or meta_changed:
+            self._frame = None
+        return len(stale)
+
+    def _refresh_meta(self) -> bool:
+        """sample_id -> sample date from samples_meta.csv (used for per-day stats)."""
+        version = csv_version(self.meta_csv)
+        if version == self._meta[0]:
+            return False
+        meta = META.format(META.read(self.meta_csv, ["sample_id", "date"]))
+        meta = meta[meta["sample_id"] != ""].drop_duplicates("sample_id", keep="last")
+        self._meta = (version, meta.set_index("sample_id")["date"])
+        return True
+
+    def frame(self) -> pd.DataFrame:
+        """All label rows (sample_id, label_class, day, start_s, duration_s)."""
+        if self._frame is None:
+            parts = [rows for _, rows in self._files.values() if len(rows)]
+            if parts:
+                df = pd.concat(parts, ignore_index=True)
+            else:
+                df = pd.DataFrame(columns=ROW_COLUMNS)
+            day = df["sample_id"].map(self._meta[1])
+            df["day"] = day.where(day.notna() & (day != ""), df["created_day"]).fillna("")
+            for c in ("sample_id", "label_class", "day"):
+                df[c] = df[c].astype("category")
+            self._frame = df.drop(columns=["created_day"])
+        return self._frame
+
+    # ----- aggregates -----
+    def summary(self, by: str = "class") -> pd.DataFrame:
+        """count / total / mean / median / p90 duration (s) per group."""
+        keys = GROUPINGS[by]
+        df = self.frame()
+        cols = keys + ["count", "total_s", "mean_s", "median_s", "p90_s"]
+        if df.empty:
+            return pd.DataFrame(columns=cols)
+        g = df.groupby(keys, observed=True, sort=True)["duration_s"]
+        agg = g.agg(["size", "sum", "mean"])
+        q = g.quantile([0.5, 0.9]).unstack()
+        out = pd.DataFrame({
+            "count": agg["size"].astype(np.int64),
+            "total_s": agg["sum"].astype(np.float64).round(3),
+            "mean_s": agg["mean"].astype(np.float64).round(3),
+            "median_s": q[0.5].astype(np.float64).round(3),
+            "p90_s": q[0.9].astype(np.float64).round(3),
+        }).reset_index()
+        return out[cols]
+
+    def totals(self) -> dict:
+        df = self.frame()
+        return {
+            "files": len(self._files),
+            "segments": int(len(df)),
+            "total_s": float(df["duration_s"].sum()) if len(df) else 0.0,
+        }
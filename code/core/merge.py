@@ -0,0 +1,71 @@
+# code/core/merge.py
+# Row-level three-way merge of CSV tables (base / ours / theirs), used when
+# another annotator changed a file between our read and our write.
+
+import pandas as pd
+
+
+def _keyed(df: pd.DataFrame, key: list[str]) -> dict:
+    """Map (key values…, occurrence) -> row dict; occurrence disambiguates duplicate keys."""
+    if df is None or df.empty:
+        return {}
+    df = df.fillna("").astype(str)
+    for c in key:
+        if c not in df.columns:
+            df[c] = ""
+    occ = df.groupby(key, sort=False).cumcount()
+    rows = df.to_dict("records")
+    return {tuple(r[c] for c in key) + (int(n),): r for r, n in zip(rows, occ)}
+
+
+def _merge_fields(base: dict, ours: dict, theirs: dict, columns: list[str]) -> tuple[dict, int]:
+    row, conflicts = {}, 0
+    for c in columns:
+        b, o, t = base.get(c, ""), ours.get(c, ""), theirs.get(c, "")
+        if o == t or t == b:
+            row[c] = o
+        elif o == b:
+            row[c] = t
+        else:
+            row[c] = o  # both changed the same field: ours wins
+            conflicts += 1
+    return row, conflicts
+
+
+def three_way_merge(base: pd.DataFrame, ours: pd.DataFrame, theirs: pd.DataFrame,
+                    key: list[str]) -> tuple[pd.DataFrame, int]:
+    """Merge our edits of `base` into `theirs`. Returns (merged, n_conflicts).
+
+    Rows are matched on `key`. Field-level: a side that left a field unchanged
+    takes the other side's value; if both changed it, ours wins (conflict).
+    Row-level: additions from both sides are kept; a deletion applies only if the
+    other side did not edit that row (edit beats delete).
+    """
+    columns = list(ours.columns) + [c for c in theirs.columns if c not in ours.columns]
+    b, o, t = _keyed(base, key), _keyed(ours, key), _keyed(theirs, key)
+    out, conflicts = [], 0
+
+    for k, trow in t.items():
+        if k in o:
+            row, n = _merge_fields(b.get(k, trow), o[k], trow, columns)
+            out.append(row)
+            conflicts += n
+        elif k in b:
+            if trow != b[k]:  # we deleted, they edited
+                out.append(trow)
+                conflicts += 1
+        else:
+            out.append(trow)  # they added
+
+    for k, orow in o.items():
+        if k in t:
+            continue
+        if k in b:
+            if orow != b[k]:  # they deleted, we edited
+                out.append(orow)
+                conflicts += 1
+        else:
+            out.append(orow)  # we added
+
+    merged = pd.DataFrame(out, columns=columns)
+    return merged, conflicts
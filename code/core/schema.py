@@ -0,0 +1,317 @@
+# code/core/schema.py
+# Schema registry for the project's CSV tables (metadata, labels, sample types).
+# Each TableSchema knows its column order, in-memory dtypes, current version and
+# how to upgrade older layouts, which it recognises from the header alone. The
+# CSVs themselves stay plain text (the writer round-trips them as strings).
+
+import datetime as dt
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
+
+DATA_DIR = Path.cwd() / "data"
+META_CSV = DATA_DIR / "samples_meta.csv"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Recognise a legacy layout by its header and upgrade it to the next version."""
+    version: int
+    signature: frozenset[str]                        # lower-case columns that identify this layout
+    upgrade: Callable[[pd.DataFrame], pd.DataFrame]  # text frame -> text frame
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Column order, dtypes, version and migrations of one CSV table.
+
+    dtypes values: numpy/pandas dtypes, or "date" (calendar day), "datetime"
+    (timestamp) and "time" (time of day as a timedelta). Unlisted columns are text.
+    Migrations only add or rename columns; a column present under its current
+    name already holds current data.
+    """
+    name: str
+    version: int
+    columns: tuple[str, ...]
+    dtypes: dict = field(default_factory=dict)
+    migrations: tuple[Migration, ...] = ()           # oldest first
+
+    # ----- versions -----
+    def detect_version(self, header) -> int:
+        """Layout version of a file with this header (current if unrecognised)."""
+        header = {c.strip().lower() for c in header}
+        if {c.lower() for c in self.columns} <= header:
+            return self.version
+        for m in reversed(self.migrations):
+            if m.signature <= header:
+                return m.version
+        return self.version
+
+    def migrate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Upgrade a text frame from the version its columns show; returns it conformed."""
+        df = self._match_case(df)
+        v = self.detect_version(df.columns)
+        for m in self.migrations:
+            if m.version >= v:
+                df = m.upgrade(df)
+        return self.conform(df)
+
+    # ----- shaping -----
+    def _select(self, columns) -> list[str]:
+        return list(self.columns) if columns is None else [c for c in columns if c in self.columns]
+
+    def _match_case(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Accept headers that differ only in case/whitespace ("type" for "Type")."""
+        canon = {c.lower(): c for c in self.columns}
+        ren = {c: canon[c.strip().lower()] for c in df.columns
+               if c not in canon.values() and c.strip().lower() in canon}
+        return df.rename(columns=ren) if ren else df
+
+    def conform(self, df: pd.DataFrame, columns: list[str] | None = None) -> pd.DataFrame:
+        """Text frame with exactly `columns` (default: all, in schema order); missing ones blank."""
+        cols = self._select(columns)
+        out = df.reindex(columns=cols, fill_value="")
+        return out.fillna("") if out.isna().to_numpy().any() else out
+
+    @staticmethod
+    def header(path: Path) -> list[str]:
+        return list(pd.read_csv(path, nrows=0, encoding="utf-8").columns)
+
+    # ----- loading -----
+    def read_text(self, path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+        """Load as text in the current layout; reads only `columns` unless a migration needs the rest."""
+        try:
+            header = self.header(path)
+        except (OSError, ValueError):
+            return self.conform(pd.DataFrame(), columns)
+        wanted = {c.lower() for c in (self.columns if columns is None else columns)}
+        if self.detect_version(header) == self.version or wanted <= {c.strip().lower() for c in header}:
+            # current layout, or an older one that already has every column asked for
+            df = pd.read_csv(path, usecols=lambda c: c.strip().lower() in wanted,
+                             dtype=str, keep_default_na=False, encoding="utf-8")
+            return self.conform(self._match_case(df), columns)
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8")
+        return self.conform(self.migrate(df), columns)
+
+    def read(self, path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+        """Load with schema dtypes (only `columns`, if given); bad values become missing."""
+        cols = self._select(columns)
+        try:
+            header = self.header(path)
+        except (OSError, ValueError):
+            return self.coerce(pd.DataFrame(), cols)
+        if not set(cols) <= set(header):
+            # legacy layout or odd header casing: take the text path, then convert
+            return self.coerce(self.read_text(path, cols).replace("", None), cols)
+        read_dtypes = {c: _read_dtype(self.dtypes.get(c)) for c in cols}
+        try:
+            raw = pd.read_csv(path, usecols=lambda c: c in read_dtypes, dtype=read_dtypes, encoding="utf-8")
+        except ValueError:
+            # a malformed number somewhere: parse as text and coerce column by column
+            raw = pd.read_csv(path, usecols=lambda c: c in read_dtypes, dtype=str, encoding="utf-8")
+        return self.coerce(raw, cols)
+
+    # ----- typed <-> text -----
+    def coerce(self, df: pd.DataFrame, columns: list[str] | None = None) -> pd.DataFrame:
+        """Typed frame with `columns` (default: all, in schema order)."""
+        cols = self._select(columns)
+        out = {}
+        for c in cols:
+            raw = df[c] if c in df.columns else pd.Series([None] * len(df), index=df.index, dtype=object)
+            out[c] = _coerce_column(raw, self.dtypes.get(c))
+        return pd.DataFrame(out, index=df.index)
+
+    def format(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Typed frame -> display/CSV text, every cell a str (missing values become "").
+
+        Numbers are written back in their dtype's shortest form, which need not be
+        the text they were read from; use read_text() where the file's text matters.
+        """
+        out = {}
+        for c in df.columns:
+            s, kind = df[c], self.dtypes.get(c)
+            # numpy's datetime_as_string is far faster than .dt.strftime on big frames
+            if kind in ("date", "datetime"):
+                unit = "D" if kind == "date" else "s"
+                text = pd.Series(np.datetime_as_string(s.to_numpy().astype(f"datetime64[{unit}]")), index=s.index)
+            elif kind == "time":
+                stamp = (s.to_numpy() + np.datetime64(0, "ns")).astype("datetime64[s]")
+                text = pd.Series(np.datetime_as_string(stamp), index=s.index).str.slice(11)
+            elif s.dtype.kind == "f":
+                text = s.astype(str)  # shortest repr at the column's precision (float32 25.3 -> "25.3")
+            else:
+                text = s.astype(object).map(str)  # Int32 and categories included
+            out[c] = text.where(s.notna(), "").astype(object)
+        return pd.DataFrame(out, index=df.index)
+
+
+def _read_dtype(kind):
+    """dtype handed to read_csv: numbers are converted by the C parser, the rest read as text."""
+    if kind == "Int32":
+        return np.float64
+    if kind in (np.float32, np.float64, "category"):
+        return kind
+    return str
+
+
+def _coerce_column(s: pd.Series, kind) -> pd.Series:
+    """Vectorized conversion to a schema dtype; unparsable values become missing."""
+    if kind in ("date", "datetime"):
+        return pd.to_datetime(s, format="ISO8601", errors="coerce")
+    if kind == "time":
+        return pd.to_datetime(s, format="%H:%M:%S", errors="coerce") - pd.Timestamp("1900-01-01")
+    if kind == "Int32":
+        num = pd.to_numeric(s, errors="coerce")
+        return num.where(num == num.round()).astype("Int32")
+    if kind == "category":
+        s = s.astype("category")
+        if s.isna().any():
+            s = s.cat.add_categories([""] if "" not in s.cat.categories else []).fillna("")
+        return s
+    if kind is None:
+        return s.fillna("").astype(object)
+    return pd.to_numeric(s, errors="coerce").astype(kind)
+
+
+# ----- samples_meta.csv -----
+def _meta_v1_to_v2(df: pd.DataFrame) -> pd.DataFrame:
+    # v1 had only identity/time columns; the measurements start out blank
+    for c in ("temperature_c", "pressure_kpa", "latitude", "longitude", "count"):
+        if c not in df.columns:
+            df[c] = ""
+    return df
+
+
+# Coordinates stay float64: float32 resolves only ~1.7 m at ±180° longitude,
+# coarser than the 6 decimals the form accepts.
+META = TableSchema(
+    name="samples_meta",
+    version=2,
+    columns=(
+        "sample_id", "date", "time",
+        "temperature_c", "pressure_kpa",
+        "latitude", "longitude",
+        "count", "sample_name",
+        "labels_csv", "created_at",
+    ),
+    dtypes={
+        "date": "date",
+        "time": "time",
+        "temperature_c": np.float32,
+        "pressure_kpa": np.float32,
+        "latitude": np.float64,
+        "longitude": np.float64,
+        "count": "Int32",
+        "sample_name": "category",
+        "created_at": "datetime",
+    },
+    migrations=(
+        Migration(1, frozenset({"sample_id", "sample_name", "date", "time", "labels_csv", "created_at"}),
+                  _meta_v1_to_v2),
+    ),
+)
+META_COLUMNS = list(META.columns)
+# columns shown by the sample list views (Edit hub, Reports > Metadata)
+META_LIST_COLUMNS = ["sample_id", "sample_name", "date", "time", "labels_csv", "created_at"]
+
+
+# ----- per-recording label CSVs -----
+def _labels_v1_to_v2(df: pd.DataFrame) -> pd.DataFrame:
+    # v1 stored point labels as (time_ms, class)
+    sec = pd.to_numeric(df["time_ms"], errors="coerce") / 1000.0
+    text = sec.map(lambda v: "" if v != v else f"{v:.3f}")
+    out = df.drop(columns=["time_ms"]).rename(columns={"class": "label_class"})
+    out["start_s"] = text
+    out["end_s"] = text
+    return out
+
+
+def _labels_v2_to_v3(df: pd.DataFrame) -> pd.DataFrame:
+    # v3 gives every row a stable label_id to merge on. Legacy rows derive theirs
+    # from the old merge key (plus occurrence), so annotators migrating the same
+    # file independently assign the same ids.
+    cols = ["created_at", "start_s", "end_s"]
+    key = df.reindex(columns=cols, fill_value="").fillna("")
+    key["n"] = key.groupby(cols, sort=False).cumcount().astype(str)
+    df["label_id"] = [f"{h:016x}" for h in pd.util.hash_pandas_object(key, index=False)]
+    return df
+
+
+def new_label_id() -> str:
+    return uuid.uuid4().hex
+
+
+LABELS = TableSchema(
+    name="labels",
+    version=3,
+    columns=("sample_id", "audio_path", "start_s", "end_s", "label_class", "notes", "created_at", "label_id"),
+    dtypes={"start_s": np.float64, "end_s": np.float64, "label_class": "category"},
+    migrations=(
+        Migration(1, frozenset({"time_ms", "class"}), _labels_v1_to_v2),
+        Migration(2, frozenset({"start_s", "end_s"}), _labels_v2_to_v3),
+    ),
+)
+LABEL_COLUMNS = list(LABELS.columns)
+
+
+# ----- sample_list.csv (class catalogue) -----
+SAMPLE_TYPES = TableSchema(
+    name="sample_types",
+    version=1,
+    columns=("ID", "Type", "Factor", "Value", "Count"),
+)
+
+SCHEMAS = {s.name: s for s in (META, LABELS, SAMPLE_TYPES)}
+
+
+# ----- metadata record validation -----
+class MetaRecord(BaseModel):
+    """One metadata row as entered in the form (text input is parsed)."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    sample_id: str = Field(min_length=1)
+    date: dt.date
+    time: dt.time | None = None
+    temperature_c: float | None = Field(None, ge=-273.15, allow_inf_nan=False)
+    pressure_kpa: float | None = Field(None, allow_inf_nan=False)
+    latitude: float | None = Field(None, ge=-90.0, le=90.0, allow_inf_nan=False)
+    longitude: float | None = Field(None, ge=-180.0, le=180.0, allow_inf_nan=False)
+    count: int | None = Field(None, ge=0)
+    sample_name: str = Field(min_length=1)
+    labels_csv: str = ""
+    created_at: dt.datetime | None = None
+
+    @field_validator("time", "temperature_c", "pressure_kpa", "latitude", "longitude",
+                     "count", "created_at", mode="before")
+    @classmethod
+    def _blank_is_missing(cls, v):
+        return None if isinstance(v, str) and not v.strip() else v
+
+
+_RECORDS = TypeAdapter(list[MetaRecord])
+
+_FIELD_NAMES = {
+    "sample_id": "Sample ID", "date": "Date", "time": "Time", "temperature_c": "Temperature",
+    "pressure_kpa": "Pressure", "latitude": "Latitude", "longitude": "Longitude",
+    "count": "Count", "sample_name": "Sample Name", "labels_csv": "Labels CSV", "created_at": "Created at",
+}
+
+
+def validate_records(records: list[dict]) -> list[str]:
+    """Validate many metadata rows in one pydantic call; returns readable error lines."""
+    try:
+        _RECORDS.validate_python(records)
+    except ValidationError as e:
+        errors = []
+        for err in e.errors():
+            loc = err["loc"]
+            name = _FIELD_NAMES.get(loc[1], loc[1]) if len(loc) > 1 else "row"
+            prefix = f"Row {loc[0] + 1}: " if len(records) > 1 else ""
+            errors.append(f"{prefix}{name}: {err['msg']}")
+        return errors
+    return []
@@ -0,0 +1,152 @@
+# code/core/watchdog.py
+# Event-loop responsiveness watchdog. A QTimer on the GUI thread bumps a
+# heartbeat; a monitor thread notices when it stops. While the GUI thread is
+# blocked, the monitor samples its Python stack (sys._current_frames) and,
+# once the loop recovers, logs how long it froze and where, to
+# data/logs/freezes.jsonl and, when tracing is on, as a "stall" record in the
+# trace. It is the only heartbeat monitor in the app.
+
+import json
+import os
+import sys
+import threading
+import traceback
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from time import monotonic
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from code.core.instrument import get_tracer
+
+DATA_DIR = Path.cwd() / "data"
+FREEZE_LOG = DATA_DIR / "logs" / "freezes.jsonl"
+ENV_VAR = "AUDIO_LABELER_WATCHDOG_MS"  # freeze threshold; 0 disables the watchdog
+
+THRESHOLD_MS = 500   # blocked at least this long counts as a freeze
+TRACE_THRESHOLD_MS = 250  # tighter threshold while tracing
+HEARTBEAT_MS = 100   # GUI-thread tick
+SAMPLE_MS = 100      # stack sampling period while frozen
+MAX_SAMPLES = 600    # stop sampling after ~a minute of one freeze
+STACK_LIMIT = 30     # frames kept per stack
+
+
+class Watchdog(QObject):
+    """Detects and explains GUI freezes; create it on the GUI thread, then start()."""
+
+    def __init__(self, threshold_ms: int = THRESHOLD_MS, log_path: Path = FREEZE_LOG, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000.0
+        self.log_path = Path(log_path)
+        self._gui_ident = threading.get_ident()
+        self._beat = monotonic()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._on_heartbeat)
+
+    def start(self):
+        self._beat = monotonic()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._monitor, name="gui-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ----- GUI thread -----
+    def _on_heartbeat(self):
+        self._beat = monotonic()  # a float store is atomic; the monitor only reads it
+
+    # ----- monitor thread -----
+    def _monitor(self):
+        while not self._stop.wait(SAMPLE_MS / 1000.0):
+            beat = self._beat
+            if monotonic() - beat < self.threshold:
+                continue
+            stacks, taken = Counter(), 0
+            while self._beat == beat and not self._stop.is_set():
+                if taken < MAX_SAMPLES:
+                    stack = self._gui_stack()
+                    if stack:
+                        stacks[stack] += 1
+                    taken += 1
+                self._stop.wait(SAMPLE_MS / 1000.0)
+            if self._beat != beat:
+                # the tick that ended the freeze was itself due HEARTBEAT_MS after `beat`
+                self._report(beat, max(self._beat - beat - HEARTBEAT_MS / 1000.0, self.threshold), stacks)
+
+    def _gui_stack(self) -> str | None:
+        frame = sys._current_frames().get(self._gui_ident)
+        if frame is None:
+            return None
+        return "".join(traceback.format_stack(frame, limit=STACK_LIMIT))
+
+    def _report(self, beat: float, blocked_s: float, stacks: Counter):
+        samples = sum(stacks.values())
+        ranked = [{"share": round(n / samples, 3), "stack": s} for s, n in stacks.most_common(5)] if samples else []
+        rec = {
+            "type": "freeze",
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "ms": round(blocked_s * 1000.0),
+            "samples": samples,
+            "where": _innermost_app_frame(ranked[0]["stack"]) if ranked else None,
+            "stacks": ranked,
+        }
+        print(f"[WARN] GUI thread blocked for {rec['ms']} ms" + (f" in {rec['where']}" if rec["where"] else ""))
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(rec) + "\n")
+        except OSError as e:
+            print("[WARN] Could not write freeze log:", e)
+        tracer = get_tracer()
+        if tracer is not None:  # the stacks stay in the freeze log
+            tracer.record({"type": "stall", "name": "event loop stalled", "ms": rec["ms"],
+                           "samples": samples, "where": rec["where"]})
+
+
+def _innermost_app_frame(stack: str) -> str | None:
+    """'function (file:line)' of the deepest frame in this project's code."""
+    here = str(Path(__file__).resolve().parents[2])
+    lines = [ln for ln in stack.splitlines() if ln.startswith('  File "')]
+    for ln in reversed(lines):
+        path = ln.split('"')[1]
+        if path.startswith(here) and os.sep + "site-packages" + os.sep not in path:
+            lineno = ln.split(", line ")[1].split(",")[0]
+            func = ln.rsplit(", in ", 1)[1]
+            return f"{func} ({Path(path).name}:{lineno})"
+    return None
+
+
+_watchdog: Watchdog | None = None
+
+
+def start_watchdog() -> Watchdog | None:
+    """Start the process-wide watchdog unless $AUDIO_LABELER_WATCHDOG_MS is 0.
+
+    While tracing it always runs, at TRACE_THRESHOLD_MS at most, since it also
+    reports the trace's stalls.
+    """
+    global _watchdog
+    if _watchdog is None:
+        try:
+            threshold = int(os.environ.get(ENV_VAR, THRESHOLD_MS))
+        except ValueError:
+            threshold = THRESHOLD_MS
+        if get_tracer() is not None:
+            threshold = min(threshold, TRACE_THRESHOLD_MS) if threshold > 0 else TRACE_THRESHOLD_MS
+        if threshold <= 0:
+            return None
+        _watchdog = Watchdog(threshold)
+        _watchdog.start()
+    return _watchdog
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 import shutil
@@ -8,9 +9,13 @@ import pandas as pd
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QLineEdit, QPushButton,
-    QFrame, QFileDialog, QMessageBox, QTableView
+    QFrame, QFileDialog, QMessageBox, QTableView, QComboBox, QLabel
 )
 
+from code.core.csv_writer import get_writer
+from code.core.instrument import traced
+from code.core.label_stats import LabelStatsEngine
+from code.core.schema import META, META_LIST_COLUMNS
 from code.ui.widgets.pandas_model import PandasModel
 
 # Project paths
@@ -18,11 +23,10 @@ DATA_DIR = Path.cwd() / "data"
 LABELS_DIR = DATA_DIR / "labels"
 META_CSV = DATA_DIR / "samples_meta.csv"
 
-META_COLUMNS = ["sample_id", "sample_name", "date", "time", "labels_csv", "created_at"]
-
 
 class CsvReportsPage(QWidget):
     sig_go_home = Signal()
+    _sig_stats_ready = Signal(object, object, str, bool)  # (summary, totals, error, rescanned) from the stats worker
 
     def __init__(self) -> None:
         super().__init__()
@@ -59,8 +63,13 @@ class CsvReportsPage(QWidget):
         self.tab_labels = QWidget()
         self._build_labels_tab(self.tab_labels)
 
+        # --- Tab: Statistics ---
+        self.tab_stats = QWidget()
+        self._build_stats_tab(self.tab_stats)
+
         self.tabs.addTab(self.tab_meta, "Metadata")
         self.tabs.addTab(self.tab_labels, "Label CSVs")
+        self.tabs.addTab(self.tab_stats, "Statistics")
 
         # --- Root ---
         root = QVBoxLayout(self)
@@ -72,6 +81,15 @@ class CsvReportsPage(QWidget):
         # Data state
         self._meta_model: PandasModel | None = None
         self._labels_model: PandasModel | None = None
+        self._stats_model: PandasModel | None = None
+
+        # Stats engine: touched only on its one worker, so refreshes never overlap
+        # and summaries never see a half-updated cache; the cache persists
+        self._stats = LabelStatsEngine()
+        self._stats_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="label-stats")
+        self._stats_busy = False
+        self._sig_stats_ready.connect(self._show_stats)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         self.open()  # initial load
 
@@ -150,27 +168,68 @@ class CsvReportsPage(QWidget):
         self.labels_export.clicked.connect(self._export_labels_selected)
         self.labels_search.returnPressed.connect(self._apply_labels_search)
 
+    def _build_stats_tab(self, tab: QWidget) -> None:
+        v = QVBoxLayout(tab)
+        v.setContentsMargins(0, 0, 0, 0)
+        v.setSpacing(10)
+
+        bar = QFrame()
+        bar.setObjectName("toolCard")
+        hb = QHBoxLayout(bar)
+        hb.setContentsMargins(12, 10, 12, 10)
+        hb.setSpacing(8)
+
+        self.stats_group = QComboBox()
+        self.stats_group.addItem("By class", "class")
+        self.stats_group.addItem("By sample × class", "sample")
+        self.stats_group.addItem("By day × class", "day")
+        self.stats_summary = QLabel("")
+        self.stats_summary.setProperty("class", "subtle")
+        self.stats_reload = QPushButton("↻ Refresh")
+        self.stats_reload.setProperty("variant", "soft")
+        self.stats_export = QPushButton("⬇ Export Table…")
+        self.stats_export.setProperty("variant", "primary")
+
+        hb.addWidget(self.stats_group)
+        hb.addWidget(self.stats_summary, 1)
+        hb.addWidget(self.stats_reload)
+        hb.addWidget(self.stats_export)
+
+        self.stats_table = QTableView()
+        self.stats_table.setSelectionBehavior(QTableView.SelectRows)
+        self.stats_table.horizontalHeader().setStretchLastSection(True)
+        self.stats_table.verticalHeader().setDefaultSectionSize(32)
+        self.stats_table.setSortingEnabled(False)
+
+        v.addWidget(bar)
+        v.addWidget(self.stats_table, 1)
+
+        # Wire
+        self.stats_reload.clicked.connect(self._refresh_stats)
+        self.stats_group.currentIndexChanged.connect(lambda _: self._compute_stats(rescan=False))
+        self.stats_export.clicked.connect(self._export_stats)
+
     # ----------------- Lifecycle -----------------
     def open(self) -> None:
         self._load_meta()
         self._load_labels()
+        if self.tabs.currentWidget() is self.tab_stats:
+            self._refresh_stats()
 
     # ----------------- Loading -----------------
+    @traced("meta.load")
     def _load_meta(self) -> None:
+        get_writer().flush(META_CSV)
         try:
-            df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
+            df = META.read_text(META_CSV, META_LIST_COLUMNS)
         except Exception:
-            df = pd.DataFrame(columns=META_COLUMNS)
-
-        for c in META_COLUMNS:
-            if c not in df.columns:
-                df[c] = ""
-        df = df[META_COLUMNS]
+            df = META.conform(pd.DataFrame(), META_LIST_COLUMNS)
 
         self._meta_model = PandasModel(df)
         self.meta_table.setModel(self._meta_model)
         self.meta_table.resizeColumnsToContents()
 
+    @traced("labels.list")
     def _load_labels(self) -> None:
         # Build a list of label CSVs from LABELS_DIR
         rows: List[dict] = []
@@ -184,7 +243,49 @@ class CsvReportsPage(QWidget):
         self.labels_table.setModel(self._labels_model)
         self.labels_table.resizeColumnsToContents()
 
+    def _on_tab_changed(self, index: int) -> None:
+        if self.tabs.widget(index) is self.tab_stats:
+            self._refresh_stats()
+
+    def _refresh_stats(self) -> None:
+        """Rescan label CSVs in the background (only new/changed files are re-read)."""
+        if self._stats_busy:
+            return
+        self._stats_busy = True
+        self.stats_summary.setText("Scanning label CSVs…")
+        self._compute_stats(rescan=True)
+
+    def _compute_stats(self, rescan: bool) -> None:
+        """Summarize by the selected grouping on the stats worker (after a rescan if asked)."""
+        by = self.stats_group.currentData() or "class"
+
+        def work():
+            try:
+                if rescan:
+                    self._stats.refresh()
+                self._sig_stats_ready.emit(self._stats.summary(by), self._stats.totals(), "", rescan)
+            except Exception as e:
+                self._sig_stats_ready.emit(None, None, str(e), rescan)
+
+        self._stats_pool.submit(work)
+
+    def _show_stats(self, df: pd.DataFrame | None, tot: dict | None, error: str, rescanned: bool) -> None:
+        if rescanned:
+            self._stats_busy = False
+        if error:
+            self.stats_summary.setText(f"Could not compute statistics: {error}")
+            return
+        secs = int(tot["total_s"])
+        self.stats_summary.setText(
+            f"{tot['segments']} segments in {tot['files']} files • "
+            f"total {secs // 3600}:{secs % 3600 // 60:02d}:{secs % 60:02d}"
+        )
+        self._stats_model = PandasModel(df)
+        self.stats_table.setModel(self._stats_model)
+        self.stats_table.resizeColumnsToContents()
+
     # ----------------- Search -----------------
+    @traced("filter.meta")
     def _apply_meta_search(self) -> None:
         if not self._meta_model:
             return
@@ -198,6 +299,7 @@ class CsvReportsPage(QWidget):
         self.meta_table.setModel(self._meta_model)
         self.meta_table.resizeColumnsToContents()
 
+    @traced("filter.labels")
     def _apply_labels_search(self) -> None:
         if not self._labels_model:
             return
@@ -220,6 +322,18 @@ class CsvReportsPage(QWidget):
         p.mkdir(parents=True, exist_ok=True)
 
     # ----------------- Export actions -----------------
+    @traced("export.stats")
+    def _export_stats(self) -> None:
+        if not self._stats_model:
+            return
+        out, _ = QFileDialog.getSaveFileName(self, "Export statistics", str(Path.cwd() / "label_stats.csv"),
+                                             "CSV Files (*.csv)")
+        if not out:
+            return
+        self._stats_model.dataframe().to_csv(out, index=False, encoding="utf-8")
+        QMessageBox.information(self, "Export", f"Exported to:\n{out}")
+
+    @traced("export.meta")
     def _export_meta_selected(self) -> None:
         if not self._meta_model:
             return
@@ -264,6 +378,7 @@ class CsvReportsPage(QWidget):
 
         QMessageBox.information(self, "Export", f"Exported to:\n{out_root}")
 
+    @traced("export.labels")
     def _export_labels_selected(self) -> None:
         """Export selected label CSVs and the corresponding metadata, mirroring metadata tab layout."""
         if not self._labels_model:
@@ -313,14 +428,11 @@ class CsvReportsPage(QWidget):
 
         # 2) Export corresponding metadata into metadata/index.csv
         #    Match by sample_id OR by labels_csv path.
+        get_writer().flush(META_CSV)
         try:
-            meta_df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
+            meta_df = META.read_text(META_CSV)
         except Exception:
-            meta_df = pd.DataFrame(columns=META_COLUMNS)
-
-        for c in META_COLUMNS:
-            if c not in meta_df.columns:
-                meta_df[c] = ""
+            meta_df = META.conform(pd.DataFrame())
 
         mask_sid = meta_df["sample_id"].astype(str).isin(picked_sample_ids) if "sample_id" in meta_df.columns else False
         mask_path = meta_df["labels_csv"].astype(str).isin(
@@ -13,16 +13,23 @@ from PySide6.QtWidgets import (
     QLineEdit, QTableView, QMessageBox, QFrame
 )
 
+from code.core.csv_writer import get_writer
+from code.core.instrument import traced
+from code.core.label_index import get_label_index
+from code.core.schema import META, META_LIST_COLUMNS
 from code.ui.widgets.pandas_model import PandasModel
 
 DATA_DIR     = Path.cwd() / "data"
 META_CSV     = DATA_DIR / "samples_meta.csv"
+LABELS_DIR   = DATA_DIR / "labels"
 
 class EditHubPage(QWidget):
     sig_go_home = Signal()
     sig_edit_metadata = Signal(str)            # sample_id
     sig_edit_labels   = Signal(str)            # sample_id
     sig_add_sample_to_metadata = Signal(str)   # sample_id  (NEW)
+    sig_label_queue   = Signal(list, int)      # ([(sample_id, csv_path), ...], start index)
+    _sig_deleted      = Signal(list, str)      # (label CSVs to remove, error) from the writer thread
 
     def __init__(self):
         super().__init__()
@@ -52,6 +59,9 @@ class EditHubPage(QWidget):
         self.btn_edit_meta.setProperty("variant", "primary")
         self.btn_edit_labels = QPushButton("🎧 Edit Labels")
         self.btn_edit_labels.setProperty("variant", "accent")
+        self.btn_label_queue = QPushButton("⏭ Label Queue")
+        self.btn_label_queue.setProperty("variant", "soft")
+        self.btn_label_queue.setToolTip("Label every CSV of the selected samples in order")
 
         # NEW: add WAV(s) to selected metadata
         self.btn_add_to_meta = QPushButton("➕ Add Sample to Metadata")
@@ -61,20 +71,22 @@ class EditHubPage(QWidget):
         self.btn_delete = QPushButton("🗑 Delete")
         self.btn_delete.setProperty("variant", "danger")
 
-        for b in (self.btn_reload, self.btn_edit_meta, self.btn_edit_labels, self.btn_add_to_meta, self.btn_delete):
+        for b in (self.btn_reload, self.btn_edit_meta, self.btn_edit_labels, self.btn_label_queue,
+                  self.btn_add_to_meta, self.btn_delete):
             b.setMinimumHeight(32)
 
         tool.addWidget(self.search, 1)
         tool.addWidget(self.btn_reload)
         tool.addWidget(self.btn_edit_meta)
         tool.addWidget(self.btn_edit_labels)
+        tool.addWidget(self.btn_label_queue)
         tool.addWidget(self.btn_add_to_meta)   # << NEW
         tool.addWidget(self.btn_delete)
 
         # Table
         self.table = QTableView()
         self.table.setSelectionBehavior(QTableView.SelectRows)
-        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setSelectionMode(QTableView.ExtendedSelection)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setDefaultSectionSize(32)
 
@@ -90,6 +102,7 @@ class EditHubPage(QWidget):
         self.btn_reload.clicked.connect(self._reload)
         self.btn_edit_meta.clicked.connect(self._emit_edit_meta)
         self.btn_edit_labels.clicked.connect(self._emit_edit_labels)
+        self.btn_label_queue.clicked.connect(self._emit_label_queue)
         self.btn_add_to_meta.clicked.connect(self._emit_add_to_meta)  # << NEW
         self.btn_delete.clicked.connect(self._delete_selected)
 
@@ -97,6 +110,8 @@ class EditHubPage(QWidget):
 
         # State
         self._df = pd.DataFrame()
+        get_writer().sig_written.connect(self._on_csv_written)
+        self._sig_deleted.connect(self._on_deleted)
 
     # ---------- public ----------
     def open(self):
@@ -104,19 +119,17 @@ class EditHubPage(QWidget):
         self._reload()
 
     # ---------- helpers ----------
+    @traced("meta.load")
     def _reload(self):
+        get_writer().flush(META_CSV)
         try:
-            df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
+            self._df = META.read_text(META_CSV, META_LIST_COLUMNS)
         except Exception:
-            df = pd.DataFrame(columns=["sample_id", "sample_name", "date", "time", "labels_csv", "created_at"])
-        # Ensure columns and order
-        for c in ["sample_id", "sample_name", "date", "time", "labels_csv", "created_at"]:
-            if c not in df.columns:
-                df[c] = ""
-        self._df = df[["sample_id", "sample_name", "date", "time", "labels_csv", "created_at"]]
+            self._df = META.conform(pd.DataFrame(), META_LIST_COLUMNS)
 
         self._apply_filter()  # populates model
 
+    @traced("filter.samples")
     def _apply_filter(self):
         q = (self.search.text() or "").strip().lower()
         if not q:
@@ -150,12 +163,29 @@ class EditHubPage(QWidget):
         if sid:
             self.sig_edit_labels.emit(sid)
 
+    def _emit_label_queue(self):
+        """Queue all label CSVs of the selected samples (table order, then file name)."""
+        sel = sorted(ix.row() for ix in self.table.selectionModel().selectedRows())
+        if not sel:
+            QMessageBox.information(self, "Select", "Please select one or more metadata rows first.")
+            return
+        df_view = self.model.dataframe()
+        items = []
+        for r in sel:
+            sid = str(df_view.iloc[r]["sample_id"])
+            items += [(sid, str(p)) for p in sorted(LABELS_DIR.glob(f"{sid}__*.csv"))]
+        if not items:
+            QMessageBox.information(self, "Label queue", "The selected samples have no label CSVs yet.")
+            return
+        self.sig_label_queue.emit(items, 0)
+
     def _emit_add_to_meta(self):
         """Open label editor for this metadata and immediately ask user to attach WAV(s)."""
         sid = self._selected_sample_id()
         if sid:
             self.sig_add_sample_to_metadata.emit(sid)
 
+    @traced("samples.delete")
     def _delete_selected(self):
         sel = self.table.selectionModel().selectedRows()
         if not sel:
@@ -173,20 +203,36 @@ class EditHubPage(QWidget):
         if ret != QMessageBox.Yes:
             return
 
-        # Remove label CSV paths if present
+        csvs = []
         for r in rows:
             p = str(df_view.loc[r, "labels_csv"]) if "labels_csv" in df_view.columns else ""
             if isinstance(p, str) and p.strip():
-                try:
-                    Path(p).unlink(missing_ok=True)
-                except Exception:
-                    pass
+                csvs.append(p)
 
-        # Remove from META_CSV
-        try:
-            df_all = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
-        except Exception:
+        # Remove from META_CSV (on the writer thread; the view refreshes when it lands)
+        def drop_samples(df_all: pd.DataFrame) -> pd.DataFrame | None:
+            if "sample_id" not in df_all.columns:
+                return None
+            return df_all[~df_all["sample_id"].astype(str).isin(sids)]
+
+        def done(fut):
+            err = fut.exception()
+            self._sig_deleted.emit(csvs, str(err or ""))
+
+        get_writer().update(META_CSV, drop_samples).add_done_callback(done)
+
+    def _on_deleted(self, csvs: list, error: str):
+        """Metadata rows are gone: now remove their label CSVs (kept if the delete failed)."""
+        if error:
+            QMessageBox.critical(self, "Delete error", f"Could not delete metadata rows:\n{error}")
             return
-        df_all = df_all[~df_all["sample_id"].astype(str).isin(sids)]
-        df_all.to_csv(META_CSV, index=False, encoding="utf-8")
-        self._reload()
\ No newline at end of file
+        for p in csvs:
+            try:
+                Path(p).unlink(missing_ok=True)
+                get_label_index().submit_remove(Path(p))
+            except Exception:
+                pass
+
+    def _on_csv_written(self, path: str, _version):
+        if Path(path) == META_CSV and self.isVisible():
+            self._reload()
\ No newline at end of file
@@ -1,5 +1,5 @@
 # code/ui/pages/home.py
-# Home page with 4 modern styled cards.
+# Home page with modern styled cards.
 # Emits signals only, no routing logic inside here.
 
 from PySide6.QtWidgets import QWidget, QLabel, QGridLayout, QVBoxLayout
@@ -13,6 +13,8 @@ class HomePage(QWidget):
     sig_edit_sample = Signal()
     sig_sample_types = Signal()
     sig_csv_reports = Signal()
+    sig_segment_search = Signal()
+    sig_sample_map = Signal()
 
     def __init__(self):
         super().__init__()
@@ -27,22 +29,26 @@ class HomePage(QWidget):
         title.setProperty("class", "h1")
         root.addWidget(title, alignment=Qt.AlignLeft)
 
-        # Grid layout for 4 cards
+        # Grid layout for the cards
         grid = QGridLayout()
         grid.setHorizontalSpacing(30)
         grid.setVerticalSpacing(30)
 
-        # Four cards
+        # Cards
         self.btn_new = CardButton("➕ New Sample", color1="#42a5f5", color2="#1e88e5")
         self.btn_edit = CardButton("✏️ Edit Sample", color1="#66bb6a", color2="#388e3c")
         self.btn_specs = CardButton("⚙️ Sample Types & Specs", color1="#ffca28", color2="#f57c00")
         self.btn_csv = CardButton("📊 CSV Reports", color1="#ab47bc", color2="#6a1b9a")
+        self.btn_search = CardButton("🔎 Segment Search", color1="#26c6da", color2="#00838f")
+        self.btn_map = CardButton("🗺 Sample Map", color1="#ef5350", color2="#c62828")
 
-        # Place them in a 2x2 grid
-        grid.addWidget(self.btn_new,   0, 0)
-        grid.addWidget(self.btn_edit,  0, 1)
-        grid.addWidget(self.btn_specs, 1, 0)
-        grid.addWidget(self.btn_csv,   1, 1)
+        # Place them in a 3-column grid
+        grid.addWidget(self.btn_new,    0, 0)
+        grid.addWidget(self.btn_edit,   0, 1)
+        grid.addWidget(self.btn_specs,  0, 2)
+        grid.addWidget(self.btn_csv,    1, 0)
+        grid.addWidget(self.btn_search, 1, 1)
+        grid.addWidget(self.btn_map,    1, 2)
 
         root.addLayout(grid)
 
@@ -50,4 +56,6 @@ class HomePage(QWidget):
         self.btn_new.clicked.connect(self.sig_new_sample.emit)
         self.btn_edit.clicked.connect(self.sig_edit_sample.emit)
         self.btn_specs.clicked.connect(self.sig_sample_types.emit)
-        self.btn_csv.clicked.connect(self.sig_csv_reports.emit)
\ No newline at end of file
+        self.btn_csv.clicked.connect(self.sig_csv_reports.emit)
+        self.btn_search.clicked.connect(self.sig_segment_search.emit)
+        self.btn_map.clicked.connect(self.sig_sample_map.emit)
\ No newline at end of file
@@ -2,19 +2,19 @@
 # Dark-mode Label Editor with waveform + spectrogram, CSV table,
 # per-WAV CSV files, save-prompt when switching audio, and spacebar play/pause.
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
 import pyqtgraph as pg
-import soundfile as sf
-from scipy.signal import spectrogram
 
-from PySide6.QtCore import Qt, Signal, QUrl
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtCore import Qt, Signal, QTimer, QUrl
+from PySide6.QtGui import QShortcut, QKeySequence, QUndoStack
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QFrame,
     QFileDialog,
@@ -24,6 +24,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSlider,
+    QSpinBox,
     QSplitter,
     QStyledItemDelegate,
     QTableView,
@@ -31,7 +32,26 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from code.audio.activity import subtract_spans
+from code.audio.cache import DecodedRecording, RecordingCache, load_recording, recording_key
+from code.audio.decode import AUDIO_FILTER, load_mono
+from code.audio.proxy import build_activity, ready_proxy, submit_activity, submit_proxy
+from code.audio.spectrogram import FFT_SIZES, SCALES, SpecParams
+from code.audio.stretch import SILENCE_DB
+from code.core.label_commands import InsertRowsCommand, RemoveRowsCommand, SetCellsCommand
+from code.core.csv_writer import get_writer, read_csv_versioned, write_csv_atomic
+from code.core.instrument import span, traced
+from code.core.label_index import get_label_index
+from code.core.label_journal import LabelJournal, replay
+from code.core.schema import LABEL_COLUMNS, LABELS, SAMPLE_TYPES, new_label_id
+from code.ui.widgets.activity_strip import ActivityStrip
+from code.ui.widgets.channel_lanes import AXIS_WIDTH, LANE_HEIGHT, ChannelLanes
+from code.ui.widgets.minimap import Minimap
 from code.ui.widgets.pandas_model import PandasModel
+from code.ui.widgets.playhead import PlayheadDriver
+from code.ui.widgets.rapid_labeler import RapidLabeler
+from code.ui.widgets.review_player import ReviewPlayer
+from code.ui.widgets.viewport import SpectrogramView, ViewportController, WaveformView
 
 # --- project dirs ---
 DATA_DIR = Path.cwd() / "data"
@@ -39,7 +59,24 @@ LABELS_DIR = DATA_DIR / "labels"
 META_CSV = DATA_DIR / "samples_meta.csv"
 SAMPLE_LIST_CSV = DATA_DIR / "sample_list.csv"
 
-LABEL_COLUMNS = ["sample_id", "audio_path", "start_s", "end_s", "label_class", "notes", "created_at"]
+LABEL_MERGE_KEY = ["label_id"]  # identifies a label row across annotators, whatever is edited
+
+SPEC_HOPS = {"hop ½": 2, "hop ¼": 4, "hop ⅛": 8}  # hop as a fraction of the FFT size
+FREQ_TICKS_HZ = (50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000)
+PREFETCH_AHEAD = 2  # queued recordings decoded ahead of the one being labeled
+AUTOSAVE_MS = 20_000  # rapid mode saves in the background this often when there are edits
+REVIEW_RATES = (1.5, 2.0, 3.0, 4.0)
+JUMP_AHEAD_S = 0.05  # "next" skips a region starting this close to the playhead
+JUMP_BACK_S = 0.25   # "previous" skips the region the playhead just jumped to
+
+
+def audio_for_labels(csv_path: Path) -> Path | None:
+    """First existing audio file referenced by a labels CSV."""
+    try:
+        paths = LABELS.read_text(csv_path, ["audio_path"])["audio_path"]
+    except Exception:
+        return None
+    return next((Path(p) for p in paths if str(p).strip() and Path(p).exists()), None)
 
 
 # ---------- UI helpers ----------
@@ -95,6 +132,11 @@ class ComboBoxDelegate(QStyledItemDelegate):
 # ---------- Main page ----------
 class LabelEditorPage(QWidget):
     sig_go_home = Signal()
+    _sig_saved = Signal(str, object, object, str, int)  # (csv_path, WriteResult, snapshot, error, save seq) from the writer thread
+    _sig_proxy_done = Signal(str, object, object)  # (source audio path, channel or None, Future) from the proxy worker
+    _sig_prefetched = Signal(object)               # DecodedRecording from the prefetch worker
+    _sig_activity_done = Signal(str, object)       # (source audio path, Future) from the proxy worker
+    _sig_meta_failed = Signal(str)                 # error of this page's samples_meta.csv update (writer thread)
 
     def __init__(self):
         super().__init__()
@@ -109,6 +151,9 @@ class LabelEditorPage(QWidget):
         top.addWidget(self.btn_back, alignment=Qt.AlignLeft)
         top.addWidget(self.title, alignment=Qt.AlignLeft)
         top.addStretch()
+        self.lbl_status = QLabel("")
+        self.lbl_status.setProperty("class", "subtle")
+        top.addWidget(self.lbl_status, alignment=Qt.AlignRight)
 
         # ---- toolbar ----
         tool_card = QFrame()
@@ -117,7 +162,7 @@ class LabelEditorPage(QWidget):
         tool.setContentsMargins(12, 10, 12, 10)
         tool.setSpacing(8)
 
-        self.btn_attach = QPushButton("📎 Attach WAV…")
+        self.btn_attach = QPushButton("📎 Attach Audio…")
         self.btn_attach.setProperty("variant", "accent")
         self.btn_play = QPushButton("▶ Play")
         self.btn_play.setProperty("variant", "primary")
@@ -138,12 +183,34 @@ class LabelEditorPage(QWidget):
         self.btn_add_row.setProperty("variant", "success")
         self.btn_delete = QPushButton("🗑 Delete")
         self.btn_delete.setProperty("variant", "danger")
+        self.btn_set_class = QPushButton("🏷 Set Class")
+        self.btn_set_class.setProperty("variant", "soft")
+        self.btn_set_class.setToolTip("Apply the selected class to all selected rows")
+        self.btn_undo = QPushButton("↶ Undo")
+        self.btn_undo.setProperty("variant", "soft")
+        self.btn_redo = QPushButton("↷ Redo")
+        self.btn_redo.setProperty("variant", "soft")
         self.btn_save = QPushButton("💾 Save")
         self.btn_save.setProperty("variant", "primary")
         self.btn_reload = QPushButton("↻ Reload")
         self.btn_reload.setProperty("variant", "soft")
         self.btn_toggle_visuals = QPushButton("▾ Toggle Visuals")
         self.btn_toggle_visuals.setProperty("variant", "soft")
+        self.btn_rapid = QPushButton("⚡ Rapid")
+        self.btn_rapid.setProperty("variant", "soft")
+        self.btn_rapid.setCheckable(True)
+        self.btn_rapid.setToolTip("Hotkey labeling: hold or tap 1–9/0 to label at the playhead, I/O for in/out, "
+                                  "Esc cancels; no dialogs, saved in the background")
+
+        # labeling queue (only shown when the editor was opened with one)
+        self.btn_prev_rec = QPushButton("⏮ Prev")
+        self.btn_prev_rec.setProperty("variant", "soft")
+        self.btn_next_rec = QPushButton("Next ⏭")
+        self.btn_next_rec.setProperty("variant", "primary")
+        self.lbl_queue = QLabel("")
+        self.lbl_queue.setProperty("class", "subtle")
+        for w in (self.btn_prev_rec, self.btn_next_rec, self.lbl_queue):
+            w.setVisible(False)
 
         for w in (
             self.btn_attach,
@@ -155,12 +222,21 @@ class LabelEditorPage(QWidget):
             self.class_combo,
             self.btn_add_row,
             self.btn_delete,
+            self.btn_set_class,
+            self.btn_undo,
+            self.btn_redo,
             self.btn_save,
             self.btn_reload,
             self.btn_toggle_visuals,
+            self.btn_rapid,
+            self.btn_prev_rec,
+            self.btn_next_rec,
         ):
             w.setMinimumHeight(32)
 
+        tool.addWidget(self.btn_prev_rec)
+        tool.addWidget(self.lbl_queue)
+        tool.addWidget(self.btn_next_rec)
         tool.addWidget(self.btn_attach)
         tool.addWidget(self.btn_play)
         tool.addWidget(self.btn_pause)
@@ -172,7 +248,11 @@ class LabelEditorPage(QWidget):
         tool.addWidget(self.class_combo)
         tool.addWidget(self.btn_add_row)
         tool.addWidget(self.btn_delete)
+        tool.addWidget(self.btn_set_class)
+        tool.addWidget(self.btn_rapid)
         tool.addStretch()
+        tool.addWidget(self.btn_undo)
+        tool.addWidget(self.btn_redo)
         tool.addWidget(self.btn_save)
         tool.addWidget(self.btn_reload)
         tool.addWidget(self.btn_toggle_visuals)
@@ -184,10 +264,54 @@ class LabelEditorPage(QWidget):
         tl.setContentsMargins(12, 10, 12, 10)
         tl.setSpacing(10)
         self.slider = SeekSlider(Qt.Horizontal)
+        self.activity = ActivityStrip()
+        self.activity.setToolTip("Activity over the whole recording; labeled spans are underlined. Click to seek")
         self.lbl_time = QLabel("00:00 / 00:00")
         self.lbl_time.setStyleSheet("color:#a6adc8;")
-        tl.addWidget(self.slider, 1)
+        self.btn_follow = QPushButton("⇥ Follow")
+        self.btn_follow.setProperty("variant", "soft")
+        self.btn_follow.setCheckable(True)
+        self.btn_follow.setToolTip("Auto-scroll the plots to keep the playhead in view")
+        seek_col = QVBoxLayout()
+        seek_col.setSpacing(2)
+        seek_col.addWidget(self.activity)
+        seek_col.addWidget(self.slider)
+        tl.addLayout(seek_col, 1)
         tl.addWidget(self.lbl_time)
+        tl.addWidget(self.btn_follow)
+
+        # jump between detected events / events not yet covered by a label
+        self.btn_prev_event = QPushButton("⟨ Event")
+        self.btn_next_event = QPushButton("Event ⟩")
+        self.btn_prev_unlabeled = QPushButton("⟨ Unlabeled")
+        self.btn_next_unlabeled = QPushButton("Unlabeled ⟩")
+        self.btn_prev_event.setToolTip("Previous active region (Ctrl+Left)")
+        self.btn_next_event.setToolTip("Next active region (Ctrl+Right)")
+        self.btn_prev_unlabeled.setToolTip("Previous active region without a label (Ctrl+Shift+Left)")
+        self.btn_next_unlabeled.setToolTip("Next active region without a label (Ctrl+Shift+Right)")
+        for w in (self.btn_prev_event, self.btn_next_event, self.btn_prev_unlabeled, self.btn_next_unlabeled):
+            w.setProperty("variant", "soft")
+            tl.addWidget(w)
+
+        # fast review: time-stretched playback of the drawn buffer, skipping silence
+        self.btn_review = QPushButton("⏩ Review")
+        self.btn_review.setProperty("variant", "soft")
+        self.btn_review.setCheckable(True)
+        self.btn_review.setToolTip("Play faster at the original pitch; Play/Pause/Space and seeking drive the review")
+        self.review_rate = QComboBox()
+        self.review_rate.addItems([f"{r:g}×" for r in REVIEW_RATES])
+        self.review_rate.setCurrentIndex(1)
+        self.chk_skip_silence = QCheckBox("Skip silence")
+        self.chk_skip_silence.setChecked(True)
+        self.spin_silence_db = QSpinBox()
+        self.spin_silence_db.setRange(-90, -10)
+        self.spin_silence_db.setValue(int(SILENCE_DB))
+        self.spin_silence_db.setSuffix(" dB")
+        self.spin_silence_db.setToolTip("Stretches quieter than this (dBFS) are skipped")
+        tl.addWidget(self.btn_review)
+        tl.addWidget(self.review_rate)
+        tl.addWidget(self.chk_skip_silence)
+        tl.addWidget(self.spin_silence_db)
 
         # ---- visuals ----
         wf_card = QFrame()
@@ -196,9 +320,32 @@ class LabelEditorPage(QWidget):
         wf.setContentsMargins(12, 10, 12, 10)
         wf.setSpacing(8)
 
+        cap_row = QHBoxLayout()
         cap = QLabel("Waveform / Spectrogram")
         cap.setProperty("class", "subtle")
-        wf.addWidget(cap)
+        self.spec_channel = QComboBox()
+        self.spec_channel.setToolTip("Channel shown in the spectrogram")
+        self.spec_channel.setVisible(False)
+        self.spec_scale = QComboBox()
+        self.spec_scale.addItems([s.capitalize() for s in SCALES])
+        self.spec_scale.setToolTip("Frequency axis of the spectrogram")
+        self.spec_fft = QComboBox()
+        self.spec_fft.addItems([f"FFT {n}" for n in FFT_SIZES])
+        self.spec_fft.setCurrentText("FFT 1024")
+        self.spec_hop = QComboBox()
+        self.spec_hop.addItems(list(SPEC_HOPS))
+        cap_row.addWidget(cap)
+        cap_row.addStretch()
+        cap_row.addWidget(self.spec_channel)
+        cap_row.addWidget(self.spec_scale)
+        cap_row.addWidget(self.spec_fft)
+        cap_row.addWidget(self.spec_hop)
+        wf.addLayout(cap_row)
+
+        # whole-file overview; its rectangle is the range the plots below show
+        self.minimap = Minimap()
+        self.minimap.setToolTip("Drag the rectangle to move the view; click elsewhere to jump there")
+        self.minimap.setVisible(False)
 
         self.pg_wave = pg.PlotWidget()
         self.pg_wave.setBackground("#12141a")
@@ -207,16 +354,36 @@ class LabelEditorPage(QWidget):
         self.pg_wave.setLabel("bottom", "Time", units="s", **{"color": "#cfd3e0"})
         self.pg_wave.setLabel("left", "Amplitude", **{"color": "#cfd3e0"})
         self.pg_wave.setMinimumHeight(110)
+        self.pg_wave.hideButtons()  # auto-range would only see the data in view
 
         self.pg_spec = pg.PlotWidget()
         self.pg_spec.setBackground("#12141a")
         self.pg_spec.setLabel("bottom", "Time", units="s", **{"color": "#cfd3e0"})
         self.pg_spec.setLabel("left", "Frequency", units="Hz", **{"color": "#cfd3e0"})
         self.pg_spec.setMinimumHeight(140)
+        self.pg_spec.hideButtons()
+        # holds only the frames in view (see SpectrogramView), so repainting it is cheap
         self._img_spec = pg.ImageItem()
         self.pg_spec.addItem(self._img_spec)
 
+        # per-channel lanes (multichannel recordings only), X-linked to the waveform
+        self.lanes = ChannelLanes()
+        self.lanes.setVisible(False)
+
+        # the plots share one X range and hold only the data in it, at pixel resolution
+        self.pg_spec.setXLink(self.pg_wave)
+        self.pg_spec.getPlotItem().vb.disableAutoRange(axis=pg.ViewBox.XAxis)
+        for plot in (self.pg_wave, self.pg_spec):
+            plot.getAxis("left").setWidth(AXIS_WIDTH)
+        self.wave_view = WaveformView(self.pg_wave)
+        self.spec_view = SpectrogramView(self._img_spec)
+        self.viewport = ViewportController(self.pg_wave.getPlotItem(), self)
+        for view in (self.wave_view, self.lanes, self.spec_view):
+            self.viewport.add(view)
+
+        wf.addWidget(self.minimap)
         wf.addWidget(self.pg_wave)
+        wf.addWidget(self.lanes)
         wf.addWidget(self.pg_spec)
 
         # ---- marks row ----
@@ -245,6 +412,10 @@ class LabelEditorPage(QWidget):
         marks.addWidget(QLabel("End:"))
         marks.addWidget(self.line_end, 1)
         marks.addStretch()
+        self.lbl_bindings = QLabel("")
+        self.lbl_bindings.setProperty("class", "subtle")
+        self.lbl_bindings.setVisible(False)
+        marks.addWidget(self.lbl_bindings)
 
         # ---- labels table ----
         self.table = QTableView()
@@ -275,29 +446,94 @@ class LabelEditorPage(QWidget):
         self.player.setAudioOutput(self.audio_out)
         self.audio_out.setVolume(0.9)
 
-        self.player.positionChanged.connect(self._on_position_changed)
+        self.playhead = PlayheadDriver(self.player, self)
+        self.playhead.sig_frame.connect(self._on_playhead_frame)
         self.player.durationChanged.connect(self._on_duration_changed)
         self.slider.sliderMoved.connect(self._seek_live)
         self.slider.sliderReleased.connect(self._seek_release)
 
         # buttons wiring
         self.btn_attach.clicked.connect(self._attach_audio)
-        self.btn_play.clicked.connect(self.player.play)
-        self.btn_pause.clicked.connect(self.player.pause)
-        self.btn_stop.clicked.connect(self.player.stop)
+        self.btn_play.clicked.connect(self._play)
+        self.btn_pause.clicked.connect(self._pause)
+        self.btn_stop.clicked.connect(self._stop)
         self.btn_mark_start.clicked.connect(self._mark_start)
         self.btn_mark_end.clicked.connect(self._mark_end)
         self.btn_add_row.clicked.connect(self._add_row_from_marks)
         self.btn_delete.clicked.connect(self._delete_rows)
+        self.btn_set_class.clicked.connect(self._set_class_for_selection)
         self.btn_save.clicked.connect(self._save_labels)
         self.btn_reload.clicked.connect(self._reload_labels)
         self.btn_toggle_visuals.clicked.connect(self._toggle_visuals)
+        self.btn_rapid.toggled.connect(self._set_rapid)
+        self.btn_prev_rec.clicked.connect(lambda: self._queue_step(-1))
+        self.btn_next_rec.clicked.connect(lambda: self._queue_step(+1))
+        self.spec_channel.currentIndexChanged.connect(self._on_spec_channel)
+        for combo in (self.spec_scale, self.spec_fft, self.spec_hop):
+            combo.currentIndexChanged.connect(lambda *_: self._render_spectrogram())
+        self.lanes.sig_clicked.connect(lambda sec: self._seek(int(sec * 1000)))
+        self.activity.sig_clicked.connect(lambda sec: self._seek(int(sec * 1000)))
+        self.minimap.sig_range.connect(self._show_range)
+        self.pg_wave.sigXRangeChanged.connect(lambda _vb, rng: self.minimap.set_viewport(*rng))
+        self.btn_prev_event.clicked.connect(lambda: self._jump(False, -1))
+        self.btn_next_event.clicked.connect(lambda: self._jump(False, +1))
+        self.btn_prev_unlabeled.clicked.connect(lambda: self._jump(True, -1))
+        self.btn_next_unlabeled.clicked.connect(lambda: self._jump(True, +1))
+        for keys, unlabeled, step in (("Ctrl+Left", False, -1), ("Ctrl+Right", False, +1),
+                                      ("Ctrl+Shift+Left", True, -1), ("Ctrl+Shift+Right", True, +1)):
+            sc = QShortcut(QKeySequence(keys), self)
+            sc.setContext(Qt.WidgetWithChildrenShortcut)
+            sc.activated.connect(lambda u=unlabeled, s=step: self._jump(u, s))
 
         # spacebar toggle
         self._space_shortcut = QShortcut(QKeySequence(Qt.Key_Space), self)
         self._space_shortcut.setContext(Qt.ApplicationShortcut)
         self._space_shortcut.activated.connect(self._toggle_play_pause)
 
+        # undo/redo over label edits (every command is also journaled)
+        self.undo_stack = QUndoStack(self)
+        self.undo_stack.cleanChanged.connect(self._on_clean_changed)
+        self.undo_stack.canUndoChanged.connect(self.btn_undo.setEnabled)
+        self.undo_stack.canRedoChanged.connect(self.btn_redo.setEnabled)
+        self.undo_stack.indexChanged.connect(self._show_label_spans)
+        self.btn_undo.clicked.connect(self.undo_stack.undo)
+        self.btn_redo.clicked.connect(self.undo_stack.redo)
+        self.btn_undo.setEnabled(False)
+        self.btn_redo.setEnabled(False)
+        for seq, slot in ((QKeySequence.Undo, self.undo_stack.undo), (QKeySequence.Redo, self.undo_stack.redo)):
+            sc = QShortcut(QKeySequence(seq), self)
+            sc.setContext(Qt.WidgetWithChildrenShortcut)
+            sc.activated.connect(slot)
+        self._journal: LabelJournal | None = None
+        self._sig_saved.connect(self._on_saved)
+        self._sig_proxy_done.connect(self._on_proxy_done)
+        self._sig_prefetched.connect(self._on_prefetched)
+        self._sig_activity_done.connect(self._on_activity_done)
+        self._sig_meta_failed.connect(
+            lambda err: self._notify("Save error", f"Could not update samples_meta.csv:\n{err}"))
+
+        # rapid (hotkey) labeling
+        self.rapid = RapidLabeler(lambda: self._position_ms() / 1000.0,
+                                  lambda: self.class_combo.currentText().strip(), self)
+        self.rapid.sig_batch.connect(self._add_segments)
+        self.rapid.sig_status.connect(self.lbl_status.setText)
+        self._autosave = QTimer(self)
+        self._autosave.setInterval(AUTOSAVE_MS)
+        self._autosave.timeout.connect(lambda: self._dirty and self._save_labels())
+
+        # review playback
+        self.review = ReviewPlayer(self)
+        self.review.sig_position.connect(self._on_playhead_frame)
+        self.review.sig_finished.connect(self.player.setPosition)
+        self.btn_review.toggled.connect(self._set_review)
+        self.review_rate.currentIndexChanged.connect(self._restart_review)
+        self.chk_skip_silence.toggled.connect(self._restart_review)
+        self.spin_silence_db.valueChanged.connect(self._restart_review)
+        # what the table was loaded from, so concurrent saves by others can be merged
+        self._base_df: pd.DataFrame | None = None
+        self._base_version = None
+        self._save_seq = 0
+
         # state
         self.sample_id: str | None = None
         self.labels_csv_path: Path | None = None
@@ -305,11 +541,26 @@ class LabelEditorPage(QWidget):
         self.model: PandasModel | None = None
         self._class_options: list[str] = [""]
 
-        self._wav_data: np.ndarray | None = None
+        self._wav_data: np.ndarray | None = None   # drawn samples (the analysis proxy)
         self._wav_sr: int | None = None
+        self._pending_reveal: float | None = None  # segment to show once the proxy is ready
+        # recently drawn recordings (samples, envelopes, spectrograms), LRU by bytes
+        self._recordings = RecordingCache()
+        self._rec: DecodedRecording | None = None  # the one on screen
+
+        # labeling queue: (sample_id, labels csv) in order, and the upcoming ones decoded ahead
+        self._queue: list[tuple[str, str]] = []
+        self._queue_pos = -1
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-prefetch")
+        self._prefetch_gen = 0  # bumped on every move; stale jobs return early
 
         self._dirty = False  # track unsaved edits
 
+        # last values pushed to the UI by the playhead (skip no-op updates)
+        self._shown_pos_text = ""
+        self._shown_time_text = ""
+        self._shown_sec = {"wave": None, "spec": None}
+
         # playheads
         self._playhead_wave = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=pg.mkPen("#2aa3ff", width=2))
         self.pg_wave.addItem(self._playhead_wave)
@@ -320,24 +571,85 @@ class LabelEditorPage(QWidget):
         self.pg_spec.scene().sigMouseClicked.connect(self._on_spec_click)
 
     # ===== public API =====
+    @traced("editor.open")
     def open_for(self, sample_id: str):
         """Prepare editor for a metadata record. Actual CSV is selected when a WAV is attached."""
+        self.rapid.flush()
         self.sample_id = sample_id
         LABELS_DIR.mkdir(parents=True, exist_ok=True)
+        self._close_journal()
         self.labels_csv_path = None
         self.model = None
         self.table.setModel(None)
+        self.undo_stack.clear()
         self._dirty = False
         self._load_classes()
         self.title.setText(f"Label Editor — Step 2 • {sample_id}")
+        self._set_queue([])
+
+    def open_queue(self, items: list[tuple[str, str]], index: int = 0):
+        """Label (sample_id, csv_path) items one after another with Prev/Next;
+        the next PREFETCH_AHEAD recordings are decoded in the background."""
+        self._set_queue(items)
+        if self._queue:
+            self._queue_go(min(max(index, 0), len(self._queue) - 1))
+
+    # ===== labeling queue =====
+    def _set_queue(self, items: list[tuple[str, str]]):
+        self._queue = [(str(sid), str(csv)) for sid, csv in items]
+        self._queue_pos = -1
+        self._prefetch_gen += 1
+        for w in (self.btn_prev_rec, self.btn_next_rec, self.lbl_queue):
+            w.setVisible(bool(self._queue))
+
+    def _queue_step(self, delta: int):
+        pos = self._queue_pos + delta
+        if 0 <= pos < len(self._queue) and self._ask_save_if_dirty():
+            self._queue_go(pos)
+
+    def _queue_go(self, pos: int):
+        self._queue_pos = pos
+        sample_id, csv_path = self._queue[pos]
+        self._open_labels_file(sample_id, csv_path)
+        self.lbl_queue.setText(f"{pos + 1} / {len(self._queue)}")
+        self.btn_prev_rec.setEnabled(pos > 0)
+        self.btn_next_rec.setEnabled(pos < len(self._queue) - 1)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Decode (and draw the spectrogram of) the next queued recordings off the GUI thread."""
+        self._prefetch_gen += 1
+        gen, params, known = self._prefetch_gen, self._spec_params(), self._recordings.keys()
+        for _, csv_path in self._queue[self._queue_pos + 1:self._queue_pos + 1 + PREFETCH_AHEAD]:
+            fut = self._prefetch_pool.submit(self._prefetch, gen, Path(csv_path), params, known)
+            fut.add_done_callback(lambda f: self._sig_prefetched.emit(None if f.exception() else f.result()))
+
+    def _prefetch(self, gen: int, csv_path: Path, params: SpecParams, known: set) -> DecodedRecording | None:
+        """Prefetch worker: the recording behind `csv_path`, unless the queue moved on."""
+        audio = audio_for_labels(csv_path)
+        if audio is None or gen != self._prefetch_gen or recording_key(audio) in known:
+            return None
+        with span("audio.prefetch", file=audio.name):
+            proxy = ready_proxy(audio) or submit_proxy(audio).result()
+            if gen != self._prefetch_gen:
+                return None
+            rec = load_recording(audio, proxy, params)
+            if rec.activity is None:  # source needed no proxy (or predates the index)
+                rec.activity = build_activity(audio)
+            return rec
+
+    def _on_prefetched(self, rec: DecodedRecording | None):
+        if rec is not None:
+            self._recordings.put(rec, pinned=self._rec.key if self._rec is not None else None)
 
     # ===== audio =====
+    @traced("audio.attach")
     def _attach_audio(self):
         # ask to save current CSV if it has unsaved edits
         if not self._ask_save_if_dirty():
             return
 
-        path, _ = QFileDialog.getOpenFileName(self, "Attach WAV", str(Path.cwd()), "WAV Audio (*.wav)")
+        path, _ = QFileDialog.getOpenFileName(self, "Attach Audio", str(Path.cwd()), AUDIO_FILTER)
         if not path:
             return
 
@@ -348,16 +660,11 @@ class LabelEditorPage(QWidget):
         # choose CSV path for this audio (per-WAV file)
         csv_path = self._labels_path_for_audio(self.audio_path)
         self.labels_csv_path = csv_path
-        if not csv_path.exists():
-            pd.DataFrame(columns=LABEL_COLUMNS).to_csv(csv_path, index=False, encoding="utf-8")
+        if not csv_path.exists() and not get_writer().pending(csv_path):
+            write_csv_atomic(pd.DataFrame(columns=LABEL_COLUMNS), csv_path)
 
-        # visuals
-        try:
-            self._load_wav_array(self.audio_path)
-            self._render_waveform()
-            self._render_spectrogram()
-        except Exception as e:
-            QMessageBox.warning(self, "Audio", f"Could not render waveform/spectrogram:\n{e}")
+        # visuals (from the analysis proxy; built in the background on first attach)
+        self._load_visuals()
 
         # load table for this CSV
         self._reload_labels()
@@ -366,6 +673,9 @@ class LabelEditorPage(QWidget):
         self._sync_meta_latest(csv_path)
 
     def _toggle_play_pause(self):
+        if self.btn_review.isChecked():
+            self._pause() if self.review.is_playing() else self._play()
+            return
         state = self.player.playbackState()
         if state == QMediaPlayer.PlayingState:
             self.player.pause()
@@ -374,6 +684,56 @@ class LabelEditorPage(QWidget):
                 return
             self.player.play()
 
+    # ===== transport (normal player or fast review) =====
+    def _play(self):
+        if self.btn_review.isChecked():
+            self._start_review(self._position_ms())
+        else:
+            self.player.play()
+
+    def _pause(self):
+        if self.btn_review.isChecked():
+            self.review.stop()
+            self.player.setPosition(self.review.position_ms())
+        else:
+            self.player.pause()
+
+    def _stop(self):
+        self.review.stop()
+        self.player.stop()
+
+    def _seek(self, ms: int):
+        self.player.setPosition(ms)
+        if self.review.is_playing():
+            self._start_review(ms)
+
+    def _position_ms(self) -> int:
+        """Playhead in file time, whichever engine is playing."""
+        return self.review.position_ms() if self.review.is_playing() else self.playhead.position()
+
+    def _set_review(self, on: bool):
+        if on:
+            was_playing = self.player.playbackState() == QMediaPlayer.PlayingState
+            self.player.pause()
+            if was_playing:
+                self._start_review(self.playhead.position())
+        else:
+            if self.review.is_playing():
+                self.review.stop()
+                self.player.setPosition(self.review.position_ms())
+
+    def _start_review(self, ms: int):
+        """(Re)start review playback of the drawn recording at file time `ms`."""
+        if self._rec is None:
+            return
+        self.review.set_source(self._rec.samples, self._rec.samplerate, self._rec.energy())
+        self.review.play(ms / 1000.0, REVIEW_RATES[self.review_rate.currentIndex()],
+                         self.chk_skip_silence.isChecked(), float(self.spin_silence_db.value()))
+
+    def _restart_review(self, *_):
+        if self.review.is_playing():
+            self._start_review(self.review.position_ms())
+
     def _labels_path_for_audio(self, wav_path: Path) -> Path:
         """Return a unique CSV path for the current WAV under data/labels/."""
         safe_stem = "".join(ch if ch.isalnum() or ch in "-._" else "_" for ch in wav_path.stem)[:80]
@@ -382,6 +742,7 @@ class LabelEditorPage(QWidget):
 
     def _ask_save_if_dirty(self) -> bool:
         """Ask user to save current CSV when switching audio. Returns False on Cancel."""
+        self.rapid.flush()
         if not self._dirty or not self.labels_csv_path:
             return True
         ret = QMessageBox.question(
@@ -395,66 +756,238 @@ class LabelEditorPage(QWidget):
             return False
         if ret == QMessageBox.Yes:
             self._save_labels()
+        elif self._journal is not None:
+            self._journal.discard()
         return True
 
-    def _load_wav_array(self, wav_path: Path):
-        data, sr = sf.read(str(wav_path), always_2d=False)
-        if data.ndim > 1:
-            data = data.mean(axis=1)
-        if data.dtype.kind in ("i", "u"):
-            maxv = np.iinfo(data.dtype).max
-            data = data.astype(np.float32) / maxv
-        else:
-            data = data.astype(np.float32)
-        self._wav_data = data
-        self._wav_sr = int(sr)
+    def _load_visuals(self, reveal_s: float | None = None):
+        """Draw waveform/spectrogram for self.audio_path. Recently shown recordings
+        come straight from memory; otherwise they are drawn from the analysis proxy,
+        which is built off the GUI thread the first time a recording is seen."""
+        src = self.audio_path
+        try:
+            rec = self._recordings.get(recording_key(src))
+            proxy = ready_proxy(src) if rec is None else None
+        except Exception as e:
+            QMessageBox.warning(self, "Audio", f"Could not read audio:\n{e}")
+            return
+        if rec is not None:
+            self._show_recording(rec, reveal_s)
+            return
+        if proxy is not None:
+            self._show_visuals(proxy, reveal_s)
+            return
+        self.review.stop()
+        self._rec = None
+        self._wav_data = self._wav_sr = None
+        self.pg_wave.clear()
+        self.wave_view.set_source(None)
+        self.spec_view.set_source(None)
+        self.lanes.set_envelopes(None)
+        self.activity.set_activity(None)
+        self.minimap.set_overview(None)
+        self.minimap.setVisible(False)
+        self.spec_channel.setVisible(False)
+        self.pg_wave.setTitle("Preparing preview…", color="#9aa5b8")
+        self._pending_reveal = reveal_s
+        self._submit_proxy(src, None)
+
+    def _submit_proxy(self, src: Path, channel: int | None):
+        submit_proxy(src, channel).add_done_callback(lambda fut: self._sig_proxy_done.emit(str(src), channel, fut))
+
+    def _on_proxy_done(self, src: str, channel, fut):
+        if self.audio_path is None or str(self.audio_path) != src:
+            return  # another recording was opened meanwhile
+        err = fut.exception()
+        if channel is not None:  # single-channel proxy for the spectrogram
+            if self._rec is None or self.spec_channel.currentIndex() - 1 != channel:
+                return
+            self.pg_spec.setTitle(None)
+            if err is not None:
+                QMessageBox.warning(self, "Audio", f"Could not render the channel spectrogram:\n{err}")
+                return
+            self._rec.channels[channel] = load_mono(fut.result(), compact=True)[0]
+            self._render_spectrogram()
+            return
+        self.pg_wave.setTitle(None)
+        if err is not None:
+            QMessageBox.warning(self, "Audio", f"Could not render waveform/spectrogram:\n{err}")
+            return
+        self._show_visuals(fut.result(), self._pending_reveal)
 
+    def _show_visuals(self, path: Path, reveal_s: float | None):
+        """Decode the proxy at `path` (drawn for self.audio_path), keep it in memory and draw it."""
+        try:
+            with span("audio.decode", file=Path(path).name):
+                rec = load_recording(self.audio_path, path)
+        except Exception as e:
+            QMessageBox.warning(self, "Audio", f"Could not render waveform/spectrogram:\n{e}")
+            return
+        self._recordings.put(rec)
+        self._show_recording(rec, reveal_s)
+
+    def _show_recording(self, rec: DecodedRecording, reveal_s: float | None):
+        self.review.stop()
+        self._rec = rec
+        self._wav_data, self._wav_sr = rec.samples, rec.samplerate
+        try:
+            self._render_waveform()
+            self._show_lanes()
+            self._render_spectrogram()
+        except Exception as e:
+            QMessageBox.warning(self, "Audio", f"Could not render waveform/spectrogram:\n{e}")
+            return
+        self._show_overview()
+        self.activity.set_activity(rec.activity)
+        if rec.activity is None:
+            src = self.audio_path
+            submit_activity(src).add_done_callback(lambda fut: self._sig_activity_done.emit(str(src), fut))
+        if reveal_s is not None:
+            self._reveal_segment(reveal_s)
+
+    def _on_activity_done(self, src: str, fut):
+        err = fut.exception()
+        if err is not None:
+            print(f"[WARN] activity index for {Path(src).name} failed: {err}")
+            return
+        rec = self._recordings.get(recording_key(Path(src)))
+        if rec is None:
+            return
+        rec.activity = fut.result()
+        self._recordings.trim()
+        if rec is self._rec:
+            self.activity.set_activity(rec.activity)
+
+    def _show_overview(self):
+        env, bin_s = self._rec.overview()
+        self.minimap.set_overview(env, bin_s)
+        self.minimap.set_labels(self._label_spans())
+        self.minimap.set_viewport(*self.pg_wave.getPlotItem().vb.viewRange()[0])
+        self.minimap.setVisible(True)
+
+    def _show_range(self, x0: float, x1: float):
+        """Scroll/zoom the plots to [x0, x1] (from the minimap)."""
+        self.pg_wave.setXRange(x0, x1, padding=0)
+
+    def _show_lanes(self):
+        """One lane per channel (and a spectrogram channel picker) for multichannel audio."""
+        env = self._rec.envelopes
+        exact = self.audio_path if self._rec.info.backend == "soundfile" else None
+        self.lanes.set_envelopes(env, exact, link_to=self.pg_wave.getPlotItem())
+        self.spec_channel.blockSignals(True)
+        self.spec_channel.clear()
+        if env is not None:
+            self.spec_channel.addItems(["Mix"] + [f"Ch {c + 1}" for c in range(env.channels)])
+        self.spec_channel.blockSignals(False)
+        self.spec_channel.setVisible(env is not None)
+        if env is not None and self.splitter.widget(0).isVisible():
+            sizes = self.splitter.sizes()
+            self.splitter.setSizes([220 + LANE_HEIGHT * env.channels] + sizes[1:])
+
+    def _on_spec_channel(self, index: int):
+        """Spectrogram of the mix (index 0) or of one channel, built on first use."""
+        if self._rec is None or index < 0:
+            return
+        self.pg_spec.setTitle(None)
+        channel = index - 1
+        if index > 0 and channel not in self._rec.channels:
+            path = ready_proxy(self.audio_path, channel)
+            if path is None:
+                self.spec_view.set_source(None)
+                self.pg_spec.setTitle(f"Preparing channel {index}…", color="#9aa5b8")
+                self._submit_proxy(self.audio_path, channel)
+                return
+            self._rec.channels[channel] = load_mono(path, compact=True)[0]
+        self._render_spectrogram()
+
+    @traced("render.waveform")
     def _render_waveform(self):
         if self._wav_data is None or self._wav_sr is None:
             return
-        n = self._wav_data.shape[0]
-        t = np.arange(n, dtype=np.float32) / float(self._wav_sr)
         self.pg_wave.clear()
-        self.pg_wave.plot(t, self._wav_data, pen=pg.mkPen("#cdd5e4", width=1))
+        self.wave_view.set_source(self._wav_data, self._wav_sr, self._rec.mix_envelope())
+        # the curve only holds the range in view, so fix the axes to the whole file
+        env, bin_s = self._rec.overview()
+        lo, hi = (float(env.min()), float(env.max())) if len(env) else (-1.0, 1.0)
+        self.pg_wave.setYRange(lo, hi if hi > lo else lo + 1.0)
+        self.pg_wave.setXRange(0.0, len(self._wav_data) / float(self._wav_sr), padding=0)
+        self._shown_sec["wave"] = None
         self._playhead_wave = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=pg.mkPen("#2aa3ff", width=2))
         self.pg_wave.addItem(self._playhead_wave)
 
+    def _spec_params(self) -> SpecParams:
+        n_fft = FFT_SIZES[self.spec_fft.currentIndex()]
+        return SpecParams(n_fft=n_fft, hop=n_fft // SPEC_HOPS[self.spec_hop.currentText()],
+                          scale=SCALES[self.spec_scale.currentIndex()])
+
+    @traced("render.spectrogram")
     def _render_spectrogram(self):
-        if self._wav_data is None or self._wav_sr is None:
+        """Spectrogram of the mix or the picked channel with the chosen FFT size/hop/axis
+        (each combination is computed once per cached recording)."""
+        rec = self._rec
+        channel = self.spec_channel.currentIndex() - 1 if self.spec_channel.currentIndex() > 0 else None
+        if rec is None or (channel is not None and channel not in rec.channels):
             return
-        nperseg, noverlap = 1024, 512
-        f, t, Sxx = spectrogram(
-            self._wav_data,
-            fs=self._wav_sr,
-            window="hann",
-            nperseg=nperseg,
-            noverlap=noverlap,
-            detrend=False,
-            mode="magnitude",
-        )
-        Sxx_db = 20 * np.log10(np.maximum(Sxx, 1e-10))
-        self._img_spec.setImage(Sxx_db.T, autoLevels=True)
-        dt = t[1] - t[0] if len(t) > 1 else 1.0
-        df = f[1] - f[0] if len(f) > 1 else 1.0
-        self._img_spec.resetTransform()
-        self._img_spec.scale(dt, df)
-        self._img_spec.setPos(0.0, 0.0)
+        spec = rec.spectrogram(channel, self._spec_params())
+        self._recordings.trim()  # the entry just grew
+        bands = spec.db.shape[1]
+        left = self.pg_spec.getAxis("left")
+        if spec.scale == "linear":
+            df = spec.freqs[1] - spec.freqs[0] if bands > 1 else 1.0
+            self.spec_view.set_source(spec, df * bands)
+            left.setTicks(None)
+        else:
+            # one image row per band; label the rows with round frequencies
+            self.spec_view.set_source(spec, float(bands))
+            hz = [f for f in FREQ_TICKS_HZ if spec.freqs[0] <= f <= spec.freqs[-1]]
+            rows = np.interp(hz, spec.freqs, np.arange(bands)) + 0.5
+            left.setTicks([[(r, f"{f // 1000}k" if f >= 1000 else str(f)) for r, f in zip(rows, hz)]])
 
         self.pg_spec.removeItem(self._playhead_spec)
         self._playhead_spec = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=pg.mkPen("#2aa3ff", width=2))
         self.pg_spec.addItem(self._playhead_spec)
+        self._shown_sec["spec"] = None
+        self.viewport.refresh()
 
     # ===== player <-> UI sync =====
-    def _on_position_changed(self, ms: int):
-        self.line_pos.setText(f"{ms/1000.0:.3f}")
-        if not self.slider.isSliderDown():
+    def _on_playhead_frame(self, ms: int):
+        """Called once per display frame (or on seek) by PlayheadDriver."""
+        pos_text = f"{ms/1000.0:.3f}"
+        if pos_text != self._shown_pos_text:
+            self._shown_pos_text = pos_text
+            self.line_pos.setText(pos_text)
+        if not self.slider.isSliderDown() and self.slider.value() != ms:
             self.slider.setValue(ms)
         self._update_time_label(ms, self.player.duration())
         sec = ms / 1000.0
-        if self._playhead_wave:
-            self._playhead_wave.setPos(sec)
-        if self._playhead_spec:
-            self._playhead_spec.setPos(sec)
+        if self.btn_follow.isChecked() and (self.playhead.is_running() or self.review.is_playing()):
+            self._follow_playhead(sec)
+        self._move_playhead("wave", self.pg_wave, self._playhead_wave, sec)
+        self._move_playhead("spec", self.pg_spec, self._playhead_spec, sec)
+        self.lanes.set_playhead(sec)
+        self.activity.set_playhead(sec)
+        self.minimap.set_playhead(sec)
+
+    def _move_playhead(self, key: str, plot: pg.PlotWidget, line: pg.InfiniteLine, sec: float):
+        """Move a playhead line only when it lands on a different pixel column."""
+        if line is None:
+            return
+        last = self._shown_sec[key]
+        if last is not None:
+            vb = plot.getPlotItem().vb
+            (x0, x1), _ = vb.viewRange()
+            sec_per_px = (x1 - x0) / max(1.0, vb.width())
+            if abs(sec - last) < sec_per_px:
+                return
+        self._shown_sec[key] = sec
+        line.setPos(sec)
+
+    def _follow_playhead(self, sec: float):
+        """Page-flip the visible X range when the playhead leaves it (the plots are X-linked)."""
+        (x0, x1), _ = self.pg_wave.getPlotItem().vb.viewRange()
+        w = x1 - x0
+        if w > 0 and not (x0 <= sec <= x1 - 0.02 * w):
+            self.pg_wave.setXRange(sec - 0.05 * w, sec + 0.95 * w, padding=0)
 
     def _on_duration_changed(self, ms: int):
         self.slider.setRange(0, ms)
@@ -464,27 +997,70 @@ class LabelEditorPage(QWidget):
         self.player.setPosition(ms)
 
     def _seek_release(self):
-        self.player.setPosition(self.slider.value())
+        self._seek(self.slider.value())
 
     def _update_time_label(self, pos_ms: int, dur_ms: int):
         def fmt(m):
             s = int(m / 1000)
             return f"{s//60:02d}:{s%60:02d}"
-        self.lbl_time.setText(f"{fmt(pos_ms)} / {fmt(dur_ms)}")
+        text = f"{fmt(pos_ms)} / {fmt(dur_ms)}"
+        if text != self._shown_time_text:
+            self._shown_time_text = text
+            self.lbl_time.setText(text)
 
     def _on_wave_click(self, ev):
         if self._wav_sr is None:
             return
         vb = self.pg_wave.getPlotItem().vb
         sec = max(0.0, float(vb.mapSceneToView(ev.scenePos()).x()))
-        self.player.setPosition(int(sec * 1000))
+        self._seek(int(sec * 1000))
 
     def _on_spec_click(self, ev):
         if self._wav_sr is None:
             return
         vb = self.pg_spec.getPlotItem().vb
         sec = max(0.0, float(vb.mapSceneToView(ev.scenePos()).x()))
-        self.player.setPosition(int(sec * 1000))
+        self._seek(int(sec * 1000))
+
+    # ===== event navigation =====
+    def _label_spans(self) -> list[tuple[float, float]]:
+        df = self.model.dataframe() if self.model else None
+        if df is None or not len(df):
+            return []
+        start = pd.to_numeric(df["start_s"], errors="coerce")
+        end = pd.to_numeric(df["end_s"], errors="coerce")
+        ok = start.notna() & end.notna()
+        return list(zip(start[ok].astype(float), end[ok].astype(float)))
+
+    def _show_label_spans(self, *_):
+        spans = self._label_spans()
+        self.activity.set_spans(spans)
+        self.minimap.set_labels(spans)
+
+    def _jump(self, unlabeled: bool, step: int):
+        """Seek to the start of the next (step > 0) or previous active region,
+        optionally only among regions not covered by a label row."""
+        rec = self._rec
+        if rec is None:
+            return
+        if rec.activity is None:
+            self.lbl_status.setText("Activity index is still being built…")
+            return
+        regions = rec.activity.regions(float(self.spin_silence_db.value()))
+        if unlabeled:
+            regions = subtract_spans(regions, self._label_spans())
+        pos = self._position_ms() / 1000.0
+        if step > 0:
+            target = next((a for a, _ in regions if a > pos + JUMP_AHEAD_S), None)
+        else:
+            target = next((a for a, _ in reversed(regions) if a < pos - JUMP_BACK_S), None)
+        what = "unlabeled event" if unlabeled else "event"
+        if target is None:
+            self.lbl_status.setText(f"No {'later' if step > 0 else 'earlier'} {what}")
+            return
+        self._seek(int(target * 1000))
+        self._follow_playhead(target)
+        self.lbl_status.setText(f"{what.capitalize()} at {target:.3f} s")
 
     # ===== marks & rows =====
     def _mark_start(self):
@@ -499,30 +1075,56 @@ class LabelEditorPage(QWidget):
             return
         s_txt, e_txt = self.line_start.text().strip(), self.line_end.text().strip()
         if not s_txt or not e_txt:
-            QMessageBox.warning(self, "Missing marks", "Please mark Start and End first.")
+            self._notify("Missing marks", "Please mark Start and End first.")
             return
         try:
             s, e = float(s_txt), float(e_txt)
             if e < s:
                 s, e = e, s
         except Exception:
-            QMessageBox.warning(self, "Invalid marks", "Start/End must be numbers.")
+            self._notify("Invalid marks", "Start/End must be numbers.")
             return
 
-        cls = self.class_combo.currentText().strip()
-        row = {
+        self._add_segments([(s, e, self.class_combo.currentText().strip())])
+        self.line_start.clear()
+        self.line_end.clear()
+
+    def _add_segments(self, segments: list[tuple[float, float, str]]):
+        """Append (start_s, end_s, label_class) rows as one undoable insert."""
+        if not self.model or not self.sample_id:
+            self._notify("No labels file", "Attach or open audio before adding segments.")
+            return
+        stamp = datetime.now().isoformat(timespec="seconds")
+        rows = [{
             "sample_id": self.sample_id,
             "audio_path": str(self.audio_path or ""),
             "start_s": f"{s:.3f}",
             "end_s": f"{e:.3f}",
             "label_class": cls,
             "notes": "",
-            "created_at": datetime.now().isoformat(timespec="seconds"),
-        }
-        self.model.insert_empty_row(row)
-        self._dirty = True
-        self.line_start.clear()
-        self.line_end.clear()
+            "created_at": stamp,
+            "label_id": new_label_id(),
+        } for s, e, cls in segments]
+        text = "Add row" if len(rows) == 1 else f"Add {len(rows)} rows"
+        self.undo_stack.push(InsertRowsCommand(self.model, self._journal, self.model.rowCount(), rows, text))
+        if self.rapid.is_active():
+            self.table.scrollToBottom()
+
+    def _notify(self, title: str, text: str):
+        """Warning dialog, or just the status line in rapid mode (never blocks playback)."""
+        if self.rapid.is_active():
+            self.lbl_status.setText(f"⚠ {text}")
+        else:
+            QMessageBox.warning(self, title, text)
+
+    def _set_rapid(self, on: bool):
+        self.rapid.set_active(on)
+        self.lbl_bindings.setText(self.rapid.bindings_text())
+        self.lbl_bindings.setVisible(on)
+        if on:
+            self._autosave.start()
+        else:
+            self._autosave.stop()
 
     def _delete_rows(self):
         """Delete selected rows from the table/model."""
@@ -531,46 +1133,158 @@ class LabelEditorPage(QWidget):
         sel = self.table.selectionModel().selectedRows()
         if not sel:
             return
-        self.model.remove_rows([ix.row() for ix in sel])
-        self._dirty = True
+        rows = [ix.row() for ix in sel]
+        text = "Delete row" if len(rows) == 1 else f"Delete {len(rows)} rows"
+        self.undo_stack.push(RemoveRowsCommand(self.model, self._journal, rows, text))
+
+    def _set_class_for_selection(self):
+        """Bulk edit: set label_class of all selected rows to the current class."""
+        if not self.model:
+            return
+        sel = self.table.selectionModel().selectedRows()
+        if not sel:
+            return
+        col = list(self.model.dataframe().columns).index("label_class")
+        cls = self.class_combo.currentText().strip()
+        cells = [(ix.row(), col, cls) for ix in sel]
+        self.undo_stack.push(SetCellsCommand(self.model, self._journal, cells, f"Set class of {len(cells)} rows"))
+
+    def _on_cell_edit(self, row: int, col: int, value) -> bool:
+        """Edit interceptor for the table: turn each edit into an undoable command."""
+        if str(self.model.dataframe().iat[row, col]) == str(value):
+            return True
+        self.undo_stack.push(SetCellsCommand(self.model, self._journal, [(row, col, value)]))
+        return True
 
     # ===== CSV I/O =====
+    @traced("labels.load")
     def _reload_labels(self):
         """Load labels CSV into the table model (ensure required columns)."""
         if not self.labels_csv_path:
             return
+        get_writer().flush(self.labels_csv_path)
         try:
-            df = pd.read_csv(self.labels_csv_path, dtype=str, encoding="utf-8")
+            df, version = read_csv_versioned(self.labels_csv_path)
         except Exception:
-            df = pd.DataFrame(columns=LABEL_COLUMNS)
+            df, version = pd.DataFrame(columns=LABEL_COLUMNS), None
+        if LABELS.detect_version(df.columns) != LABELS.version:
+            df = LABELS.migrate(df)  # older layout: upgraded in memory, written back on save
 
         for c in LABEL_COLUMNS:
             if c not in df.columns:
                 df[c] = ""
         df = df[LABEL_COLUMNS]
+        self._base_df, self._base_version = df.copy(), version
+
+        # crash recovery: replay edits journaled after the last save
+        self._close_journal()
+        journal = LabelJournal(self.labels_csv_path, self)
+        recovered = False
+        ops = journal.pending_ops()
+        if ops:
+            ret = QMessageBox.question(
+                self,
+                "Recover unsaved edits?",
+                f"{len(ops)} unsaved edit(s) to {self.labels_csv_path.name} were found "
+                f"from a previous session.\nRestore them?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes,
+            )
+            if ret == QMessageBox.Yes:
+                df = replay(df, ops)
+                recovered = True
+            else:
+                journal.discard()
+        self._journal = journal
 
         self.model = PandasModel(df)
+        self.model.set_edit_interceptor(self._on_cell_edit)
         self.table.setModel(self.model)
+        self.table.setColumnHidden(LABEL_COLUMNS.index("label_id"), True)  # merge key, not for editing
         self.table.resizeColumnsToContents()
 
-        # watch edits to set _dirty
+        self.undo_stack.clear()
         self._dirty = False
-        self.model.dataChanged.connect(self._mark_dirty)
-        self.model.rowsInserted.connect(self._mark_dirty)
-        self.model.rowsRemoved.connect(self._mark_dirty)
+        if recovered:
+            self.undo_stack.resetClean()
+            self._mark_dirty()
         self._apply_class_delegate()
+        self._show_label_spans()
 
+    @traced("labels.save")
     def _save_labels(self):
-        """Persist the model dataframe to CSV (with numeric rounding)."""
+        """Compact the journal: write a full CSV snapshot atomically in the background."""
+        self.rapid.flush()
         if not self.model or not self.labels_csv_path:
             return
         df = self.model.dataframe().copy()
         for col in ("start_s", "end_s"):
             df[col] = pd.to_numeric(df[col], errors="coerce").round(3).astype(str)
-        df.to_csv(self.labels_csv_path, index=False, encoding="utf-8")
+        if self._journal is not None:
+            self._journal.checkpoint()
+        self.undo_stack.setClean()
         self._dirty = False
-        self._sync_meta_latest(self.labels_csv_path)
-        QMessageBox.information(self, "Saved", f"Saved labels:\n{self.labels_csv_path}")
+        self.lbl_status.setText(f"Saving {self.labels_csv_path.name}…")
+
+        path = self.labels_csv_path
+        base, base_version = self._base_df, self._base_version
+        # the next save is edited from this snapshot (its version is known once written)
+        self._base_df, self._base_version = df, None
+        self._save_seq += 1
+        seq = self._save_seq
+
+        def done(fut):
+            # runs on the writer thread; hop to the GUI thread via a signal
+            err = fut.exception()
+            self._sig_saved.emit(str(path), None if err else fut.result(), df, str(err or ""), seq)
+
+        get_writer().save(path, df, base=base, base_version=base_version,
+                          key=LABEL_MERGE_KEY, schema=LABELS).add_done_callback(done)
+
+    def _on_saved(self, csv_path: str, result, snapshot: pd.DataFrame, error: str, seq: int):
+        """Labels snapshot reached the disk (or failed); runs on the GUI thread."""
+        path = Path(csv_path)
+        current = self._journal is not None and self._journal.csv_path == path
+        if error:
+            self.lbl_status.setText(f"Save failed: {path.name}")
+            if current:
+                self.undo_stack.resetClean()
+                self._mark_dirty()
+            if self.rapid.is_active():
+                self.lbl_status.setText(f"⚠ Save failed: {path.name} ({error}); retrying on the next autosave")
+            else:
+                QMessageBox.critical(self, "Save error", f"Could not save labels:\n{error}")
+            return
+        # journal ops after the checkpoint are relative to `snapshot`; if the file on
+        # disk is a merge of it, the snapshot is journaled too (see label_journal.replay)
+        merged = (snapshot, LABEL_MERGE_KEY) if result.merged else ()
+        if not current:
+            LabelJournal(path).commit_checkpoint(result.version, *merged)
+        elif seq == self._save_seq:
+            self._journal.commit_checkpoint(result.version, *merged)
+        # else: a newer save is in flight and checkpoints the journal when it lands
+        get_label_index().submit_update(path)
+        self._sync_meta_latest(path)
+        stamp = f"{datetime.now():%H:%M:%S}"
+        if not result.merged:
+            if current and seq == self._save_seq:
+                self._base_version = result.version
+            self.lbl_status.setText(f"Saved {path.name} • {stamp}")
+            return
+        # another annotator saved this file meanwhile; their rows were merged in
+        note = f" ({result.conflicts} conflict(s), ours kept)" if result.conflicts else ""
+        if current and seq == self._save_seq and self.undo_stack.isClean():
+            self._journal.discard()  # everything journaled is in the merged file
+            self._reload_labels()
+            self.lbl_status.setText(f"Saved {path.name}, merged with other changes{note} • {stamp}")
+        else:
+            self.lbl_status.setText(f"Saved {path.name}, merged with other changes{note}; reload to see them • {stamp}")
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal.deleteLater()
+            self._journal = None
 
     def _sync_meta_latest(self, latest_csv: Path):
         """Update META_CSV to point 'labels_csv' of this sample to the latest CSV path."""
@@ -578,33 +1292,41 @@ class LabelEditorPage(QWidget):
             return
         if not META_CSV.exists():
             return
-        try:
-            df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
-        except Exception:
-            return
-        if "labels_csv" not in df.columns:
-            df["labels_csv"] = ""
-        mask = df["sample_id"].astype(str) == str(self.sample_id)
-        if mask.any():
+        sample_id = str(self.sample_id)
+
+        def point_to_latest(df: pd.DataFrame) -> pd.DataFrame | None:
+            if "sample_id" not in df.columns:
+                return None
+            if "labels_csv" not in df.columns:
+                df["labels_csv"] = ""
+            mask = df["sample_id"].astype(str) == sample_id
+            if not mask.any() or (df.loc[mask, "labels_csv"] == str(latest_csv)).all():
+                return None  # nothing to change → no rewrite
             df.loc[mask, "labels_csv"] = str(latest_csv)
-            df.to_csv(META_CSV, index=False, encoding="utf-8")
+            return df
+
+        def done(fut):
+            if fut.exception() is not None:
+                self._sig_meta_failed.emit(str(fut.exception()))
+
+        get_writer().update(META_CSV, point_to_latest).add_done_callback(done)
 
     # ===== classes from sample_list.csv =====
     def _load_classes(self):
         """Load unique class values from SAMPLE_LIST_CSV column named 'type' (case-insensitive)."""
         opts = [""]
+        get_writer().flush(SAMPLE_LIST_CSV)
         if SAMPLE_LIST_CSV.exists():
             try:
-                df = pd.read_csv(SAMPLE_LIST_CSV)
-                col = next((c for c in df.columns if c.strip().lower() == "type"), None)
-                if col:
-                    vals = [str(x) for x in df[col].dropna().unique().tolist()]
-                    vals.sort()
-                    opts = [""] + vals
+                types = SAMPLE_TYPES.read_text(SAMPLE_LIST_CSV, ["Type"])["Type"]
+                vals = sorted(v for v in types.unique().tolist() if v)
+                opts = [""] + vals
             except Exception as e:
                 print("[WARN] Could not load sample_list.csv:", e)
 
         self._class_options = opts
+        self.rapid.set_classes(opts)
+        self.lbl_bindings.setText(self.rapid.bindings_text())
         self.class_combo.blockSignals(True)
         self.class_combo.clear()
         self.class_combo.addItems(self._class_options)
@@ -640,8 +1362,15 @@ class LabelEditorPage(QWidget):
         """Convenience: open file picker to attach a WAV right away."""
         self._attach_audio()
 
-    def open_existing(self, sample_id: str, csv_path: str):
-        """Open an existing labels CSV (and try to load its audio for visuals)."""
+    @traced("editor.open")
+    def open_existing(self, sample_id: str, csv_path: str, start_s: float | None = None):
+        """Open an existing labels CSV (and try to load its audio for visuals).
+        With start_s (e.g. from segment search) the view is seeked to that segment."""
+        self._set_queue([])
+        self._open_labels_file(sample_id, csv_path, start_s)
+
+    def _open_labels_file(self, sample_id: str, csv_path: str, start_s: float | None = None):
+        self.rapid.flush()
         self.sample_id = sample_id
         self.labels_csv_path = Path(csv_path)
         # Load table
@@ -659,16 +1388,30 @@ class LabelEditorPage(QWidget):
                 self.audio_path = Path(audio)
                 self.player.setSource(QUrl.fromLocalFile(audio))
                 self.player.pause()  # don't auto-play for existing session
-                self._load_wav_array(self.audio_path)
-                self._render_waveform()
-                self._render_spectrogram()
+                self._load_visuals(start_s)
             else:
                 # Ask user to attach a WAV if we couldn't resolve it
                 QMessageBox.information(self, "Attach audio",
-                                        "No valid audio path found in CSV. Please attach a WAV.")
+                                        "No valid audio path found in CSV. Please attach an audio file.")
         except Exception:
             pass
 
+    def _reveal_segment(self, start_s: float, span_s: float = 10.0):
+        """Seek to start_s, scroll the plots to it and select its table row."""
+        self.player.setPosition(int(start_s * 1000))
+        self.pg_wave.setXRange(start_s - 0.1 * span_s, start_s + 0.9 * span_s, padding=0)
+        df = self.model.dataframe() if self.model else None
+        if df is not None and len(df) and "start_s" in df.columns:
+            dist = (pd.to_numeric(df["start_s"], errors="coerce") - start_s).abs()
+            if dist.notna().any() and dist.min() < 1e-3:
+                row = int(dist.to_numpy().argmin())
+                self.table.selectRow(row)
+                self.table.scrollTo(self.model.index(row, 0))
+
     def _mark_dirty(self, *args, **kwargs):
         """Flag current CSV as having unsaved edits."""
         self._dirty = True
+
+    def _on_clean_changed(self, clean: bool):
+        """Undo stack reached/left the last saved state."""
+        self._dirty = not clean
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
     QTableView, QLabel, QFrame, QFileDialog, QMessageBox
 )
 
+from code.core.instrument import traced
 from code.ui.widgets.pandas_model import PandasModel
 
 DATA_DIR   = Path.cwd() / "data"
@@ -20,6 +21,7 @@ class LabelsPickerPage(QWidget):
     """Shows all label CSVs linked to a given sample_id and lets the user pick one to edit."""
     sig_go_back = Signal()                              # back to EditHub
     sig_open_labels = Signal(str, str)                  # (sample_id, csv_path)
+    sig_open_queue = Signal(list, int)                  # ([(sample_id, csv_path), ...], start index)
 
     def __init__(self):
         super().__init__()
@@ -44,10 +46,13 @@ class LabelsPickerPage(QWidget):
         self.search = QLineEdit(); self.search.setPlaceholderText("Filter by file name or path...")
         self.btn_reload = QPushButton("↻ Reload"); self.btn_reload.setProperty("variant", "soft")
         self.btn_open   = QPushButton("✳ Open Selected"); self.btn_open.setProperty("variant", "primary")
+        self.btn_queue  = QPushButton("⏭ Label in Order"); self.btn_queue.setProperty("variant", "accent")
+        self.btn_queue.setToolTip("Work through the listed CSVs one after another, starting at the selected one")
 
         tool.addWidget(self.search, 1)
         tool.addWidget(self.btn_reload)
         tool.addWidget(self.btn_open)
+        tool.addWidget(self.btn_queue)
 
         # Table
         self.table = QTableView()
@@ -67,6 +72,7 @@ class LabelsPickerPage(QWidget):
         # Wire
         self.btn_reload.clicked.connect(self._reload)
         self.btn_open.clicked.connect(self._open_selected)
+        self.btn_queue.clicked.connect(self._open_queue)
         self.search.returnPressed.connect(self._apply_filter)
 
     # -------- API --------
@@ -95,6 +101,7 @@ class LabelsPickerPage(QWidget):
         df = pd.DataFrame(rows, columns=["csv_name", "csv_path", "size_kb", "modified"])
         return df
 
+    @traced("labels.list")
     def _reload(self):
         df = self._scan_csvs()
         self._df = df
@@ -105,6 +112,7 @@ class LabelsPickerPage(QWidget):
         self.table.setModel(model)
         self.table.resizeColumnsToContents()
 
+    @traced("filter.label_files")
     def _apply_filter(self):
         if self._df is None:
             return
@@ -126,4 +134,14 @@ class LabelsPickerPage(QWidget):
             return
         r = sel[0].row()
         csv_path = model.index(r, model.columnCount()-3).sibling(r, 1).data()  # column 1 == csv_path
-        self.sig_open_labels.emit(self.sample_id, csv_path)
\ No newline at end of file
+        self.sig_open_labels.emit(self.sample_id, csv_path)
+
+    def _open_queue(self):
+        model = self.table.model()
+        if model is None or model.rowCount() == 0:
+            QMessageBox.information(self, "Label in order", "No CSVs listed.")
+            return
+        df = model.dataframe()
+        sel = self.table.selectionModel().selectedRows()
+        start = sel[0].row() if sel else 0
+        self.sig_open_queue.emit([(self.sample_id, p) for p in df["csv_path"].tolist()], start)
@@ -14,24 +14,51 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal, Qt, QDate, QTime
 from PySide6.QtGui import QDoubleValidator, QIntValidator
 
+from code.core.csv_writer import get_writer, write_csv_atomic
+from code.core.schema import META, META_COLUMNS, validate_records
+
 
 # Data locations
 DATA_DIR = Path.cwd() / "data"
 META_CSV = DATA_DIR / "samples_meta.csv"
 
-# Column order for metadata CSV
-META_COLUMNS = [
-    "sample_id", "date", "time",
-    "temperature_c", "pressure_kpa",
-    "latitude", "longitude",
-    "count", "sample_name",
-    "labels_csv", "created_at",
-]
+
+def append_meta_row(df: pd.DataFrame, row: dict) -> pd.DataFrame:
+    """Return metadata df (in META_COLUMNS order) with `row` appended."""
+    for col in META_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+    df = df[META_COLUMNS].reset_index(drop=True)
+    df.loc[len(df)] = {**{c: "" for c in META_COLUMNS}, **row}
+    return df
+
+
+def update_meta_row(df: pd.DataFrame, sample_id: str, row: dict) -> pd.DataFrame:
+    """Overwrite the fields of `sample_id` with `row` (append if the id is unknown)."""
+    if "sample_id" not in df.columns:
+        df["sample_id"] = ""
+
+    # ensure missing columns exist
+    for col in META_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+
+    mask = df["sample_id"].astype(str) == str(sample_id)
+    if mask.any():
+        for k, v in row.items():
+            if k in df.columns:
+                df.loc[mask, k] = v
+    else:
+        # if not found, append as new
+        df = df.reset_index(drop=True)
+        df.loc[len(df)] = {**{c: "" for c in df.columns}, **row}
+    return df
 
 
 class NewSamplePage(QWidget):
     sig_go_home = Signal()
     sig_go_step2 = Signal(str)  # emits sample_id
+    _sig_save_failed = Signal(str)  # error of one of this page's metadata writes (writer thread)
 
     def __init__(self):
         super().__init__()
@@ -127,6 +154,7 @@ class NewSamplePage(QWidget):
 
         # CSV ensure
         self._ensure_csv()
+        self._sig_save_failed.connect(self._on_write_failed)
 
         # Edit mode state
         self._edit_mode = False
@@ -138,17 +166,12 @@ class NewSamplePage(QWidget):
         Load an existing sample into the form and switch to edit mode.
         """
         self._ensure_csv()
-        try:
-            df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
-        except Exception:
-            QMessageBox.warning(self, "Load error", "Could not read samples_meta.csv")
-            return
-
-        if "sample_id" not in df.columns:
-            QMessageBox.information(self, "Not found", "No 'sample_id' column.")
-            return
+        get_writer().flush(META_CSV)
+        # as text: a value the schema cannot parse (e.g. a legacy "25C") is shown and
+        # validated on save rather than silently blanked
+        df = META.read_text(META_CSV)
 
-        row = df.loc[df["sample_id"].astype(str) == str(sample_id)]
+        row = df.loc[df["sample_id"] == str(sample_id)]
         if row.empty:
             QMessageBox.information(self, "Not found", f"Sample {sample_id} not found.")
             return
@@ -186,49 +209,26 @@ class NewSamplePage(QWidget):
     # ---------- CSV helpers ----------
     def _ensure_csv(self):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
-        if not META_CSV.exists():
-            pd.DataFrame(columns=META_COLUMNS).to_csv(META_CSV, index=False, encoding="utf-8")
+        if not META_CSV.exists() and not get_writer().pending(META_CSV):
+            write_csv_atomic(pd.DataFrame(columns=META_COLUMNS), META_CSV)
 
     def _append_row(self, row: dict):
         self._ensure_csv()
-        try:
-            df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
-        except Exception:
-            df = pd.DataFrame(columns=META_COLUMNS)
-
-        for col in META_COLUMNS:
-            if col not in df.columns:
-                df[col] = ""
-        df = df[META_COLUMNS]
-
-        df.loc[len(df)] = {**{c: "" for c in META_COLUMNS}, **row}
-        df.to_csv(META_CSV, index=False, encoding="utf-8")
+        self._watch(get_writer().update(META_CSV, lambda df: append_meta_row(df, row)))
 
     def _update_row(self, sample_id: str, row: dict):
         self._ensure_csv()
-        try:
-            df = pd.read_csv(META_CSV, dtype=str, encoding="utf-8")
-        except Exception:
-            df = pd.DataFrame(columns=META_COLUMNS)
+        self._watch(get_writer().update(META_CSV, lambda df: update_meta_row(df, sample_id, row)))
 
-        if "sample_id" not in df.columns:
-            df["sample_id"] = ""
+    def _watch(self, fut):
+        """Report a failure of this page's own write (others' META_CSV writes report theirs)."""
+        def done(f):
+            if f.exception() is not None:
+                self._sig_save_failed.emit(str(f.exception()))
+        fut.add_done_callback(done)
 
-        # ensure missing columns exist
-        for col in META_COLUMNS:
-            if col not in df.columns:
-                df[col] = ""
-
-        mask = df["sample_id"].astype(str) == str(sample_id)
-        if mask.any():
-            for k, v in row.items():
-                if k in df.columns:
-                    df.loc[mask, k] = v
-        else:
-            # if not found, append as new
-            df.loc[len(df)] = {**{c: "" for c in META_COLUMNS}, **row}
-
-        df.to_csv(META_CSV, index=False, encoding="utf-8")
+    def _on_write_failed(self, error: str):
+        QMessageBox.critical(self, "Save error", f"Could not save metadata:\n{error}")
 
     # ---------- Submit ----------
     def _handle_submit(self):
@@ -264,6 +264,11 @@ class NewSamplePage(QWidget):
             "created_at": created_at,
         }
 
+        errors = validate_records([row])
+        if errors:
+            QMessageBox.warning(self, "Validation", "\n".join(errors))
+            return
+
         try:
             if self._edit_mode and self._edit_sample_id:
                 # update existing
@@ -0,0 +1,247 @@
+# code/ui/pages/sample_map.py
+# Map-style scatter of sample locations with radius / visible-area queries
+# backed by the grid-bucket GeoIndex. Only the points inside the view are
+# drawn (looked up through the index); a zoomed-out view with too many points
+# is drawn as a density image instead, so panning stays smooth at any count.
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+
+from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
+    QFrame, QMessageBox, QTableView, QLabel, QSplitter
+)
+
+from code.core.csv_writer import csv_version, get_writer
+from code.core.geo_index import GeoIndex
+from code.core.instrument import traced
+from code.ui.widgets.pandas_model import PandasModel
+
+DATA_DIR = Path.cwd() / "data"
+META_CSV = DATA_DIR / "samples_meta.csv"
+
+MAX_DOTS = 20_000   # above this many points in view, draw density instead
+DENSITY_PX = 3      # density image cell size in screen pixels
+
+
+class SampleMapPage(QWidget):
+    sig_go_home = Signal()
+    sig_open_sample = Signal(str)  # sample_id -> pick one of its label CSVs
+
+    def __init__(self):
+        super().__init__()
+        self._geo: GeoIndex | None = None
+        self._geo_version = None
+        self._result_model: PandasModel | None = None
+        self._dot_ids = np.empty(0, dtype=object)  # sample_id per drawn dot
+
+        # --- Top bar ---
+        top = QHBoxLayout()
+        self.btn_back = QPushButton("← Home")
+        self.btn_back.setProperty("class", "back")
+        self.btn_back.clicked.connect(self.sig_go_home.emit)
+        title = QLabel("Sample Map")
+        title.setProperty("class", "h1")
+        top.addWidget(self.btn_back, alignment=Qt.AlignLeft)
+        top.addWidget(title, alignment=Qt.AlignLeft)
+        top.addStretch()
+
+        # --- Toolbar ---
+        tool_card = QFrame(); tool_card.setObjectName("toolCard")
+        tool = QHBoxLayout(tool_card); tool.setContentsMargins(12, 10, 12, 10); tool.setSpacing(8)
+        self.ed_center = QLineEdit(); self.ed_center.setPlaceholderText("Center: lat, lon  or  sample_id")
+        self.ed_radius = QLineEdit("5"); self.ed_radius.setPlaceholderText("km")
+        self.ed_radius.setMaximumWidth(90)
+        self.btn_radius = QPushButton("◎ Within Radius"); self.btn_radius.setProperty("variant", "primary")
+        self.btn_visible = QPushButton("▭ Visible Area"); self.btn_visible.setProperty("variant", "soft")
+        self.btn_reload = QPushButton("↻ Reload"); self.btn_reload.setProperty("variant", "soft")
+        tool.addWidget(self.ed_center, 1)
+        tool.addWidget(QLabel("Radius (km)"))
+        tool.addWidget(self.ed_radius)
+        tool.addWidget(self.btn_radius)
+        tool.addWidget(self.btn_visible)
+        tool.addWidget(self.btn_reload)
+
+        self.lbl_summary = QLabel("")
+        self.lbl_summary.setProperty("class", "subtle")
+
+        # --- Map ---
+        self.plot = pg.PlotWidget()
+        self.plot.setBackground("#151922")
+        self.plot.showGrid(x=True, y=True, alpha=0.15)
+        self.plot.setLabel("bottom", "Longitude (°)")
+        self.plot.setLabel("left", "Latitude (°)")
+        self.plot.setMenuEnabled(False)
+        self._density = pg.ImageItem()
+        self._density.setLookupTable(pg.ColorMap([0.0, 1.0], [(21, 25, 34, 0), (120, 170, 255, 255)]).getLookupTable(nPts=256))
+        self._dots = pg.ScatterPlotItem(size=4, pen=None, brush=pg.mkBrush(120, 170, 255, 150), hoverable=False)
+        self._hits = pg.ScatterPlotItem(size=8, pen=pg.mkPen("#1c1f26"), brush=pg.mkBrush("#ffa726"))
+        self._center = pg.ScatterPlotItem(size=14, symbol="+", pen=pg.mkPen("#ef5350", width=2), brush=None)
+        for item in (self._density, self._dots, self._hits, self._center):
+            self.plot.addItem(item)
+        self._dots.sigClicked.connect(self._on_dot_clicked)
+
+        # redraw the visible points shortly after the view stops moving
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(40)
+        self._redraw_timer.timeout.connect(self._redraw_points)
+        self.plot.getPlotItem().vb.sigRangeChanged.connect(lambda *_: self._redraw_timer.start())
+
+        # --- Results ---
+        self.table = QTableView()
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setDefaultSectionSize(30)
+        self.table.horizontalHeader().setResizeContentsPrecision(50)  # size columns from the first rows only
+
+        split = QSplitter(Qt.Horizontal)
+        split.addWidget(self.plot)
+        split.addWidget(self.table)
+        split.setStretchFactor(0, 3)
+        split.setStretchFactor(1, 2)
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(24, 24, 24, 24)
+        root.setSpacing(12)
+        root.addLayout(top)
+        root.addWidget(tool_card)
+        root.addWidget(self.lbl_summary)
+        root.addWidget(split, 1)
+
+        # Wire
+        self.btn_radius.clicked.connect(self._query_radius)
+        self.ed_center.returnPressed.connect(self._query_radius)
+        self.ed_radius.returnPressed.connect(self._query_radius)
+        self.btn_visible.clicked.connect(self._query_visible)
+        self.btn_reload.clicked.connect(self.open)
+        self.table.doubleClicked.connect(self._open_row)
+
+    # -------- API --------
+    @traced("map.build")
+    def open(self):
+        """(Re)build the index if samples_meta.csv changed and redraw the map."""
+        get_writer().flush(META_CSV)
+        version = csv_version(META_CSV)
+        if self._geo is not None and version == self._geo_version:
+            return
+        self._geo = GeoIndex.from_meta_csv(META_CSV)
+        self._geo_version = version
+        geo = self._geo
+        self._show_results(None)
+        if len(geo):
+            mid = float(np.median(geo.lat))
+            self.plot.getPlotItem().vb.setAspectLocked(True, ratio=max(np.cos(np.radians(mid)), 0.05))
+            pad = 0.01
+            self.plot.setRange(xRange=(float(geo.lon.min()) - pad, float(geo.lon.max()) + pad),
+                               yRange=(float(geo.lat.min()) - pad, float(geo.lat.max()) + pad))
+        self._redraw_points()
+        self.lbl_summary.setText(f"{len(geo):,} geotagged sample(s)")
+
+    # -------- Internals --------
+    def _parse_center(self) -> tuple[float, float] | None:
+        text = self.ed_center.text().strip()
+        if not text:
+            QMessageBox.warning(self, "Center", "Enter 'lat, lon' or a sample_id.")
+            return None
+        parts = [p for p in text.replace(",", " ").split() if p]
+        if len(parts) == 2:
+            try:
+                lat, lon = float(parts[0]), float(parts[1])
+            except ValueError:
+                pass
+            else:
+                if abs(lat) <= 90 and abs(lon) <= 180:
+                    return lat, lon
+                QMessageBox.warning(self, "Center", "Latitude must be within ±90 and longitude within ±180.")
+                return None
+        hit = self._geo.locate(text) if self._geo is not None else None
+        if hit is None:
+            QMessageBox.warning(self, "Center", f"No geotagged sample '{text}'.")
+        return hit
+
+    def _query_radius(self):
+        if self._geo is None:
+            self.open()
+        center = self._parse_center()
+        if center is None:
+            return
+        try:
+            km = float(self.ed_radius.text().strip())
+            if km <= 0:
+                raise ValueError
+        except ValueError:
+            QMessageBox.warning(self, "Radius", "Radius must be a positive number of km.")
+            return
+        df = self._geo.radius(center[0], center[1], km)
+        self._center.setData(x=[center[1]], y=[center[0]])
+        self._show_results(df)
+        self.lbl_summary.setText(f"{len(df):,} sample(s) within {km:g} km of {center[0]:.5f}, {center[1]:.5f}")
+        # frame the search circle
+        dlat = km / 111.2
+        dlon = dlat / max(np.cos(np.radians(center[0])), 0.05)
+        self.plot.setRange(xRange=(center[1] - dlon, center[1] + dlon),
+                           yRange=(center[0] - dlat, center[0] + dlat), padding=0.1)
+
+    def _query_visible(self):
+        if self._geo is None:
+            self.open()
+        (x0, x1), (y0, y1) = self.plot.getPlotItem().vb.viewRange()
+        df = self._geo.bbox(y0, y1, x0, x1)
+        self._center.setData(x=[], y=[])
+        self._show_results(df)
+        self.lbl_summary.setText(f"{len(df):,} sample(s) in view")
+
+    @traced("map.redraw")
+    def _redraw_points(self):
+        """Draw the points inside the current view: dots, or density if too many."""
+        self._redraw_timer.stop()
+        if self._geo is None:
+            return
+        vb = self.plot.getPlotItem().vb
+        (x0, x1), (y0, y1) = vb.viewRange()
+        pts = self._geo.bbox(max(y0, -90.0), min(y1, 90.0), max(x0, -180.0), min(x1, 180.0))
+        if len(pts) <= MAX_DOTS:
+            self._density.hide()
+            self._dot_ids = pts["sample_id"].to_numpy()
+            self._dots.setData(x=pts["longitude"].to_numpy(), y=pts["latitude"].to_numpy())
+            return
+        self._dot_ids = np.empty(0, dtype=object)
+        self._dots.setData(x=[], y=[])
+        w = max(int(vb.width() / DENSITY_PX), 1)
+        h = max(int(vb.height() / DENSITY_PX), 1)
+        hist, _, _ = np.histogram2d(pts["longitude"].to_numpy(), pts["latitude"].to_numpy(),
+                                    bins=(w, h), range=((x0, x1), (y0, y1)))
+        img = np.log1p(hist)
+        self._density.setImage(img, levels=(0.0, max(float(img.max()), 1e-9)))
+        self._density.setRect(x0, y0, x1 - x0, y1 - y0)
+        self._density.show()
+
+    def _show_results(self, df: pd.DataFrame | None):
+        if df is None:
+            df = pd.DataFrame(columns=["sample_id", "latitude", "longitude"])
+        self._hits.setData(x=df["longitude"].to_numpy(), y=df["latitude"].to_numpy())
+        view = df.copy()
+        for c in ("latitude", "longitude"):
+            view[c] = view[c].map("{:.5f}".format)
+        if "distance_km" in view.columns:
+            view["distance_km"] = view["distance_km"].map("{:.3f}".format)
+        self._result_model = PandasModel(view.reset_index(drop=True))
+        self.table.setModel(self._result_model)
+        self.table.resizeColumnsToContents()
+
+    def _on_dot_clicked(self, _item, points, *_):
+        if not len(points) or self._geo is None:
+            return
+        self.ed_center.setText(str(self._dot_ids[points[0].index()]))
+
+    def _open_row(self, index):
+        if self._result_model is None or not index.isValid():
+            return
+        sid = str(self._result_model.dataframe().iloc[index.row()]["sample_id"])
+        self.sig_open_sample.emit(sid)
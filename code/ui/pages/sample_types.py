@@ -14,6 +14,8 @@ from PySide6.QtGui import QAction
 from pathlib import Path
 import pandas as pd
 
+from code.core.csv_writer import get_writer, write_csv_atomic
+from code.core.schema import SAMPLE_TYPES
 from code.ui.widgets.pandas_model import PandasModel
 
 # Where to keep CSV (project local ./data/sample_list.csv)
@@ -21,7 +23,7 @@ DATA_DIR = Path.cwd() / "data"
 CSV_PATH = DATA_DIR / "sample_list.csv"
 
 # Default schema / initial rows
-DEFAULT_COLUMNS = ["ID", "Type", "Factor", "Value", "Count"]
+DEFAULT_COLUMNS = list(SAMPLE_TYPES.columns)
 DEFAULT_ROWS = [
     {"ID": 1, "Type": "Acoustic", "Factor": "SNR", "Value": 20, "Count": 3},
     {"ID": 2, "Type": "Acoustic", "Factor": "SNR", "Value": 21, "Count": 4},
@@ -105,6 +107,9 @@ class SampleTypesPage(QWidget):
         self.btn_export.clicked.connect(self.export_csv_dialog)
 
         self.model = None
+        self._save_pending = False
+        get_writer().sig_written.connect(self._on_csv_written)
+        get_writer().sig_failed.connect(self._on_csv_failed)
         self.ensure_csv_exists()
         self.load_csv()
         self._make_shortcuts()
@@ -114,30 +119,24 @@ class SampleTypesPage(QWidget):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         if not CSV_PATH.exists():
             df = pd.DataFrame(DEFAULT_ROWS, columns=DEFAULT_COLUMNS)
-            df.to_csv(CSV_PATH, index=False, encoding="utf-8")
+            write_csv_atomic(df, CSV_PATH)
 
     def load_csv(self):
         """Load CSV into the table model."""
+        get_writer().flush(CSV_PATH)
         try:
-            df = pd.read_csv(CSV_PATH, dtype=str, encoding="utf-8")
+            # required columns in default order (header case is forgiven)
+            df = SAMPLE_TYPES.read_text(CSV_PATH)
         except Exception:
             # If file invalid, recreate with default schema
-            df = pd.DataFrame(columns=DEFAULT_COLUMNS)
+            df = SAMPLE_TYPES.conform(pd.DataFrame())
 
-        # Ensure required columns exist
-        for col in DEFAULT_COLUMNS:
-            if col not in df.columns:
-                df[col] = ""
-
-        # Reorder columns to default order
-        df = df[DEFAULT_COLUMNS]
-
-        # Convert numeric columns if possible
+        # Convert numeric columns if every non-blank value is a number (blanks -> NaN)
         for col in ("ID", "Value", "Count"):
-            try:
-                df[col] = pd.to_numeric(df[col], errors="ignore", downcast="integer")
-            except Exception:
-                pass
+            values = df[col].replace("", None)
+            num = pd.to_numeric(values, errors="coerce", downcast="integer")
+            if values.notna().any() and num.notna().sum() == values.notna().sum():
+                df[col] = num
 
         self.model = PandasModel(df)
         self.table.setModel(self.model)
@@ -157,11 +156,19 @@ class SampleTypesPage(QWidget):
         for col in ("Type", "Factor"):
             df[col] = df[col].fillna("")
 
-        try:
-            df.to_csv(CSV_PATH, index=False, encoding="utf-8")
+        # written atomically on the writer thread; confirmed in _on_csv_written
+        self._save_pending = True
+        get_writer().save(CSV_PATH, df)
+
+    def _on_csv_written(self, path: str, _version):
+        if self._save_pending and Path(path) == CSV_PATH:
+            self._save_pending = False
             QMessageBox.information(self, "Saved", f"Saved to:\n{CSV_PATH}")
-        except Exception as e:
-            QMessageBox.critical(self, "Save error", str(e))
+
+    def _on_csv_failed(self, path: str, error: str):
+        if self._save_pending and Path(path) == CSV_PATH:
+            self._save_pending = False
+            QMessageBox.critical(self, "Save error", error)
 
     # ----- Table actions -----
     def add_row(self):
@@ -198,12 +205,7 @@ class SampleTypesPage(QWidget):
         if not path:
             return
         try:
-            df = pd.read_csv(path, dtype=str, encoding="utf-8")
-            # Ensure required columns
-            for col in DEFAULT_COLUMNS:
-                if col not in df.columns:
-                    df[col] = ""
-            df = df[DEFAULT_COLUMNS]
+            df = SAMPLE_TYPES.read_text(Path(path))
             self.model = PandasModel(df)
             self.table.setModel(self.model)
             self.table.resizeColumnsToContents()
@@ -0,0 +1,336 @@
+# code/ui/pages/segment_search.py
+# Cross-corpus segment search over the label index.
+# Results are paged lazily (canFetchMore/fetchMore + keyset paging), so a query
+# matching millions of segments only ever materializes the rows scrolled to.
+# Pages, the match count and the class list are queried on a worker thread,
+# never the GUI's.
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLineEdit, QPushButton,
+    QFrame, QMessageBox, QTableView, QComboBox, QLabel
+)
+
+from code.core.instrument import traced
+from code.core.label_index import RESULT_COLUMNS, SegmentFilter, get_label_index
+
+COUNT_CAP = 1_000_000  # stop counting matches beyond this ("1,000,000+")
+
+HEADERS = {
+    "sample_id": "Sample", "sample_name": "Name", "date": "Date", "label_class": "Class",
+    "start_s": "Start (s)", "end_s": "End (s)", "duration_s": "Duration (s)", "notes": "Notes",
+    "temperature_c": "Temp (°C)", "pressure_kpa": "Pressure (kPa)", "latitude": "Lat",
+    "longitude": "Lon", "csv_path": "Labels CSV",
+}
+NUMERIC = {"start_s", "end_s", "duration_s", "temperature_c", "pressure_kpa", "latitude", "longitude"}
+
+
+class SegmentResultsModel(QAbstractTableModel):
+    """Read-only view over a label-index query, fetched one page at a time on `pool`."""
+
+    PAGE = 500
+    sig_error = Signal(str)             # a page query failed; paging stops
+    _sig_page = Signal(object, str)     # (list of rows, error) from the worker thread
+
+    def __init__(self, f: SegmentFilter, pool: Executor):
+        super().__init__()
+        self._filter = f
+        self._pool = pool
+        self._rows: list[tuple] = []  # (rowid, *RESULT_COLUMNS)
+        self._exhausted = False
+        self._loading = False
+        self.error = ""
+        self._sig_page.connect(self._on_page)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(RESULT_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = RESULT_COLUMNS[index.column()]
+        value = self._rows[index.row()][index.column() + 1]
+        if role == Qt.DisplayRole:
+            if value is None:
+                return ""
+            if col == "csv_path":
+                return Path(value).name
+            if col in NUMERIC:
+                return f"{value:.3f}" if col in ("start_s", "end_s", "duration_s") else f"{value:g}"
+            return str(value)
+        if role == Qt.ToolTipRole and col == "csv_path":
+            return value
+        if role == Qt.TextAlignmentRole:
+            if col in NUMERIC:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return HEADERS[RESULT_COLUMNS[section]]
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+        self._loading = True
+        f, after = self._filter, self._rows[-1] if self._rows else None
+
+        def work():
+            try:
+                self._sig_page.emit(get_label_index().search(f, after=after, limit=self.PAGE), "")
+            except Exception as e:
+                self._sig_page.emit([], str(e))
+
+        self._pool.submit(work)
+
+    def _on_page(self, page: list[tuple], error: str):
+        self._loading = False
+        if error:
+            self._exhausted = True  # retrying on every scroll would fail the same way
+            self.error = error
+            self.sig_error.emit(error)
+            return
+        if len(page) < self.PAGE:
+            self._exhausted = True
+        if page:
+            n = len(self._rows)
+            self.beginInsertRows(QModelIndex(), n, n + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+
+    def record(self, row: int) -> dict:
+        return dict(zip(RESULT_COLUMNS, self._rows[row][1:]))
+
+
+class SegmentSearchPage(QWidget):
+    sig_go_home = Signal()
+    sig_open_segment = Signal(str, str, float)  # (sample_id, csv_path, start_s)
+    _sig_index_ready = Signal(object)  # label classes in the caught-up index
+    _sig_count = Signal(int, int, str)  # (query generation, number of matches, error)
+
+    def __init__(self):
+        super().__init__()
+        self._model: SegmentResultsModel | None = None
+        self._generation = 0
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-search")
+
+        # --- Top bar ---
+        top = QHBoxLayout()
+        self.btn_back = QPushButton("← Home")
+        self.btn_back.setProperty("class", "back")
+        self.btn_back.clicked.connect(self.sig_go_home.emit)
+        title = QLabel("Segment Search")
+        title.setProperty("class", "h1")
+        top.addWidget(self.btn_back, alignment=Qt.AlignLeft)
+        top.addWidget(title, alignment=Qt.AlignLeft)
+        top.addStretch()
+
+        # --- Filters ---
+        card = QFrame(); card.setObjectName("toolCard")
+        grid = QGridLayout(card); grid.setContentsMargins(12, 10, 12, 10)
+        grid.setHorizontalSpacing(8); grid.setVerticalSpacing(8)
+
+        def pair(lo: str, hi: str):
+            a, b = QLineEdit(), QLineEdit()
+            a.setPlaceholderText(lo); b.setPlaceholderText(hi)
+            for e in (a, b):
+                e.returnPressed.connect(self._search)
+            return a, b
+
+        self.cmb_class = QComboBox(); self.cmb_class.setEditable(True)
+        self.cmb_class.lineEdit().setPlaceholderText("Any class")
+        self.dur_min, self.dur_max = pair("min s", "max s")
+        self.date_from, self.date_to = pair("from YYYY-MM-DD", "to YYYY-MM-DD")
+        self.ed_notes = QLineEdit(); self.ed_notes.setPlaceholderText("Notes contain…")
+        self.ed_notes.returnPressed.connect(self._search)
+        self.temp_min, self.temp_max = pair("min °C", "max °C")
+        self.pres_min, self.pres_max = pair("min kPa", "max kPa")
+        self.lat_min, self.lat_max = pair("min lat", "max lat")
+        self.lon_min, self.lon_max = pair("min lon", "max lon")
+
+        rows = [
+            ("Class", [self.cmb_class]), ("Duration", [self.dur_min, self.dur_max]),
+            ("Date", [self.date_from, self.date_to]), ("Notes", [self.ed_notes]),
+            ("Temperature", [self.temp_min, self.temp_max]), ("Pressure", [self.pres_min, self.pres_max]),
+            ("Latitude", [self.lat_min, self.lat_max]), ("Longitude", [self.lon_min, self.lon_max]),
+        ]
+        for i, (label, widgets) in enumerate(rows):
+            r, c = divmod(i, 2)
+            grid.addWidget(QLabel(label), r, c * 3)
+            if len(widgets) == 1:
+                grid.addWidget(widgets[0], r, c * 3 + 1, 1, 2)
+            else:
+                grid.addWidget(widgets[0], r, c * 3 + 1)
+                grid.addWidget(widgets[1], r, c * 3 + 2)
+
+        bar = QHBoxLayout()
+        self.lbl_summary = QLabel("")
+        self.lbl_summary.setProperty("class", "subtle")
+        self.btn_clear = QPushButton("✕ Clear"); self.btn_clear.setProperty("variant", "soft")
+        self.btn_search = QPushButton("🔎 Search"); self.btn_search.setProperty("variant", "primary")
+        self.btn_open = QPushButton("✳ Open Selected"); self.btn_open.setProperty("variant", "soft")
+        bar.addWidget(self.lbl_summary, 1)
+        bar.addWidget(self.btn_clear)
+        bar.addWidget(self.btn_search)
+        bar.addWidget(self.btn_open)
+        grid.addLayout(bar, len(rows) // 2, 0, 1, 6)
+
+        # --- Results ---
+        self.table = QTableView()
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setDefaultSectionSize(30)
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(24, 24, 24, 24)
+        root.setSpacing(12)
+        root.addLayout(top)
+        root.addWidget(card)
+        root.addWidget(self.table, 1)
+
+        # Wire
+        self.btn_search.clicked.connect(self._search)
+        self.btn_clear.clicked.connect(self._clear)
+        self.btn_open.clicked.connect(self._open_selected)
+        self.table.doubleClicked.connect(lambda idx: self._open_row(idx.row()))
+        self._sig_index_ready.connect(self._on_index_ready)
+        self._sig_count.connect(self._on_count)
+
+    # -------- API --------
+    @traced("search.open")
+    def open(self):
+        """Catch the index up with the CSVs on disk, then (re)run the current query."""
+        self.lbl_summary.setText("Updating label index…")
+
+        def load_classes():
+            try:
+                classes = get_label_index().label_classes()
+            except Exception as e:
+                print("[WARN] Could not list label classes:", e)
+                classes = []
+            self._sig_index_ready.emit(classes)
+
+        get_label_index().submit_reconcile().add_done_callback(lambda _f: self._pool.submit(load_classes))
+
+    # -------- Internals --------
+    def _on_index_ready(self, classes: list[str]):
+        current = self.cmb_class.currentText()
+        self.cmb_class.blockSignals(True)
+        self.cmb_class.clear()
+        self.cmb_class.addItem("")
+        self.cmb_class.addItems(classes)
+        self.cmb_class.setCurrentText(current)
+        self.cmb_class.blockSignals(False)
+        self._search()
+
+    def _filter(self) -> SegmentFilter:
+        """Build the filter from the form; raises ValueError on malformed input."""
+        def num(edit: QLineEdit, what: str):
+            t = edit.text().strip()
+            if not t:
+                return None
+            try:
+                return float(t)
+            except ValueError:
+                raise ValueError(f"{what} must be a number (got '{t}').")
+
+        def day(edit: QLineEdit, what: str):
+            t = edit.text().strip()
+            if not t:
+                return None
+            if len(t) != 10 or t[4] != "-" or t[7] != "-" or not t.replace("-", "").isdigit():
+                raise ValueError(f"{what} must be a date like 2025-09-14 (got '{t}').")
+            return t
+
+        return SegmentFilter(
+            label_class=self.cmb_class.currentText().strip() or None,
+            min_duration=num(self.dur_min, "Min duration"),
+            max_duration=num(self.dur_max, "Max duration"),
+            date_from=day(self.date_from, "From date"),
+            date_to=day(self.date_to, "To date"),
+            notes=self.ed_notes.text().strip() or None,
+            min_temperature=num(self.temp_min, "Min temperature"),
+            max_temperature=num(self.temp_max, "Max temperature"),
+            min_pressure=num(self.pres_min, "Min pressure"),
+            max_pressure=num(self.pres_max, "Max pressure"),
+            min_latitude=num(self.lat_min, "Min latitude"),
+            max_latitude=num(self.lat_max, "Max latitude"),
+            min_longitude=num(self.lon_min, "Min longitude"),
+            max_longitude=num(self.lon_max, "Max longitude"),
+        )
+
+    @traced("filter.segments")
+    def _search(self):
+        try:
+            f = self._filter()
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid filter", str(e))
+            return
+        self._generation += 1
+        gen = self._generation
+        self._model = SegmentResultsModel(f, self._pool)
+        self._model.sig_error.connect(self._on_search_error)
+        self.table.setModel(self._model)
+        self._model.rowsInserted.connect(self.table.resizeColumnsToContents, Qt.SingleShotConnection)
+        self._model.fetchMore()  # first page, ahead of the count on the same worker; the view pulls more as it scrolls
+        self.lbl_summary.setText("Counting matches…")
+
+        def count():
+            try:
+                self._sig_count.emit(gen, get_label_index().count_matches(f, cap=COUNT_CAP), "")
+            except Exception as e:
+                self._sig_count.emit(gen, 0, str(e))
+
+        self._pool.submit(count)
+
+    def _on_count(self, gen: int, n: int, error: str):
+        if gen != self._generation:
+            return  # a newer query has started
+        if error:
+            self._on_search_error(error)
+            return
+        if self._model is not None and self._model.error:
+            return  # keep the page error on screen
+        more = "+" if n >= COUNT_CAP else ""
+        self.lbl_summary.setText(f"{n:,}{more} segment(s) match")
+
+    def _on_search_error(self, error: str):
+        self.lbl_summary.setText(f"Search failed: {error}")
+
+    def _clear(self):
+        for e in (self.dur_min, self.dur_max, self.date_from, self.date_to, self.ed_notes,
+                  self.temp_min, self.temp_max, self.pres_min, self.pres_max,
+                  self.lat_min, self.lat_max, self.lon_min, self.lon_max):
+            e.clear()
+        self.cmb_class.setCurrentText("")
+        self._search()
+
+    def _open_selected(self):
+        sel = self.table.selectionModel().selectedRows() if self.table.selectionModel() else []
+        if not sel:
+            QMessageBox.information(self, "Open", "Select a segment first.")
+            return
+        self._open_row(sel[0].row())
+
+    def _open_row(self, row: int):
+        if self._model is None:
+            return
+        rec = self._model.record(row)
+        if not rec["csv_path"] or not Path(rec["csv_path"]).exists():
+            QMessageBox.warning(self, "Missing file", f"Labels CSV not found:\n{rec['csv_path']}")
+            return
+        self.sig_open_segment.emit(str(rec["sample_id"]), rec["csv_path"], float(rec["start_s"] or 0.0))
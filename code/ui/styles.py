@@ -60,6 +60,7 @@ QPushButton[variant="warn"]    { background: qlineargradient(x1:0,y1:0,x2:1,y2:1
 QPushButton[variant="accent"]  { background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #ab47bc, stop:1 #6a1b9a); color:#fff; }
 QPushButton[variant="soft"]    { background:#2a2f3b; color:#e8ecf4; border:1px solid #3a4252; }
 QPushButton[variant="soft"]:hover { background:#333a47; }
+QPushButton[variant="soft"]:checked { background:#2f3f5f; border:1px solid #42a5f5; }
 QPushButton[variant="danger"]  { background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #ef5350, stop:1 #c62828); color:#fff; }
 QPushButton[variant]:disabled { opacity: .5; }
 
@@ -0,0 +1,87 @@
+# code/ui/widgets/activity_strip.py
+# Thin heat strip over the whole recording, drawn above the seek slider: the
+# activity score max-pooled to one column per pixel, labeled spans underlined,
+# and the playhead. Clicking seeks.
+
+import numpy as np
+from PySide6.QtCore import QRectF, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPen
+from PySide6.QtWidgets import QWidget
+
+from code.audio.activity import Activity
+
+STRIP_HEIGHT = 14
+SPAN_HEIGHT = 3  # px of the bottom edge used to mark labeled spans
+
+# score 0..255 -> color: background, blue, orange, yellow
+_STOPS = np.array([0, 96, 176, 255])
+_RGB = np.array([[0x12, 0x14, 0x1a], [0x1f, 0x4e, 0x8c], [0xe0, 0x7b, 0x2a], [0xf9, 0xe2, 0x6b]])
+_LUT = np.stack([np.interp(np.arange(256), _STOPS, _RGB[:, i]) for i in range(3)], axis=1).astype(np.uint32)
+_LUT = (0xFF << 24) | (_LUT[:, 0] << 16) | (_LUT[:, 1] << 8) | _LUT[:, 2]
+
+
+class ActivityStrip(QWidget):
+    sig_clicked = Signal(float)  # seconds
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(STRIP_HEIGHT)
+        self.setCursor(Qt.PointingHandCursor)
+        self._score: np.ndarray | None = None
+        self._duration = 0.0
+        self._spans: list[tuple[float, float]] = []
+        self._image: QImage | None = None  # one row of pooled colors, rebuilt on resize
+        self._playhead_s: float | None = None
+        self._playhead_px: int | None = None  # last drawn column (skip no-op repaints)
+
+    # ----- public -----
+    def set_activity(self, act: Activity | None):
+        self._score = act.score() if act is not None else None
+        self._duration = len(act.frames) * act.hop_s if act is not None else 0.0
+        self._image = None
+        self.update()
+
+    def set_spans(self, spans: list[tuple[float, float]]):
+        """Labeled (start_s, end_s) spans to underline."""
+        self._spans = spans
+        self.update()
+
+    def set_playhead(self, sec: float):
+        self._playhead_s = sec
+        px = self._to_px(sec) if self._duration > 0 else None
+        if px != self._playhead_px:
+            self._playhead_px = px
+            self.update()
+
+    # ----- drawing -----
+    def _to_px(self, sec: float) -> int:
+        return int(round(sec / self._duration * (self.width() - 1)))
+
+    def _pooled_image(self) -> QImage:
+        w = max(self.width(), 1)
+        if self._image is None or self._image.width() != w:
+            n = len(self._score)
+            starts = np.minimum(np.linspace(0, n, w + 1)[:-1].astype(np.intp), n - 1)
+            row = np.ascontiguousarray(_LUT[np.maximum.reduceat(self._score, starts)])
+            self._image = QImage(row.data, w, 1, 4 * w, QImage.Format_RGB32).copy()
+        return self._image
+
+    def paintEvent(self, _ev):
+        p = QPainter(self)
+        p.fillRect(self.rect(), QColor("#12141a"))
+        if self._score is None or not len(self._score) or self._duration <= 0:
+            return
+        h = self.height()
+        p.drawImage(QRectF(0, 0, self.width(), h - SPAN_HEIGHT), self._pooled_image())
+        for a, b in self._spans:
+            x0 = self._to_px(a)
+            p.fillRect(x0, h - SPAN_HEIGHT, max(self._to_px(b) - x0, 1), SPAN_HEIGHT, QColor("#a6e3a1"))
+        if self._playhead_s is not None:
+            self._playhead_px = x = self._to_px(self._playhead_s)
+            p.setPen(QPen(QColor("#2aa3ff"), 2))
+            p.drawLine(x, 0, x, h)
+
+    def mousePressEvent(self, ev):
+        if ev.button() == Qt.LeftButton and self._duration > 0:
+            frac = min(max(ev.position().x() / max(self.width() - 1, 1), 0.0), 1.0)
+            self.sig_clicked.emit(frac * self._duration)
@@ -0,0 +1,98 @@
+# code/ui/widgets/channel_lanes.py
+# One waveform lane per channel of a multichannel recording. Lanes share one
+# X axis and draw only the window they are asked for (see viewport.py): from the
+# envelope pyramid level closest to one bin per pixel, or from exact samples once
+# zoomed in past a bin.
+
+from pathlib import Path
+
+import pyqtgraph as pg
+from PySide6.QtCore import Signal
+
+from code.audio.envelope import BASE_BIN, EnvelopePyramid, read_frames
+
+LANE_HEIGHT = 56  # minimum px per lane
+AXIS_WIDTH = 54   # left axis width; X-linked plots need the same one to line up
+
+
+class ChannelLanes(pg.GraphicsLayoutWidget):
+    sig_clicked = Signal(float)  # seconds
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setBackground("#12141a")
+        self.ci.layout.setSpacing(0)
+        self._env: EnvelopePyramid | None = None
+        self._exact: Path | None = None  # seekable source for sample-level zoom
+        self._lanes: list[pg.PlotItem] = []
+        self._curves: list[pg.PlotCurveItem] = []
+        self._playheads: list[pg.InfiniteLine] = []
+        self._shown_px: int | None = None
+        self.scene().sigMouseClicked.connect(self._on_click)
+
+    def set_envelopes(self, env: EnvelopePyramid | None, exact: Path | None = None,
+                      link_to: pg.PlotItem | None = None):
+        """Show one lane per channel of `env` (None hides the lanes)."""
+        self.clear()
+        self._lanes, self._curves, self._playheads = [], [], []
+        self._env, self._exact, self._shown_px = env, exact, None
+        if env is None:
+            self.setVisible(False)
+            return
+        for ch in range(env.channels):
+            lane = self.addPlot(row=ch, col=0)
+            lane.setMouseEnabled(x=True, y=False)
+            lane.setYRange(-1.0, 1.0, padding=0.05)
+            lane.showGrid(x=True, y=False, alpha=0.15)
+            lane.setLabel("left", f"Ch {ch + 1}", **{"color": "#cfd3e0"})
+            lane.getAxis("left").setWidth(AXIS_WIDTH)
+            lane.hideButtons()
+            if ch < env.channels - 1:
+                lane.hideAxis("bottom")
+            lane.setXLink(self._lanes[0] if self._lanes else link_to)
+            lane.vb.disableAutoRange(axis=pg.ViewBox.XAxis)  # the curve holds only the window in view
+            curve = pg.PlotCurveItem(pen=pg.mkPen("#cdd5e4", width=1), connect="pairs")
+            lane.addItem(curve)
+            head = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=pg.mkPen("#2aa3ff", width=2))
+            lane.addItem(head)
+            self._lanes.append(lane)
+            self._curves.append(curve)
+            self._playheads.append(head)
+        if link_to is None:
+            self._lanes[0].setXRange(0.0, env.duration, padding=0)
+        self.setMinimumHeight(LANE_HEIGHT * env.channels)
+        self.setVisible(True)
+
+    def set_playhead(self, sec: float):
+        """Move the lane playheads when they land on a different pixel column."""
+        if not self._lanes:
+            return
+        vb = self._lanes[0].vb
+        (x0, x1), _ = vb.viewRange()
+        px = int((sec - x0) / max(x1 - x0, 1e-9) * max(vb.width(), 1))
+        if px == self._shown_px:
+            return
+        self._shown_px = px
+        for head in self._playheads:
+            head.setValue(sec)
+
+    def render(self, t0: float, t1: float, pixels: int):
+        """Draw [t0, t1] seconds at `pixels` columns."""
+        if self._env is None or not self._lanes:
+            return
+        sr = self._env.samplerate
+        if self._exact is not None and (t1 - t0) * sr / pixels < BASE_BIN:
+            x, frames = read_frames(self._exact, t0, t1)
+            for ch, curve in enumerate(self._curves):
+                curve.setData(x, frames[:, ch], connect="all")
+        else:
+            for ch, curve in enumerate(self._curves):
+                x, y = self._env.window(ch, t0, t1, pixels)
+                curve.setData(x, y, connect="pairs")
+        self._shown_px = None
+
+    def _on_click(self, ev):
+        for lane in self._lanes:
+            if lane.sceneBoundingRect().contains(ev.scenePos()):
+                self.sig_clicked.emit(max(0.0, float(lane.vb.mapSceneToView(ev.scenePos()).x())))
+                return
@@ -0,0 +1,98 @@
+# code/ui/widgets/minimap.py
+# Whole-recording overview above the waveform: the coarsest envelope level,
+# a histogram of where labels start, and a draggable rectangle
+# for the range the plots show. Everything here is drawn once per recording,
+# so it costs the same for a 6-hour file as for a short one.
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import QTimer, Signal
+
+MINIMAP_HEIGHT = 56
+DENSITY_BINS = 256  # label histogram resolution across the file
+
+
+class Minimap(pg.PlotWidget):
+    sig_range = Signal(float, float)  # (x0, x1) seconds the plots should show
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setBackground("#12141a")
+        self.setFixedHeight(MINIMAP_HEIGHT)
+        self.setMouseEnabled(x=False, y=False)
+        self.setMenuEnabled(False)
+        self.hideButtons()
+        for axis in ("left", "bottom"):
+            self.hideAxis(axis)
+        self.setYRange(-1.0, 1.0, padding=0.05)
+        self._duration = 0.0
+        self._shown_px: int | None = None
+
+        self._density = pg.PlotCurveItem([0.0, 1.0], [-1.0], stepMode="center", fillLevel=-1.0, pen=None,
+                                         brush=pg.mkBrush(166, 227, 161, 70))
+        self._curve = pg.PlotCurveItem(pen=pg.mkPen("#8a93a8", width=1), connect="pairs")
+        self._view = pg.LinearRegionItem(brush=pg.mkBrush(42, 163, 255, 50),
+                                         pen=pg.mkPen("#2aa3ff", width=1))
+        self._playhead = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=pg.mkPen("#2aa3ff", width=1))
+        for item in (self._density, self._curve, self._view, self._playhead):
+            self.addItem(item)
+        self._view.sigRegionChanged.connect(lambda *_: self._emit_timer.start())
+
+        self._emit_timer = QTimer(self)  # coalesce drag steps into one range change per event loop pass
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(lambda: self.sig_range.emit(*self._view.getRegion()))
+        self.scene().sigMouseClicked.connect(self._on_click)
+
+    # ----- public -----
+    def set_overview(self, env: np.ndarray | None, bin_s: float = 0.0):
+        """(bins, 2) min/max of the whole recording, `bin_s` seconds each; None clears."""
+        if env is None or not len(env):
+            self._duration = 0.0
+            self._curve.setData([], [])
+            self._density.setData([0.0, 1.0], [-1.0])
+            return
+        self._duration = len(env) * bin_s
+        x = (np.arange(len(env), dtype=np.float64) + 0.5) * bin_s
+        self._curve.setData(np.repeat(x, 2), env.ravel(), connect="pairs")
+        self._view.setBounds((0.0, self._duration))
+        self.setXRange(0.0, self._duration, padding=0)
+        self._shown_px = None
+
+    def set_labels(self, spans: list[tuple[float, float]]):
+        """Histogram of label starts along the file, drawn along the bottom."""
+        if self._duration <= 0:
+            return
+        edges = np.linspace(0.0, self._duration, DENSITY_BINS + 1)
+        starts = [min(a, b) for a, b in spans]
+        counts = np.histogram(starts, bins=edges)[0].astype(np.float32)
+        peak = float(counts.max())
+        heights = counts / peak * 1.2 - 1.0 if peak > 0 else np.full(DENSITY_BINS, -1.0, dtype=np.float32)
+        self._density.setData(edges, heights)
+
+    def set_viewport(self, x0: float, x1: float):
+        """Show the plots' range without echoing it back through sig_range."""
+        self._view.blockSignals(True)
+        self._view.setRegion((x0, x1))
+        self._view.blockSignals(False)
+
+    def set_playhead(self, sec: float):
+        if self._duration <= 0:
+            return
+        px = int(sec / self._duration * max(self.width(), 1))
+        if px != self._shown_px:
+            self._shown_px = px
+            self._playhead.setValue(sec)
+
+    # ----- mouse -----
+    def _on_click(self, ev):
+        """A click outside the rectangle centers it there."""
+        if self._duration <= 0:
+            return
+        sec = float(self.getPlotItem().vb.mapSceneToView(ev.scenePos()).x())
+        x0, x1 = self._view.getRegion()
+        if x0 <= sec <= x1:
+            return
+        w = x1 - x0
+        x0 = min(max(sec - w / 2, 0.0), max(self._duration - w, 0.0))
+        self._view.setRegion((x0, x0 + w))
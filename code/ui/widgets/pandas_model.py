@@ -10,6 +10,7 @@ class PandasModel(QAbstractTableModel):
     def __init__(self, df: pd.DataFrame):
         super().__init__()
         self._df = df
+        self._edit_interceptor = None
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._df.index)
@@ -49,20 +50,34 @@ class PandasModel(QAbstractTableModel):
     def setData(self, index: QModelIndex, value, role: int = Qt.EditRole):
         if role != Qt.EditRole or not index.isValid():
             return False
-        col = self._df.columns[index.column()]
-        if col.lower() in {"id", "value", "count"}:
+        if self._edit_interceptor is not None:
+            return bool(self._edit_interceptor(index.row(), index.column(), value))
+        return self.apply_cell(index.row(), index.column(), value)
+
+    def set_edit_interceptor(self, fn):
+        """Route user edits through fn(row, col, value) -> bool (e.g. an undo stack)."""
+        self._edit_interceptor = fn
+
+    def apply_cell(self, row: int, col: int, value) -> bool:
+        """Write one cell directly, bypassing the edit interceptor."""
+        name = self._df.columns[col]
+        if name.lower() in {"id", "value", "count"}:
             try:
-                self._df.iat[index.row(), index.column()] = int(float(value))
+                self._df.iat[row, col] = int(float(value))
             except Exception:
-                self._df.iat[index.row(), index.column()] = value
+                self._df.iat[row, col] = value
         else:
-            self._df.iat[index.row(), index.column()] = value
-        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            self._df.iat[row, col] = value
+        ix = self.index(row, col)
+        self.dataChanged.emit(ix, ix, [Qt.DisplayRole, Qt.EditRole])
         return True
 
     def dataframe(self) -> pd.DataFrame:
         return self._df
 
+    def row_dict(self, row: int) -> dict:
+        return {c: self._df.iat[row, i] for i, c in enumerate(self._df.columns)}
+
     def insert_empty_row(self, default_row: dict | None = None):
         self.beginInsertRows(QModelIndex(), len(self._df), len(self._df))
         if default_row is None:
@@ -70,9 +85,31 @@ class PandasModel(QAbstractTableModel):
         self._df.loc[len(self._df)] = default_row
         self.endInsertRows()
 
+    def insert_rows(self, at: int, rows: list[dict]):
+        """Insert a block of rows before position `at` in a single model update."""
+        if not rows:
+            return
+        at = max(0, min(at, len(self._df)))
+        self.beginInsertRows(QModelIndex(), at, at + len(rows) - 1)
+        block = pd.DataFrame(rows, columns=self._df.columns)
+        self._df = pd.concat([self._df.iloc[:at], block, self._df.iloc[at:]], ignore_index=True)
+        self.endInsertRows()
+
     def remove_rows(self, rows: list[int]):
-        for r in sorted(rows, reverse=True):
-            self.beginRemoveRows(QModelIndex(), r, r)
-            self._df.drop(self._df.index[r], inplace=True)
-            self._df.reset_index(drop=True, inplace=True)
-            self.endRemoveRows()
\ No newline at end of file
+        # remove contiguous runs back-to-front so earlier positions stay valid
+        rows = sorted(set(rows), reverse=True)
+        if not rows:
+            return
+        runs, start, end = [], rows[0], rows[0]
+        for r in rows[1:]:
+            if r == start - 1:
+                start = r
+            else:
+                runs.append((start, end))
+                start = end = r
+        runs.append((start, end))
+        for first, last in runs:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._df.drop(self._df.index[first:last + 1], inplace=True)
+            self.endRemoveRows()
+        self._df.reset_index(drop=True, inplace=True)
@@ -0,0 +1,91 @@
+# code/ui/widgets/playhead.py
+# Frame-locked playhead driver: interpolates the player position from a
+# monotonic clock and ticks once per display frame while playing.
+
+from time import monotonic
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtMultimedia import QMediaPlayer
+
+
+class PlayheadDriver(QObject):
+    """Emits sig_frame(ms) at the display refresh rate during playback.
+
+    QMediaPlayer.positionChanged arrives at an irregular rate, so it is only used
+    to re-anchor the clock. Between reports the position is extrapolated from
+    time.monotonic() and the playback rate. While paused/stopped every reported
+    position (e.g. a seek) is forwarded immediately.
+    """
+    sig_frame = Signal(int)  # interpolated position in ms
+
+    SEEK_THRESHOLD_MS = 250  # backwards steps larger than this are real seeks
+
+    def __init__(self, player: QMediaPlayer, parent=None):
+        super().__init__(parent)
+        self._player = player
+        self._anchor_ms = 0
+        self._anchor_t = monotonic()
+        self._last_ms = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(self._frame_interval_ms())
+        self._timer.timeout.connect(self._tick)
+
+        player.positionChanged.connect(self._on_position_changed)
+        player.playbackStateChanged.connect(self._on_state_changed)
+        player.playbackRateChanged.connect(lambda *_: self._reanchor(self.position()))
+
+    # ----- public -----
+    def position(self) -> int:
+        """Best estimate of the current position in ms."""
+        if not self._timer.isActive():
+            return self._anchor_ms
+        rate = self._player.playbackRate() or 1.0
+        ms = int(self._anchor_ms + (monotonic() - self._anchor_t) * 1000.0 * rate)
+        dur = self._player.duration()
+        return min(ms, dur) if dur > 0 else ms
+
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    # ----- internals -----
+    @staticmethod
+    def _frame_interval_ms() -> int:
+        screen = QGuiApplication.primaryScreen()
+        hz = screen.refreshRate() if screen else 0.0
+        if hz < 1.0:
+            hz = 60.0
+        return max(4, int(round(1000.0 / hz)))
+
+    def _reanchor(self, ms: int):
+        self._anchor_ms = int(ms)
+        self._anchor_t = monotonic()
+
+    def _on_position_changed(self, ms: int):
+        self._reanchor(ms)
+        if not self._timer.isActive():
+            self._last_ms = ms
+            self.sig_frame.emit(ms)
+
+    def _on_state_changed(self, state):
+        if state == QMediaPlayer.PlayingState:
+            self._reanchor(self._player.position())
+            if not self._timer.isActive():
+                self._timer.start()
+        else:
+            self._timer.stop()
+            self._reanchor(self._player.position())
+            self._last_ms = self._anchor_ms
+            self.sig_frame.emit(self._anchor_ms)
+
+    def _tick(self):
+        ms = self.position()
+        # Reports lag the audio clock a little; don't let that jitter the line backwards.
+        if 0 < self._last_ms - ms < self.SEEK_THRESHOLD_MS:
+            ms = self._last_ms
+        if ms == self._last_ms:
+            return
+        self._last_ms = ms
+        self.sig_frame.emit(ms)
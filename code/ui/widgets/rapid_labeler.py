@@ -0,0 +1,147 @@
+# code/ui/widgets/rapid_labeler.py
+# Keyboard-only segment entry for high-volume labeling. Number keys are bound
+# to classes: hold a key to label the span it was held for, or tap it once to
+# open a segment and again to close it. I / O set in and out points for the
+# class picked in the editor. Segments are handed over in batches.
+
+from time import monotonic
+from typing import Callable
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Signal
+from PySide6.QtWidgets import QAbstractSpinBox, QApplication, QLineEdit, QPlainTextEdit, QTextEdit, QWidget
+
+DIGIT_KEYS = [Qt.Key_1, Qt.Key_2, Qt.Key_3, Qt.Key_4, Qt.Key_5,
+              Qt.Key_6, Qt.Key_7, Qt.Key_8, Qt.Key_9, Qt.Key_0]
+TAP_MS = 250       # shorter presses toggle a segment open/closed instead of spanning the hold
+FLUSH_MS = 400     # collected segments are handed over at most this often
+MIN_SEGMENT_S = 0.01
+_TEXT_INPUTS = (QLineEdit, QAbstractSpinBox, QTextEdit, QPlainTextEdit)
+
+
+class RapidLabeler(QObject):
+    """Application-wide key filter, active only while its page is visible."""
+    sig_batch = Signal(list)   # [(start_s, end_s, label_class), ...]
+    sig_status = Signal(str)   # one-line feedback for the status label
+
+    def __init__(self, position_s: Callable[[], float], current_class: Callable[[], str], page: QWidget):
+        super().__init__(page)
+        self._page = page
+        self._position_s = position_s
+        self._current_class = current_class
+        self._classes: list[str] = []
+        self._held: dict[int, tuple[float, float]] = {}   # key -> (start_s, pressed at)
+        self._open: dict[int, float] = {}                 # tapped-open segments: key -> start_s
+        self._closing: set[int] = set()                   # keys whose press closed a segment
+        self._in_s: float | None = None
+        self._pending: list[tuple[float, float, str]] = []
+        self._active = False
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    # ----- public -----
+    def set_classes(self, classes: list[str]):
+        """Bind the first ten classes to keys 1..9, 0."""
+        self._classes = [c for c in classes if c][:len(DIGIT_KEYS)]
+
+    def bindings_text(self) -> str:
+        keys = "1234567890"
+        return "   ".join(f"{keys[i]} {c}" for i, c in enumerate(self._classes)) or "No classes in sample_list.csv"
+
+    def is_active(self) -> bool:
+        return self._active
+
+    def set_active(self, on: bool):
+        if on == self._active:
+            return
+        self._active = on
+        app = QApplication.instance()
+        if on:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+            self.cancel()
+            self.flush()
+
+    def cancel(self):
+        """Drop segments that are being held or are tapped open."""
+        self._held.clear()
+        self._open.clear()
+        self._closing.clear()
+        self._in_s = None
+
+    def flush(self):
+        self._flush_timer.stop()
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.sig_batch.emit(batch)
+
+    # ----- key handling -----
+    def eventFilter(self, obj, event):
+        etype = event.type()
+        if etype not in (QEvent.KeyPress, QEvent.KeyRelease) or not self._page.isVisible():
+            return False
+        if isinstance(QApplication.focusWidget(), _TEXT_INPUTS):
+            return False
+        if event.modifiers() & (Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier):
+            return False
+        key = event.key()
+        if key in DIGIT_KEYS:
+            idx = DIGIT_KEYS.index(key)
+            if idx >= len(self._classes):
+                return False
+            if not event.isAutoRepeat():
+                (self._digit_down if etype == QEvent.KeyPress else self._digit_up)(key, self._classes[idx])
+            return True
+        if key in (Qt.Key_I, Qt.Key_O, Qt.Key_Escape):
+            if etype == QEvent.KeyPress and not event.isAutoRepeat():
+                self._mark_key(key)
+            return True
+        return False
+
+    def _digit_down(self, key: int, cls: str):
+        now = self._position_s()
+        if key in self._open:
+            self._closing.add(key)
+            self._add(self._open.pop(key), now, cls)
+            return
+        self._held[key] = (now, monotonic())
+        self.sig_status.emit(f"● {cls} from {now:.3f} s")
+
+    def _digit_up(self, key: int, cls: str):
+        if key in self._closing:
+            self._closing.discard(key)
+            return
+        if key not in self._held:
+            return
+        start, pressed = self._held.pop(key)
+        if (monotonic() - pressed) * 1000.0 < TAP_MS:
+            self._open[key] = start  # tap: stays open until the key is tapped again
+            self.sig_status.emit(f"● {cls} open from {start:.3f} s (tap again to close)")
+            return
+        self._add(start, self._position_s(), cls)
+
+    def _mark_key(self, key: int):
+        now = self._position_s()
+        if key == Qt.Key_Escape:
+            self.cancel()
+            self.sig_status.emit("Open segments cancelled")
+        elif key == Qt.Key_I:
+            self._in_s = now
+            self.sig_status.emit(f"In at {now:.3f} s")
+        elif self._in_s is not None:
+            self._add(self._in_s, now, self._current_class())
+            self._in_s = None
+
+    def _add(self, start: float, end: float, cls: str):
+        if end < start:
+            start, end = end, start
+        if end - start < MIN_SEGMENT_S:
+            self.sig_status.emit("Segment too short, ignored")
+            return
+        self._pending.append((start, end, cls))
+        self.sig_status.emit(f"+ {cls or '(no class)'} {start:.3f}–{end:.3f} s")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
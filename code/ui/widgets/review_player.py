@@ -0,0 +1,165 @@
+# code/ui/widgets/review_player.py
+# Fast review playback: plays a decoded buffer 1.5-4x faster at the original
+# pitch (WSOLA), optionally skipping silent stretches. A worker thread renders
+# about AHEAD_S of audio ahead of the playhead; the GUI thread feeds it to a
+# push-mode QAudioSink and maps what has been heard back to file time.
+
+import bisect
+import queue
+import threading
+
+import numpy as np
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtMultimedia import QAudioFormat, QAudioSink
+
+from code.audio.stretch import CHUNK_STEPS, FRAME_S, SILENCE_DB, active_regions, wsola
+
+AHEAD_S = 2.0   # rendered audio queued ahead of the playhead
+FEED_MS = 15    # sink top-up / position update period
+_END = None     # worker sentinel: nothing more to play
+
+
+class ReviewPlayer(QObject):
+    sig_position = Signal(int)   # playhead in original-file ms
+    sig_finished = Signal(int)   # reached the end; last position in ms
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._samples: np.ndarray | None = None
+        self._sr = 0
+        self._energy: np.ndarray | None = None
+        self._sink: QAudioSink | None = None
+        self._io = None
+        self._queue: queue.Queue | None = None
+        self._cancel = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._partial: tuple[bytes, int] | None = None
+        self._map_out: list[int] = []                   # output frame where each rendered chunk starts
+        self._map: list[tuple[int, int, int]] = []      # (frames, first input sample, last input sample)
+        self._written = 0                               # output frames handed to the sink
+        self._ended = False
+        self._pos_ms = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(FEED_MS)
+        self._timer.timeout.connect(self._tick)
+
+    # ----- public -----
+    def set_source(self, samples: np.ndarray | None, samplerate: int, energy_db: np.ndarray | None = None):
+        """Mono samples (float or int16 PCM) to review; energy_db (see stretch.short_term_energy_db) enables skipping."""
+        self.stop()
+        self._samples, self._sr, self._energy = samples, samplerate, energy_db
+
+    def is_playing(self) -> bool:
+        return self._sink is not None
+
+    def position_ms(self) -> int:
+        return self._pos_ms
+
+    def play(self, start_s: float, rate: float, skip_silence: bool = True, threshold_db: float = SILENCE_DB):
+        self.stop()
+        if self._samples is None or not len(self._samples):
+            return
+        start = min(max(int(start_s * self._sr), 0), len(self._samples) - 1)
+        if skip_silence and self._energy is not None:
+            regions = [(max(a, start), b) for a, b in
+                       active_regions(self._energy, self._sr, len(self._samples), threshold_db) if b > start]
+        else:
+            regions = [(start, len(self._samples))]
+        self._pos_ms = int(start * 1000 / self._sr)
+
+        fmt = QAudioFormat()
+        fmt.setSampleRate(self._sr)
+        fmt.setChannelCount(1)
+        fmt.setSampleFormat(QAudioFormat.Int16)
+        self._sink = QAudioSink(fmt, self)
+        self._sink.setBufferSize(int(self._sr * 2 * 0.25))
+        self._io = self._sink.start()
+        chunk_s = CHUNK_STEPS * FRAME_S / 2  # output seconds per rendered chunk
+        self._queue = queue.Queue(maxsize=max(int(AHEAD_S / chunk_s), 2))
+        self._cancel = threading.Event()
+        self._partial, self._map_out, self._map, self._written, self._ended = None, [], [], 0, False
+        self._worker = threading.Thread(target=self._render, name="review-render", daemon=True,
+                                        args=(self._samples, self._sr, rate, regions, self._queue, self._cancel))
+        self._worker.start()
+        self._timer.start()
+
+    def stop(self):
+        """Stop (the position stays where playback was)."""
+        if self._sink is None:
+            return
+        self._timer.stop()
+        self._cancel.set()
+        try:
+            while True:
+                self._queue.get_nowait()  # unblock a worker waiting on a full queue
+        except queue.Empty:
+            pass
+        self._sink.stop()
+        self._sink.deleteLater()
+        self._sink = self._io = None
+
+    # ----- worker thread -----
+    @staticmethod
+    def _render(x, sr, rate, regions, out: queue.Queue, cancel: threading.Event):
+        for a, b in regions:
+            for chunk, in0, in1 in wsola(x, sr, rate, a, b):
+                pcm = (np.clip(chunk, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+                while not cancel.is_set():
+                    try:
+                        out.put((pcm, in0, in1), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if cancel.is_set():
+                    return
+        while not cancel.is_set():
+            try:
+                out.put(_END, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    # ----- GUI thread -----
+    def _tick(self):
+        self._feed()
+        played = int(self._sink.processedUSecs() * self._sr / 1_000_000)
+        i = bisect.bisect_right(self._map_out, played) - 1
+        if i >= 0:
+            frames, in0, in1 = self._map[i]
+            frac = min((played - self._map_out[i]) / max(frames, 1), 1.0)
+            ms = int((in0 + frac * (in1 - in0)) * 1000 / self._sr)
+            if ms != self._pos_ms:
+                self._pos_ms = ms
+                self.sig_position.emit(ms)
+            if i > 64:  # forget chunks that have been heard
+                del self._map_out[:i], self._map[:i]
+        if self._ended and played >= self._written - self._sr * FEED_MS // 1000:
+            self.stop()  # everything rendered has been heard (to within a tick)
+            self.sig_finished.emit(self._pos_ms)
+
+    def _feed(self):
+        while True:
+            if self._partial is None:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    return
+                if item is _END:
+                    self._ended = True
+                    return
+                pcm, in0, in1 = item
+                self._map_out.append(self._written)
+                self._map.append((len(pcm) // 2, in0, in1))
+                self._written += len(pcm) // 2
+                self._partial = (pcm, 0)
+            pcm, off = self._partial
+            free = self._sink.bytesFree()
+            if free <= 0:
+                return
+            n = self._io.write(pcm[off:off + free])
+            if n <= 0:
+                return
+            off += n
+            self._partial = None if off >= len(pcm) else (pcm, off)
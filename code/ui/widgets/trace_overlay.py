@@ -0,0 +1,90 @@
+# code/ui/widgets/trace_overlay.py
+# Small always-on-top panel with the latest instrumentation records
+# (span timings, memory deltas, event-loop stalls) and buttons to profile
+# the next action. Only created when tracing is enabled; Ctrl+Shift+D toggles it.
+
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+from code.core.instrument import Tracer
+
+SHOWN = 12  # records listed
+_BASE_KEYS = {"ts", "type", "name", "ms", "rss_delta_kb", "depth", "thread", "error", "profile"}
+
+
+class TraceOverlay(QFrame):
+    def __init__(self, tracer: Tracer, parent: QWidget):
+        super().__init__(parent)
+        self._tracer = tracer
+        self._stalls = 0
+        self.setObjectName("traceOverlay")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet("""
+            QFrame#traceOverlay { background: rgba(16, 19, 26, 225); border: 1px solid #3a4252; border-radius: 10px; }
+            QFrame#traceOverlay QLabel { background: transparent; color: #cdd5e4;
+                                         font-family: Menlo, Consolas, monospace; font-size: 11px; }
+            QFrame#traceOverlay QPushButton { padding: 2px 8px; font-size: 11px; }
+        """)
+
+        self.lbl_title = QLabel()
+        self.lbl_rows = QLabel()
+        self.lbl_rows.setTextFormat(Qt.PlainText)
+        self.btn_prof = QPushButton("cProfile next"); self.btn_prof.setProperty("variant", "soft")
+        self.btn_mem = QPushButton("tracemalloc next"); self.btn_mem.setProperty("variant", "soft")
+        self.btn_prof.clicked.connect(lambda: self._arm("cprofile"))
+        self.btn_mem.clicked.connect(lambda: self._arm("tracemalloc"))
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.btn_prof)
+        buttons.addWidget(self.btn_mem)
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(10, 8, 10, 8)
+        lay.setSpacing(4)
+        lay.addWidget(self.lbl_title)
+        lay.addWidget(self.lbl_rows)
+        lay.addLayout(buttons)
+
+        QShortcut(QKeySequence("Ctrl+Shift+D"), parent, activated=lambda: self.setVisible(not self.isVisible()))
+        parent.installEventFilter(self)
+        tracer.sig_record.connect(self._on_record)
+        self._refresh()
+        self.show()
+
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() == QEvent.Resize:
+            self._place()
+        return False
+
+    def _place(self):
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - 12, 12)
+        self.raise_()
+
+    def _arm(self, kind: str):
+        self._tracer.profile_next(kind)
+        self._refresh()
+
+    def _on_record(self, rec: dict):
+        if rec.get("type") == "stall":
+            self._stalls += 1
+        self._refresh()
+
+    def _refresh(self):
+        armed = self._tracer.profile_armed
+        self.lbl_title.setText(f"trace · {self._stalls} stall(s)" + (f" · {armed} armed" if armed else ""))
+        lines = []
+        for rec in list(self._tracer.recent)[-SHOWN:]:
+            if rec["type"] == "stall":
+                where = rec.get("where")
+                name = f"⚠ {rec.get('name', 'event loop stalled')}" + (f" in {where}" if where else "")
+                lines.append(f"{name[:40]:<40}{rec['ms']:>9.0f} ms")
+                continue
+            mem = rec.get("rss_delta_kb")
+            mem = "" if mem is None else f"{mem / 1024:+8.1f} MB"
+            extra = " ".join(str(v) for k, v in rec.items() if k not in _BASE_KEYS)
+            name = "  " * rec.get("depth", 0) + rec.get("name", rec["type"]) + (f" {extra}" if extra else "")
+            lines.append(f"{name[:40]:<40}{rec['ms']:>9.1f} ms{mem}" + (" ★" if "profile" in rec else ""))
+        self.lbl_rows.setText("\n".join(lines) or "no spans yet")
+        self._place()
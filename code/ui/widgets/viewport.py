@@ -0,0 +1,105 @@
+# code/ui/widgets/viewport.py
+# One controller for the X-linked waveform, channel lanes and spectrogram.
+# When the shared X range or the plot width changes, it asks every view for
+# just the data in range at pixel resolution, at most once per display frame,
+# so panning and zooming cost the same on a 6-hour file as on a short one.
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import QObject, QTimer
+
+from code.audio.decode import to_float
+from code.audio.envelope import BASE_BIN, EnvelopePyramid
+from code.audio.spectrogram import Spectrogram
+
+FRAME_MS = 16   # at most one redraw per display frame
+MARGIN = 0.5    # view widths fetched beyond each edge, so a pan shows no gap before the next redraw
+
+
+class ViewportController(QObject):
+    """Calls view.render(t0, t1, pixels) for every added view when `plot`'s X range settles."""
+
+    def __init__(self, plot: pg.PlotItem, parent=None):
+        super().__init__(parent)
+        self._vb = plot.vb
+        self._views = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._vb.sigXRangeChanged.connect(self.schedule)
+        self._vb.sigResized.connect(self.schedule)
+
+    def add(self, view):
+        self._views.append(view)
+
+    def schedule(self, *_):
+        """Redraw within a frame; further changes until then are folded in."""
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def refresh(self):
+        """Redraw now (e.g. after a view got new data)."""
+        self._timer.stop()
+        (t0, t1), _ = self._vb.viewRange()
+        w = t1 - t0
+        pixels = max(int(self._vb.width() * (1 + 2 * MARGIN)), 1)
+        for view in self._views:
+            view.render(t0 - MARGIN * w, t1 + MARGIN * w, pixels)
+
+
+class WaveformView:
+    """Mono waveform curve: from the envelope pyramid, or exact samples once zoomed in past a bin."""
+
+    def __init__(self, plot: pg.PlotWidget):
+        self._plot = plot
+        self._curve = pg.PlotCurveItem(pen=pg.mkPen("#cdd5e4", width=1))
+        self._samples: np.ndarray | None = None
+        self._sr = 0
+        self._env: EnvelopePyramid | None = None
+
+    def set_source(self, samples: np.ndarray | None, samplerate: int = 0, env: EnvelopePyramid | None = None):
+        self._samples, self._sr, self._env = samples, samplerate, env
+        self._curve.setData([], [])
+        if samples is not None and self._curve.scene() is None:
+            self._plot.addItem(self._curve)
+
+    def render(self, t0: float, t1: float, pixels: int):
+        if self._samples is None or self._env is None:
+            return
+        if (t1 - t0) * self._sr / pixels < BASE_BIN:
+            i0 = max(int(t0 * self._sr), 0)
+            i1 = min(int(t1 * self._sr) + 2, len(self._samples))
+            x = np.arange(i0, max(i1, i0), dtype=np.float64) / self._sr
+            self._curve.setData(x, to_float(self._samples[i0:i1]), connect="all")
+        else:
+            x, y = self._env.window(0, t0, t1, pixels)
+            self._curve.setData(x, y, connect="pairs")
+
+
+class SpectrogramView:
+    """Spectrogram image holding only the frames in range, pooled to about a row per pixel."""
+
+    def __init__(self, image: pg.ImageItem):
+        self._image = image
+        self._spec: Spectrogram | None = None
+        self._height = 1.0
+        self._levels = (0.0, 1.0)
+
+    def set_source(self, spec: Spectrogram | None, height: float = 1.0):
+        """`height`: Y extent of the image (Hz for the linear axis, bands otherwise)."""
+        self._spec, self._height = spec, height
+        if spec is not None and spec.db.size:
+            self._levels = (float(spec.db.min()), float(spec.db.max()))
+        self._image.clear()
+
+    def render(self, t0: float, t1: float, pixels: int):
+        if self._spec is None:
+            return
+        rows, x0, x1 = self._spec.window(max(t0, 0.0), t1, pixels)
+        if not len(rows):
+            self._image.clear()
+            return
+        self._image.setImage(rows, autoLevels=False, levels=self._levels)
+        self._image.resetTransform()
+        self._image.setRect(x0, 0.0, x1 - x0, self._height)
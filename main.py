@@ -13,7 +13,20 @@ from code.ui.pages.label_editor import LabelEditorPage
 from code.ui.pages.edit_hub import EditHubPage
 from code.ui.pages.csv_reports import CsvReportsPage
 from code.ui.pages.labels_picker import LabelsPickerPage
+from code.ui.pages.segment_search import SegmentSearchPage
+from code.ui.pages.sample_map import SampleMapPage
 from code.ui.styles import app_qss
+from code.core.csv_writer import get_writer
+from code.core.instrument import enable_from_env_or_args, span
+from code.core.label_index import get_label_index
+from code.core.watchdog import start_watchdog
+from code.ui.widgets.trace_overlay import TraceOverlay
+
+
+def _build(page_cls):
+    """Construct a page inside a "page.init" span (timed when tracing)."""
+    with span("page.init", page=page_cls.__name__):
+        return page_cls()
 
 
 class MainWindow(QMainWindow):
@@ -29,13 +42,15 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.stack)
 
         # --- Instantiate pages ---
-        self.page_home    = HomePage()          # Home (4 cards)
-        self.page_new     = NewSamplePage()     # Step 1: metadata (create/edit)
-        self.page_specs   = SampleTypesPage()   # Sample Types & Specs
-        self.page_labels  = LabelEditorPage()   # Step 2: attach & label
-        self.page_edit    = EditHubPage()       # Hub for editing existing samples
-        self.page_reports = CsvReportsPage()    # CSV Reports (export)
-        self.page_pick    = LabelsPickerPage()  # Picker for per-sample label CSVs
+        self.page_home    = _build(HomePage)          # Home (cards)
+        self.page_new     = _build(NewSamplePage)     # Step 1: metadata (create/edit)
+        self.page_specs   = _build(SampleTypesPage)   # Sample Types & Specs
+        self.page_labels  = _build(LabelEditorPage)   # Step 2: attach & label
+        self.page_edit    = _build(EditHubPage)       # Hub for editing existing samples
+        self.page_reports = _build(CsvReportsPage)    # CSV Reports (export)
+        self.page_pick    = _build(LabelsPickerPage)  # Picker for per-sample label CSVs
+        self.page_search  = _build(SegmentSearchPage) # Search label rows across all samples
+        self.page_map     = _build(SampleMapPage)     # Sample locations + region queries
 
         # --- Add pages to router ---
         for p in (
@@ -46,6 +61,8 @@ class MainWindow(QMainWindow):
             self.page_edit,
             self.page_reports,
             self.page_pick,
+            self.page_search,
+            self.page_map,
         ):
             self.stack.addWidget(p)
 
@@ -56,6 +73,8 @@ class MainWindow(QMainWindow):
         self.page_home.sig_sample_types.connect(lambda: self.stack.setCurrentWidget(self.page_specs))
         self.page_home.sig_edit_sample.connect(self._open_edit_hub)
         self.page_home.sig_csv_reports.connect(self._open_csv_reports)
+        self.page_home.sig_segment_search.connect(self._open_segment_search)
+        self.page_home.sig_sample_map.connect(self._open_sample_map)
 
         # Step 1 (NewSamplePage)
         self.page_new.sig_go_home.connect(lambda: self.stack.setCurrentWidget(self.page_home))
@@ -71,6 +90,7 @@ class MainWindow(QMainWindow):
         self.page_edit.sig_go_home.connect(lambda: self.stack.setCurrentWidget(self.page_home))
         self.page_edit.sig_edit_metadata.connect(self._open_edit_metadata)
         self.page_edit.sig_edit_labels.connect(self._open_edit_labels)  # opens picker
+        self.page_edit.sig_label_queue.connect(self._open_label_queue)
         # optional: add sample to metadata (jump to editor and immediately attach WAV)
         if hasattr(self.page_edit, "sig_add_sample_to_metadata"):
             self.page_edit.sig_add_sample_to_metadata.connect(self._open_labels_and_attach)
@@ -78,13 +98,30 @@ class MainWindow(QMainWindow):
         # Labels Picker
         self.page_pick.sig_go_back.connect(lambda: self.stack.setCurrentWidget(self.page_edit))
         self.page_pick.sig_open_labels.connect(self._open_labels_existing)
+        self.page_pick.sig_open_queue.connect(self._open_label_queue)
 
         # Reports
         self.page_reports.sig_go_home.connect(lambda: self.stack.setCurrentWidget(self.page_home))
 
+        # Segment search
+        self.page_search.sig_go_home.connect(lambda: self.stack.setCurrentWidget(self.page_home))
+        self.page_search.sig_open_segment.connect(self._open_labels_existing)
+
+        # Sample map
+        self.page_map.sig_go_home.connect(lambda: self.stack.setCurrentWidget(self.page_home))
+        self.page_map.sig_open_sample.connect(self._open_edit_labels)
+
         # --- Global stylesheet ---
         self.setStyleSheet(app_qss)
 
+        # Catch the label index up with CSVs changed while the app was closed
+        get_label_index().submit_reconcile()
+
+    def closeEvent(self, event):
+        """Let queued CSV writes reach the disk before the process exits."""
+        get_writer().flush(timeout=30)
+        super().closeEvent(event)
+
     # -------- Handlers --------
     def _go_step2(self, sample_id: str):
         """Prepare and navigate to label editor for the given sample_id (fresh session)."""
@@ -107,9 +144,14 @@ class MainWindow(QMainWindow):
         self.page_pick.open_for(sample_id)
         self.stack.setCurrentWidget(self.page_pick)
 
-    def _open_labels_existing(self, sample_id: str, csv_path: str):
-        """Open editor with an existing labels CSV path."""
-        self.page_labels.open_existing(sample_id, csv_path)
+    def _open_labels_existing(self, sample_id: str, csv_path: str, start_s: float | None = None):
+        """Open editor with an existing labels CSV path (optionally seeked to start_s)."""
+        self.page_labels.open_existing(sample_id, csv_path, start_s)
+        self.stack.setCurrentWidget(self.page_labels)
+
+    def _open_label_queue(self, items: list, index: int = 0):
+        """Open editor in queue mode over (sample_id, csv_path) items."""
+        self.page_labels.open_queue(items, index)
         self.stack.setCurrentWidget(self.page_labels)
 
     def _open_labels_and_attach(self, sample_id: str):
@@ -125,12 +167,31 @@ class MainWindow(QMainWindow):
             self.page_reports.open()
         self.stack.setCurrentWidget(self.page_reports)
 
+    def _open_segment_search(self):
+        """Open the segment search page and refresh its results."""
+        self.page_search.open()
+        self.stack.setCurrentWidget(self.page_search)
+
+    def _open_sample_map(self):
+        """Open the sample map (rebuilds its index if the metadata changed)."""
+        self.page_map.open()
+        self.stack.setCurrentWidget(self.page_map)
+
 
 def main():
     """Bootstraps the Qt application and shows the MainWindow."""
+    tracer = enable_from_env_or_args(sys.argv)  # --trace[=file.jsonl] or $AUDIO_LABELER_TRACE
     app = QApplication(sys.argv)
     app.setLayoutDirection(Qt.LeftToRight)
-    win = MainWindow()
+    if tracer is not None:
+        app.aboutToQuit.connect(tracer.close)
+    with span("window.init"):
+        win = MainWindow()
+    if tracer is not None:
+        TraceOverlay(tracer, win)
+    watchdog = start_watchdog()  # logs GUI freezes to data/logs/freezes.jsonl (and stalls to the trace)
+    if watchdog is not None:
+        app.aboutToQuit.connect(watchdog.stop)
     win.show()
     sys.exit(app.exec())
 